@@ -12,34 +12,91 @@ This bot implements the SPX ATM Credit Spread strategy:
 import sys
 import os
 import time
+import signal
+import logging
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, time as dt_time, timedelta
-from typing import Optional, Dict
-import pytz
+from typing import Optional, Dict, List, Tuple
+from zoneinfo import ZoneInfo
 
 # Add src to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from src.strategy.market_data import MarketDataFetcher
-from src.strategy.opening_range import OpeningRangeTracker
-from src.strategy.strike_calculator import StrikeCalculator
-from src.strategy.quote_monitor import QuoteMonitor
-from src.strategy.position_sizing import PositionSizer
-from src.strategy.pl_calculator import PLCalculator
-from src.orders.spread_order_placer import SpreadOrderPlacer
-from src.accounts.account_manager import AccountManager
-from src.tracking.trade_logger import TradeLogger
+# Strategy, order and account modules (requests, boto3, ...) are imported inside the
+# functions that use them so startup and --help stay fast.
 from src.config import Config
 from src.utils.logger import setup_logger
 
 logger = setup_logger("spx_atm_bot")
-ET = pytz.timezone('US/Eastern')
+ET = ZoneInfo('America/New_York')
 
 # Market hours
-MARKET_OPEN = dt_time(9, 30)
-MARKET_CLOSE = dt_time(16, 0)
-OR_END = dt_time(10, 0)
-ENTRY_END = dt_time(12, 0)
+MARKET_OPEN = Config.MARKET_OPEN
+MARKET_CLOSE = Config.MARKET_CLOSE
+OR_END = Config.OR_END
+ENTRY_END = Config.ENTRY_END
+
+# Longest main() waits on the EOD email before finishing the day
+EOD_EMAIL_TIMEOUT = 15
+PREWARM_LEAD = timedelta(seconds=10)  # Connection prewarm ahead of MARKET_OPEN
+
+# Step B scans completed candles of this size between OR_END and ENTRY_END
+CANDLE_STEP = timedelta(minutes=30)
+# First and longest wait (seconds) before refetching a candle that was missing or
+# still forming at its close; the wait doubles between attempts
+CANDLE_RETRY_DELAY = 2
+CANDLE_RETRY_MAX_DELAY = 30
+
+# Set by SIGTERM/SIGINT so long waits (e.g. 10:00 -> 16:00) return immediately on shutdown
+_shutdown = threading.Event()
+
+
+# One S3Service per bucket, all built from a single boto3 session
+_s3_cache: Dict[str, object] = {}
+_boto3_session = None
+_s3_lock = threading.Lock()
+
+
+def get_s3(bucket: str):
+    """
+    Get the shared S3Service for a bucket, creating it on first use.
+    
+    Args:
+        bucket: S3 bucket name
+    
+    Returns:
+        S3Service instance for the bucket
+    """
+    global _boto3_session
+    with _s3_lock:
+        s3_service = _s3_cache.get(bucket)
+        if s3_service is None:
+            import boto3
+            from src.storage.s3_service import S3Service
+            if _boto3_session is None:
+                _boto3_session = boto3.session.Session()
+            s3_service = S3Service(bucket_name=bucket, session=_boto3_session)
+            _s3_cache[bucket] = s3_service
+        return s3_service
+
+
+def get_client():
+    """
+    Get the SchwabClient shared by every strategy component.
+    
+    Returns:
+        SchwabClient instance shared by all components
+    """
+    from src.client.schwab_client import get_shared_client
+    return get_shared_client()
+
+
+def _request_shutdown(signum, frame):
+    """Signal handler: wake any pending wait so the bot can exit cleanly."""
+    logger.warning(f"Received signal {signum} - shutting down")
+    _shutdown.set()
 
 
 def wait_until_time(target_time: dt_time, description: str):
@@ -51,7 +108,7 @@ def wait_until_time(target_time: dt_time, description: str):
         description: Description for logging
     """
     now = datetime.now(ET)
-    target_dt = ET.localize(datetime.combine(now.date(), target_time))
+    target_dt = datetime.combine(now.date(), target_time, tzinfo=ET)
     
     if now >= target_dt:
         logger.info(f"{description} time has already passed")
@@ -62,10 +119,103 @@ def wait_until_time(target_time: dt_time, description: str):
     logger.info(f"  Current time: {now.strftime('%H:%M:%S %Z')}")
     logger.info(f"  Waiting {wait_seconds:.0f} seconds ({wait_seconds/60:.1f} minutes)")
     
-    time.sleep(wait_seconds)
+    if _shutdown.wait(wait_seconds):
+        logger.warning(f"Shutdown requested while waiting for {description} - exiting")
+        sys.exit(0)
     logger.info(f"✅ {description} time reached: {datetime.now(ET).strftime('%H:%M:%S %Z')}")
 
 
+def get_scan_windows(date: datetime) -> List[Tuple[datetime, datetime]]:
+    """
+    Get the 30-minute candle windows Step B scans, from OR_END to ENTRY_END.
+    
+    Args:
+        date: Trading date
+    
+    Returns:
+        List of (window_start, window_end) ET datetimes, in order
+    """
+    start = datetime.combine(date.date(), OR_END, tzinfo=ET)
+    end = datetime.combine(date.date(), ENTRY_END, tzinfo=ET)
+    return [
+        (start + i * CANDLE_STEP, start + (i + 1) * CANDLE_STEP)
+        for i in range((end - start) // CANDLE_STEP)
+    ]
+
+
+def get_completed_candle(market_data, date: datetime, window_start_ts: int,
+                         candles_by_start: Dict[int, Dict],
+                         retry_until: Optional[float] = None) -> Optional[Dict]:
+    """
+    Get the completed 30-minute candle starting at window_start_ts.
+    
+    Completed bars never change, so the whole OR_END..ENTRY_END range is fetched
+    in one call and the completed bars are kept in candles_by_start. The API only
+    needs to be asked again for a bar that had not closed at the last fetch; a
+    bar still forming is never cached.
+    
+    A bar that is missing or still forming (the API has not published it yet, or
+    the wait woke just before the close) is fetched again with a growing delay
+    until retry_until, so its window is not skipped.
+    
+    Args:
+        market_data: MarketDataFetcher used for the fetch
+        date: Trading date
+        window_start_ts: Candle start timestamp (ms), as in the candle's 'datetime'
+        candles_by_start: Completed candles seen so far, keyed by start timestamp
+        retry_until: Epoch seconds after which to stop retrying (e.g. the next
+                     window's close). If None, fetches once.
+    
+    Returns:
+        The candle, or None if the API did not return it as completed in time
+    """
+    step_ms = int(CANDLE_STEP.total_seconds() * 1000)
+    delay = CANDLE_RETRY_DELAY
+    while window_start_ts not in candles_by_start:
+        fetched_at_ms = int(time.time() * 1000)
+        candles = market_data.get_30min_candles(
+            date,
+            start_hour=OR_END.hour,
+            start_minute=OR_END.minute,
+            end_hour=ENTRY_END.hour,
+            end_minute=ENTRY_END.minute
+        )
+        candles_by_start.update(
+            (c.get('datetime', 0), c) for c in candles
+            if c.get('datetime', 0) + step_ms <= fetched_at_ms
+        )
+        if window_start_ts in candles_by_start:
+            break
+        if retry_until is None or time.time() + delay > retry_until:
+            return None
+        logger.info("Candle not completed yet, fetching again in %ds", delay)
+        if _shutdown.wait(delay):
+            return None
+        delay = min(delay * 2, CANDLE_RETRY_MAX_DELAY)
+    return candles_by_start[window_start_ts]
+
+
+def next_poll_interval(c_net: float) -> float:
+    """
+    Get how long to wait before the next quote check.
+    
+    Polls less often while C_net is far below MIN_NET_CREDIT and faster once it
+    gets close, so quiet markets cost fewer API calls without reacting later.
+    
+    Args:
+        c_net: Latest net credit
+    
+    Returns:
+        Seconds to wait before the next check
+    """
+    gap = Config.MIN_NET_CREDIT - c_net
+    if gap > 1.0:
+        return min(30, Config.QUOTE_MONITOR_INTERVAL * 3)
+    if gap > 0.2:
+        return Config.QUOTE_MONITOR_INTERVAL
+    return 2
+
+
 def monitor_quotes_and_place_order(
     date: datetime,
     spx_entry: float,
@@ -78,7 +228,9 @@ def monitor_quotes_and_place_order(
     trigger_time: datetime
 ) -> Optional[Dict]:
     """
-    Monitor quotes every 10 seconds until 12:00 ET and place order when credit threshold is met.
+    Monitor quotes until 12:00 ET and place order when credit threshold is met.
+    
+    The poll interval adapts to how far C_net is from the threshold (see next_poll_interval).
     
     Args:
         date: Trading date
@@ -94,24 +246,30 @@ def monitor_quotes_and_place_order(
     Returns:
         Order details if placed, None otherwise
     """
-    quote_monitor = QuoteMonitor()
+    from src.strategy.quote_monitor import QuoteMonitor
+    from src.strategy.position_sizing import PositionSizer
+    from src.orders.spread_order_placer import SpreadOrderPlacer
+    from src.tracking.trade_logger import TradeLogger
+    
+    quote_monitor = QuoteMonitor(client=get_client())
     position_sizer = PositionSizer()
-    order_placer = SpreadOrderPlacer()
+    order_placer = SpreadOrderPlacer(client=get_client())
     
     # Initialize trade logger with S3 support
     trade_logger = TradeLogger()
     try:
-        from src.storage.s3_service import S3Service
         s3_bucket = os.getenv('AWS_S3_BUCKET_NAME')
         if s3_bucket:
-            s3_service = S3Service(bucket_name=s3_bucket)
+            s3_service = get_s3(s3_bucket)
             trade_logger.s3_service = s3_service
             # Load existing trades from S3 at start
             trade_logger.load_from_s3()
     except Exception as e:
         logger.debug(f"S3 not available for trade logger: {e}")
     
-    entry_end_dt = ET.localize(datetime.combine(date.date(), ENTRY_END))
+    entry_end_dt = datetime.combine(date.date(), ENTRY_END, tzinfo=ET)
+    # Compare against a monotonic deadline in the polling loop instead of tz-aware now()
+    deadline_mono = time.monotonic() + (entry_end_dt - datetime.now(ET)).total_seconds()
     
     logger.info("")
     logger.info("=" * 70)
@@ -123,24 +281,24 @@ def monitor_quotes_and_place_order(
     logger.info(f"Monitoring until {ENTRY_END.strftime('%H:%M')} ET")
     logger.info("")
     
-    while datetime.now(ET) < entry_end_dt:
+    # Strikes are fixed for the session, so build the leg symbols once
+    short_symbol, long_symbol = quote_monitor.build_symbols(date, k_short, k_long, option_type)
+    
+    while time.monotonic() < deadline_mono:
         # Get spread credit
-        credit_data = quote_monitor.get_spread_credit(
-            date=date,
-            k_short=k_short,
-            k_long=k_long,
-            option_type=option_type
-        )
+        credit_data = quote_monitor.get_spread_credit_by_symbol(short_symbol, long_symbol)
         
         if not credit_data:
             logger.warning("Could not get credit data, retrying in 10 seconds...")
-            time.sleep(Config.QUOTE_MONITOR_INTERVAL)
+            if _shutdown.wait(Config.QUOTE_MONITOR_INTERVAL):
+                sys.exit(0)
             continue
         
         c_gross = credit_data['C_gross']
         c_net = credit_data['C_net']
         
-        logger.info(f"[{datetime.now(ET).strftime('%H:%M:%S')}] C_gross=${c_gross:.2f}, C_net=${c_net:.2f}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[%s] C_gross=$%.2f, C_net=$%.2f", datetime.now(ET).strftime('%H:%M:%S'), c_gross, c_net)
         
         # Check if credit threshold is met
         if quote_monitor.meets_credit_threshold(credit_data):
@@ -222,15 +380,9 @@ def monitor_quotes_and_place_order(
                 
                 # NOTE: No trade alert email sent (user doesn't want immediate alerts)
                 
+                # Saved to S3 once when main() exits
                 trade_logger.log_trade(trade_data)
                 
-                # Save to S3 after trade is logged
-                if trade_logger.s3_service:
-                    try:
-                        trade_logger.save_to_s3()
-                    except Exception as e:
-                        logger.warning(f"Failed to save trades CSV to S3: {e}")
-                
                 return {
                     'order_id': order_id,
                     'order_status': order_status,
@@ -243,8 +395,10 @@ def monitor_quotes_and_place_order(
                 logger.debug(traceback.format_exc())
                 return None
         
-        # Wait before next check
-        time.sleep(Config.QUOTE_MONITOR_INTERVAL)
+        # Wait before next check (longer while C_net is far from the threshold)
+        if _shutdown.wait(next_poll_interval(c_net)):
+            logger.warning("Shutdown requested during quote monitoring - exiting")
+            sys.exit(0)
     
     logger.warning(f"⚠️  Entry window closed ({ENTRY_END.strftime('%H:%M')} ET) - No trade placed")
     return None
@@ -262,11 +416,6 @@ def step_a_bullish_or(date: datetime, or_data: Dict, account_equity: float) -> O
     Returns:
         Order details if placed, None otherwise
     """
-    logger.info("")
-    logger.info("=" * 70)
-    logger.info("STEP A: BULLISH OR SETUP")
-    logger.info("=" * 70)
-    
     # Check if bullish (ORC > ORO)
     orc = or_data.get('ORC', 0)
     oro = or_data.get('ORO', 0)
@@ -275,6 +424,11 @@ def step_a_bullish_or(date: datetime, or_data: Dict, account_equity: float) -> O
         logger.info(f"ORC (${orc:.2f}) <= ORO (${oro:.2f}) - Not bullish, skipping Step A")
         return None
     
+    logger.info("")
+    logger.info("=" * 70)
+    logger.info("STEP A: BULLISH OR SETUP")
+    logger.info("=" * 70)
+    
     logger.info(f"✅ Bullish OR detected: ORC (${orc:.2f}) > ORO (${oro:.2f})")
     
     # Set SPX_entry = ORC (10:00 close)
@@ -283,6 +437,8 @@ def step_a_bullish_or(date: datetime, or_data: Dict, account_equity: float) -> O
     
     logger.info(f"SPX_entry = ORC = ${spx_entry:.2f}")
     
+    from src.strategy.strike_calculator import StrikeCalculator
+    
     # Compute strikes ONCE for PUT spread
     k_short, k_long = StrikeCalculator.calculate_put_spread_strikes(spx_entry)
     
@@ -320,11 +476,6 @@ def step_b_bearish_orl_breakout(date: datetime, or_data: Dict, account_equity: f
     Returns:
         Order details if placed, None otherwise
     """
-    logger.info("")
-    logger.info("=" * 70)
-    logger.info("STEP B: BEARISH ORL BREAKOUT SETUP")
-    logger.info("=" * 70)
-    
     # Precondition: bearishOR = (ORC < ORO)
     orc = or_data.get('ORC', 0)
     oro = or_data.get('ORO', 0)
@@ -333,63 +484,51 @@ def step_b_bearish_orl_breakout(date: datetime, or_data: Dict, account_equity: f
         logger.info(f"ORC (${orc:.2f}) >= ORO (${oro:.2f}) - Not bearish, skipping Step B")
         return None
     
+    logger.info("")
+    logger.info("=" * 70)
+    logger.info("STEP B: BEARISH ORL BREAKOUT SETUP")
+    logger.info("=" * 70)
+    
     logger.info(f"✅ Bearish OR detected: ORC (${orc:.2f}) < ORO (${oro:.2f})")
     
     orl = or_data.get('ORL', 0)
     logger.info(f"Scanning for breakout: bar_close < ORL (${orl:.2f})")
-    logger.info("Will check completed candles at: 10:30, 11:00, 11:30, 12:00")
     
-    market_data = MarketDataFetcher()
+    from src.strategy.market_data import MarketDataFetcher
+    from src.strategy.strike_calculator import StrikeCalculator
     
-    # Define the candle windows to check (each closes 30 minutes after start)
-    candle_windows = [
-        (10, 0, 10, 30),  # 10:00-10:30, check at 10:30
-        (10, 30, 11, 0),  # 10:30-11:00, check at 11:00
-        (11, 0, 11, 30),  # 11:00-11:30, check at 11:30
-        (11, 30, 12, 0),  # 11:30-12:00, check at 12:00
-    ]
+    market_data = MarketDataFetcher(client=get_client())
+    
+    windows = get_scan_windows(date)
+    logger.info("Will check completed candles at: %s", ", ".join(f"{w_end:%H:%M}" for _, w_end in windows))
+    
+    # Candles fetched so far, keyed by their start timestamp (ms)
+    candles_by_start: Dict[int, Dict] = {}
     
     # Check each candle window as it completes
-    for start_hour, start_min, end_hour, end_min in candle_windows:
-        check_time = dt_time(end_hour, end_min)
+    for w_start, w_end in windows:
+        label = f"{w_start:%H:%M}-{w_end:%H:%M}"
         
         # Wait until the candle closes
-        wait_until_time(check_time, f"Candle close ({start_hour:02d}:{start_min:02d}-{end_hour:02d}:{end_min:02d})")
-        
-        # Get the completed candle
-        candles = market_data.get_30min_candles(
-            date,
-            start_hour=start_hour,
-            start_minute=start_min,
-            end_hour=end_hour,
-            end_minute=end_min
-        )
-        
-        if not candles:
-            logger.warning(f"No candle found for {start_hour:02d}:{start_min:02d}-{end_hour:02d}:{end_min:02d} window")
-            continue
+        remaining = w_end.timestamp() - time.time()
+        if remaining > 0:
+            logger.info("Waiting %.0fs for %s candle close", remaining, label)
+            if _shutdown.wait(remaining):
+                logger.warning("Shutdown requested during Step B scan - exiting")
+                sys.exit(0)
         
-        # Find the candle that matches the requested time window
         # The candle's 'datetime' field is the start timestamp of that candle
-        window_start = date.replace(hour=start_hour, minute=start_min, second=0, microsecond=0)
-        if window_start.tzinfo is None:
-            window_start = ET.localize(window_start)
-        window_start_ts = int(window_start.timestamp() * 1000)
-        
-        # Find candle where datetime matches our target window start
-        candle = None
-        for c in candles:
-            candle_dt = c.get('datetime', 0)
-            if candle_dt == window_start_ts:
-                candle = c
-                break
+        window_start_ts = int(w_start.timestamp() * 1000)
         
+        # Keep trying for a late candle until the next window closes
+        candle = get_completed_candle(market_data, date, window_start_ts, candles_by_start,
+                                      retry_until=(w_end + CANDLE_STEP).timestamp())
         if not candle:
-            logger.warning(f"Could not find candle matching {start_hour:02d}:{start_min:02d}-{end_hour:02d}:{end_min:02d} window")
+            logger.warning("No candle found for %s window", label)
             continue
         
         bar_close = candle.get('close', 0)
-        logger.info(f"Checking {start_hour:02d}:{start_min:02d}-{end_hour:02d}:{end_min:02d} candle: bar_close=${bar_close:.2f}, ORL=${orl:.2f}")
+        logger.info("Checking %s candle: bar_close=$%.2f, ORL=$%.2f", label, bar_close, orl)
         
         # Check for breakout
         if bar_close < orl:
@@ -426,13 +565,14 @@ def step_b_bearish_orl_breakout(date: datetime, or_data: Dict, account_equity: f
     return None
 
 
-def calculate_eod_pl(date: datetime, trade_data: Dict) -> Dict:
+def calculate_eod_pl(date: datetime, trade_data: Dict, account_mgr) -> Dict:
     """
     Calculate P/L at expiration (16:00).
     
     Args:
         date: Trading date
         trade_data: Trade data dictionary
+        account_mgr: AccountManager created at market open (reused for fills and equity)
     
     Returns:
         Updated trade data with P/L information
@@ -442,8 +582,12 @@ def calculate_eod_pl(date: datetime, trade_data: Dict) -> Dict:
     logger.info("CALCULATING EOD P/L")
     logger.info("=" * 70)
     
+    from src.strategy.market_data import MarketDataFetcher
+    from src.strategy.pl_calculator import PLCalculator
+    from src.tracking.trade_logger import TradeLogger
+    
     # Get SPX close price
-    market_data = MarketDataFetcher()
+    market_data = MarketDataFetcher(client=get_client())
     spx_close = market_data.get_spx_close_price(date)
     
     if not spx_close:
@@ -469,8 +613,6 @@ def calculate_eod_pl(date: datetime, trade_data: Dict) -> Dict:
             logger.info("Attempting to get actual fill credit from broker...")
             logger.info(f"Order ID: {order_id}")
             
-            account_mgr = AccountManager()
-            
             # Get filled orders from today
             filled_orders = account_mgr.get_orders_executed_today(
                 status='FILLED',
@@ -536,10 +678,12 @@ def calculate_eod_pl(date: datetime, trade_data: Dict) -> Dict:
         )
     
     # Get account equity after
-    account_mgr = AccountManager()
+    # Optional: any failure, including an expired refresh token raised as a plain
+    # Exception by SchwabAuth, must not stop the P/L row from being written
     try:
         equity_after = account_mgr.get_net_liquidity()
-    except:
+    except Exception as e:
+        logger.warning("equity_after unavailable: %s", e)
         equity_after = None
     
     # Update trade data
@@ -550,23 +694,73 @@ def calculate_eod_pl(date: datetime, trade_data: Dict) -> Dict:
     if equity_after:
         trade_data['equity_after'] = equity_after
     
-    # Log updated trade
+    # Update the row logged at entry (saved to S3 once when main() exits)
     trade_logger = TradeLogger()
-    # Note: This will append a new row. In production, you might want to update the existing row.
-    trade_logger.log_trade(trade_data)
+    trade_logger.update_trade(trade_data.get('order_id', ''), trade_data)
+    
+    return trade_data
+
+
+def _save_trades_to_s3():
+    """Upload the local trades CSV to S3 (if configured)."""
+    from src.tracking.trade_logger import TradeLogger
     
-    # Save to S3 at end of day
     try:
-        from src.storage.s3_service import S3Service
         s3_bucket = os.getenv('AWS_S3_BUCKET_NAME')
         if s3_bucket:
-            s3_service = S3Service(bucket_name=s3_bucket)
-            trade_logger.s3_service = s3_service
+            trade_logger = TradeLogger()
+            trade_logger.s3_service = get_s3(s3_bucket)
             trade_logger.save_to_s3()
     except Exception as e:
         logger.warning(f"Failed to save trades CSV to S3: {e}")
+
+
+# Files pulled from S3 at startup: (bucket env var, key env var, default S3 key, local path).
+# .env lives in the config bucket (spx-atm-credit-spread-bot-config); tokens.json MUST
+# come from the dedicated token bucket (my-tokens), never the config bucket.
+S3_BOOTSTRAP_DOWNLOADS = [
+    ('AWS_S3_CONFIG_BUCKET_NAME', 'AWS_S3_ENV_KEY', '.env', '.env'),
+    ('AWS_S3_TOKEN_BUCKET_NAME', 'AWS_S3_TOKEN_KEY', 'tokens.json', Config.TOKEN_FILE),
+]
+
+
+def _download_from_s3(bucket_env: str, key_env: str, default_key: str, local_path: str) -> bool:
+    """
+    Download a bootstrap file from S3 (if its bucket is configured).
     
-    return trade_data
+    Uses IAM role on EC2 (no credentials needed - EC2 IAM role provides access).
+    Any failure falls back to the local file if it exists.
+    
+    Args:
+        bucket_env: Environment variable holding the bucket name
+        key_env: Environment variable holding the S3 key
+        default_key: S3 key to use when key_env is not set
+        local_path: Local path to write the file to
+    
+    Returns:
+        True if the file was downloaded, False otherwise
+    """
+    bucket = os.getenv(bucket_env)
+    if not bucket:
+        logger.info(f"S3 bucket for {default_key} not configured ({bucket_env} not set), using local {local_path} if exists")
+        return False
+    
+    s3_key = os.getenv(key_env, default_key)
+    try:
+        logger.info(f"Checking for {default_key} in S3 bucket: {bucket}")
+        s3_service = get_s3(bucket)
+        if not s3_service.file_exists(s3_key):
+            logger.info(f"{default_key} not found in S3 (s3://{bucket}/{s3_key}), using local {local_path} if exists")
+            return False
+        
+        logger.info(f"Downloading {default_key} from S3: s3://{bucket}/{s3_key}")
+        if s3_service.download_file(s3_key, local_path):
+            logger.info(f"✅ Successfully downloaded {default_key} from S3")
+            return True
+        logger.warning(f"⚠️  Failed to download {default_key} from {bucket}, using local {local_path} if exists")
+    except Exception as e:
+        logger.warning(f"⚠️  Error downloading {default_key} from S3 (using local {local_path} if exists): {e}")
+    return False
 
 
 def main():
@@ -575,83 +769,35 @@ def main():
     parser.add_argument('--dry-run', action='store_true', help='Dry run mode (do not place orders)')
     args = parser.parse_args()
     
-    # FIRST THING: Download .env file from S3 (if configured)
-    # This must happen before loading environment variables
-    # Uses IAM role on EC2 (configured via IAM role attached to EC2 instance)
-    # .env is stored in: spx-atm-credit-spread-bot-config bucket
-    env_file_path = '.env'
-    env_downloaded = False
+    # Allow SIGTERM (EC2 shutdown) and SIGINT to interrupt long waits
+    signal.signal(signal.SIGTERM, _request_shutdown)
+    signal.signal(signal.SIGINT, _request_shutdown)
     
-    try:
-        from src.storage.s3_service import S3Service
-        
-        # Get bucket name from system environment variable (set on EC2)
-        # Must be set to: spx-atm-credit-spread-bot-config
-        config_bucket = os.environ.get('AWS_S3_CONFIG_BUCKET_NAME')
-        env_s3_key = os.environ.get('AWS_S3_ENV_KEY', '.env')
-        
-        if config_bucket:
-            try:
-                logger.info(f"Checking for .env in S3 bucket: {config_bucket}")
-                # Use IAM role (no credentials needed - EC2 IAM role provides access)
-                s3_service = S3Service(bucket_name=config_bucket)
-                if s3_service.test_connection():
-                    if s3_service.file_exists(env_s3_key):
-                        logger.info(f"Downloading .env from S3: s3://{config_bucket}/{env_s3_key}")
-                        if s3_service.download_file(env_s3_key, env_file_path):
-                            logger.info("✅ Successfully downloaded .env from S3")
-                            env_downloaded = True
-                        else:
-                            logger.warning(f"⚠️  Failed to download .env from {config_bucket}, using local if exists")
-                    else:
-                        logger.info(f".env not found in S3 (s3://{config_bucket}/{env_s3_key}), using local if exists")
-                else:
-                    logger.warning(f"⚠️  Could not connect to {config_bucket}, using local .env if exists")
-            except Exception as e:
-                logger.warning(f"Error downloading .env from S3: {e}, using local if exists")
-        else:
-            logger.info("S3 config bucket not configured (AWS_S3_CONFIG_BUCKET_NAME not set), using local .env if exists")
-    except Exception as e:
-        logger.debug(f"S3 not available for .env download (using local if exists): {e}")
+    # FIRST THING: Download .env and tokens.json from S3 (if configured)
+    # Both must happen before loading environment variables / authenticating.
+    # Downloads whose bucket is already known from the system environment run
+    # concurrently; a bucket name that only comes from .env is retried after
+    # .env has been loaded.
+    from dotenv import load_dotenv
+    
+    deferred = []
+    with ThreadPoolExecutor(max_workers=len(S3_BOOTSTRAP_DOWNLOADS)) as executor:
+        futures = []
+        for download in S3_BOOTSTRAP_DOWNLOADS:
+            bucket_env, _, _, local_path = download
+            # .env cannot name its own bucket, so it is never deferred
+            if local_path == '.env' or os.getenv(bucket_env):
+                futures.append(executor.submit(_download_from_s3, *download))
+            else:
+                deferred.append(download)
+        for future in futures:
+            future.result()
     
     # Now load environment variables from .env file (local or downloaded)
-    from dotenv import load_dotenv
     load_dotenv()
     
-    # SECOND: Download tokens.json from S3 (if configured)
-    # This must happen before any authentication attempts
-    # Uses IAM role on EC2 (configured via IAM role attached to EC2 instance)
-    # tokens.json is stored in: my-tokens bucket (separate from .env bucket)
-    try:
-        from src.storage.s3_service import S3Service
-        
-        # tokens.json MUST come from the dedicated token bucket (my-tokens)
-        # Do NOT fall back to config bucket - tokens.json is in a separate bucket
-        token_bucket_name = os.getenv('AWS_S3_TOKEN_BUCKET_NAME')
-        if token_bucket_name:
-            logger.info(f"Checking for tokens.json in S3 bucket: {token_bucket_name}")
-            try:
-                # Use IAM role (no credentials needed - EC2 IAM role provides access)
-                s3_service = S3Service(bucket_name=token_bucket_name)
-                if s3_service.test_connection():
-                    token_s3_key = os.getenv('AWS_S3_TOKEN_KEY', 'tokens.json')
-                    token_file_path = Config.TOKEN_FILE
-                    if s3_service.file_exists(token_s3_key):
-                        logger.info(f"Downloading tokens.json from S3: s3://{token_bucket_name}/{token_s3_key}")
-                        if s3_service.download_file(token_s3_key, token_file_path):
-                            logger.info("✅ Successfully downloaded tokens.json from S3")
-                        else:
-                            logger.warning("⚠️  Failed to download tokens.json from S3, using local file if exists")
-                    else:
-                        logger.info(f"tokens.json not found in S3 (s3://{token_bucket_name}/{token_s3_key}), using local file if exists")
-                else:
-                    logger.warning(f"⚠️  S3 connection to {token_bucket_name} failed, using local tokens.json if exists")
-            except Exception as e:
-                logger.warning(f"⚠️  S3 token download failed (using local if exists): {e}")
-        else:
-            logger.info("S3 token bucket not configured (set AWS_S3_TOKEN_BUCKET_NAME to 'my-tokens'), using local tokens.json if exists")
-    except Exception as e:
-        logger.debug(f"S3 not available for token download (using local if exists): {e}")
+    for download in deferred:
+        _download_from_s3(*download)
     
     # Override config if --dry-run flag is provided
     if args.dry_run:
@@ -680,14 +826,29 @@ def main():
     
     # Get today's date
     today = datetime.now(ET)
-    today_dt = ET.localize(datetime.combine(today.date(), dt_time(9, 30)))
+    today_dt = datetime.combine(today.date(), MARKET_OPEN, tzinfo=ET)
     
     logger.info(f"Trading Date: {today_dt.strftime('%Y-%m-%d')}")
     logger.info("")
     
+    from src.strategy.opening_range import OpeningRangeTracker
+    from src.accounts.account_manager import AccountManager
+    
+    # Open the API connection just before the open so the market-open requests
+    # reuse it instead of each paying for a TLS handshake
+    prewarm_at = (datetime.combine(today.date(), MARKET_OPEN) - PREWARM_LEAD).time()
+    wait_until_time(prewarm_at, "Connection prewarm")
+    get_client().prewarm()
+    
     # Wait until market open
     wait_until_time(MARKET_OPEN, "Market Open")
     
+    # Account equity doesn't depend on the OR, so fetch it in the background during
+    # the 09:30 -> 10:00 wait and keep it off the critical path to Step A
+    executor = ThreadPoolExecutor(max_workers=2)
+    account_mgr = AccountManager(client=get_client())
+    equity_future = executor.submit(account_mgr.get_net_liquidity)
+    
     # Wait until 10:00 (when the Opening Range candle closes)
     wait_until_time(OR_END, "OR End (10:00)")
     
@@ -697,17 +858,23 @@ def main():
     logger.info("GETTING OPENING RANGE (09:30-10:00)")
     logger.info("=" * 70)
     
-    or_tracker = OpeningRangeTracker()
-    or_data = or_tracker.get_opening_range(today_dt)
+    or_tracker = OpeningRangeTracker(client=get_client())
+    or_future = executor.submit(or_tracker.get_opening_range, today_dt)
+    executor.shutdown(wait=False)
+    
+    try:
+        or_data = or_future.result()
+    except Exception as e:
+        logger.error(f"❌ Error getting Opening Range: {e}")
+        or_data = None
     
     if not or_data:
         logger.error("❌ Could not get Opening Range - Exiting")
         sys.exit(1)
     
     # Get account equity for position sizing
-    account_mgr = AccountManager()
     try:
-        account_equity = account_mgr.get_net_liquidity()
+        account_equity = equity_future.result()
         logger.info(f"Account Equity: ${account_equity:,.2f}")
     except Exception as e:
         logger.error(f"❌ Could not get account equity: {e}")
@@ -741,16 +908,22 @@ def main():
         logger.info("Neither Step A nor Step B resulted in a trade.")
         sys.exit(0)
     
-    # Wait until market close for P/L calculation
-    logger.info("")
-    logger.info("Waiting until market close (16:00 ET) for P/L calculation...")
-    wait_until_time(MARKET_CLOSE, "Market Close")
-    
-    # Calculate EOD P/L
     trade_data = order_result.get('trade_data', {})
-    if trade_data:
-        calculate_eod_pl(today_dt, trade_data)
+    
+    # The trades CSV is uploaded to S3 exactly once, even if shutdown interrupts the wait
+    try:
+        # Wait until market close for P/L calculation
+        logger.info("")
+        logger.info("Waiting until market close (16:00 ET) for P/L calculation...")
+        wait_until_time(MARKET_CLOSE, "Market Close")
         
+        # Calculate EOD P/L
+        if trade_data:
+            calculate_eod_pl(today_dt, trade_data, account_mgr)
+    finally:
+        _save_trades_to_s3()
+    
+    if trade_data:
         # Generate and send EOD report
         logger.info("")
         logger.info("=" * 70)
@@ -785,11 +958,29 @@ def main():
             if recipient_email:
                 logger.info("")
                 logger.info("Sending EOD report via email...")
-                email_sent = eod_report.send_eod_email(report_path, recipient_email=recipient_email)
-                if email_sent:
-                    logger.info("✅ EOD email sent successfully!")
+                # Bound how long a slow SMTP server can hold up shutdown: a daemon
+                # thread is abandoned at exit, unlike executor workers which are joined
+                email_result = {}
+                
+                def send_email():
+                    try:
+                        email_result['sent'] = eod_report.send_eod_email(
+                            report_path, recipient_email=recipient_email, smtp_timeout=EOD_EMAIL_TIMEOUT
+                        )
+                    except Exception as e:
+                        logger.error(f"❌ EOD email failed: {e}")
+                        email_result['sent'] = False
+                
+                email_thread = threading.Thread(target=send_email, daemon=True)
+                email_thread.start()
+                email_thread.join(EOD_EMAIL_TIMEOUT)
+                if email_thread.is_alive():
+                    logger.warning(f"⚠️  EOD email not sent after {EOD_EMAIL_TIMEOUT}s - continuing shutdown. Report saved to file.")
                 else:
-                    logger.warning("⚠️  EOD email sending failed. Report saved to file.")
+                    if email_result['sent']:
+                        logger.info("✅ EOD email sent successfully!")
+                    else:
+                        logger.warning("⚠️  EOD email sending failed. Report saved to file.")
             else:
                 logger.info("")
                 logger.info("Email recipient not configured (EMAIL_RECIPIENT not set in .env)")
@@ -1,40 +1,272 @@
 """Account management for Schwab API."""
+import itertools
+import json
 import logging
-from datetime import datetime, timezone
-from typing import Dict, List, Optional
-from src.client.schwab_client import SchwabClient
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+import requests
+from src.client.schwab_client import SchwabClient, get_shared_client
+from src.config import Config
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Order statuses accepted by the Schwab orders endpoint's `status` filter
+ORDER_STATUSES = frozenset({
+    'AWAITING_PARENT_ORDER', 'AWAITING_CONDITION', 'AWAITING_STOP_CONDITION',
+    'AWAITING_MANUAL_REVIEW', 'ACCEPTED', 'AWAITING_UR_OUT', 'PENDING_ACTIVATION',
+    'QUEUED', 'WORKING', 'REJECTED', 'PENDING_CANCEL', 'CANCELED', 'PENDING_REPLACE',
+    'REPLACED', 'FILLED', 'EXPIRED', 'NEW', 'AWAITING_RELEASE_TIME',
+    'PENDING_ACKNOWLEDGEMENT', 'PENDING_RECALL', 'UNKNOWN',
+})
+
+# Option buying power balance fields, most specific first, with the debug note for each
+# (buyingPower is the fallback when none is present)
+_OBP_PRIORITY = (
+    ('optionBuyingPower', "Found optionBuyingPower field in account balances"),
+    ('option_buying_power', "Found option_buying_power field in account balances"),
+    ('optionBuyingPowerAvailable', "Found optionBuyingPowerAvailable field in account balances"),
+    ('buyingPowerNonMarginableTrade', "Using buyingPowerNonMarginableTrade for option buying power"),
+)
+
 
 class AccountManager:
     """Manages account operations and order retrieval."""
     
-    def __init__(self):
-        """Initialize the account manager."""
-        self.client = SchwabClient()
+    # (UTC date, fromEnteredTime, toEnteredTime) for get_orders_executed_today(),
+    # shared by every instance since the bounds only depend on the date
+    _today_bounds: Optional[Tuple[date, str, str]] = None
+    
+    def __init__(self, client: Optional[SchwabClient] = None):
+        """
+        Initialize the account manager.
+        
+        Args:
+            client: Shared SchwabClient. If None, uses get_shared_client().
+        """
+        self.client = client or get_shared_client()
         self._account_cache: Optional[List[Dict]] = None
+        # Account numbers/hashes are static for a session, so refetch at most hourly
+        self._account_cache_ts: float = 0.0
+        self._account_cache_ttl = 3600
+        # accountNumber -> hashValue, rebuilt whenever the account list is fetched
+        self._hash_by_number: Dict[str, str] = {}
+        self._default_hash: Optional[str] = None
+        # True while the account list came from Config.ACCOUNTS_CACHE_FILE rather than the API
+        self._accounts_from_disk = False
+        # Account numbers already found not to exist; cleared by invalidate_accounts_cache()
+        self._missing_accounts: Set[str] = set()
+        # Balances move with the market, so only reuse them briefly (e.g. net liquidity
+        # and option buying power read back-to-back)
+        self._balances_cache: Dict[str, Tuple[float, Dict]] = {}
+        self._balances_ttl = 3.0
+        # Stale-while-revalidate cache for get_account_metrics(): values younger than
+        # the fresh TTL are returned as-is, values younger than the stale TTL are
+        # returned while a background refresh runs, older values block on a refresh
+        self._metrics_cache: Dict[str, Tuple[float, Dict[str, float]]] = {}
+        self._metrics_fresh_ttl = 2.0
+        self._metrics_stale_ttl = 30.0
+        self._metrics_refreshing: Set[str] = set()
+        self._metrics_lock = threading.Lock()
+        # Bumped by invalidate_balances(); a balances or metrics read started under an
+        # older generation (e.g. before an order was placed) is not cached or shared
+        self._balances_generation = 0
+        self._generation_lock = threading.Lock()
+        # Requests currently on the wire, so identical concurrent calls share one response
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        self._load_accounts_from_disk()
     
-    def get_account_numbers(self) -> List[Dict]:
+    def _dedup_request(self, key: tuple, fn: Callable[[], Any]) -> Any:
         """
-        Get list of account numbers and their corresponding encrypted hash values.
+        Run fn() unless an identical request is already in flight, in which case wait for it.
+        
+        Args:
+            key: Identifies the request, e.g. (method, endpoint, sorted params)
+            fn: Performs the request
         
         Returns:
-            list: List of dictionaries with 'accountNumber' and 'hashValue' keys
-                  Example: [{'accountNumber': '12345678', 'hashValue': 'ABC123...'}]
+            The result of fn(), shared by every caller that asked concurrently
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not is_owner:
+            return future.result()
+        
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    def _get(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        """
+        GET an endpoint, sharing the response with identical concurrent calls.
+        
+        Args:
+            endpoint: API endpoint
+            params: URL parameters
+        
+        Returns:
+            Response JSON data
+        """
+        try:
+            return self._get_shared(endpoint, params)
+        except requests.HTTPError as e:
+            # A 404 for a hash from the disk cache means the cache is stale. A 401 says
+            # nothing about the hash: the client has already refreshed and retried.
+            if not self._accounts_from_disk or getattr(e.response, 'status_code', None) != 404:
+                raise
+            stale = [(h, n) for n, h in self._hash_by_number.items() if h and f'/{h}/' in f'{endpoint}/']
+            self._discard_disk_accounts()
+            if not stale:
+                raise
+            old_hash, account_number = stale[0]
+            new_hash = self.get_account_hash(account_number)
+            if new_hash == old_hash:
+                raise
+            logger.info("Retrying request with the refreshed account hash")
+            return self._get_shared(endpoint.replace(f'/{old_hash}', f'/{new_hash}', 1), params)
+    
+    def _get_shared(self, endpoint: str, params: Optional[Dict]) -> Any:
+        """
+        GET through _dedup_request so identical in-flight calls share one request.
+        
+        A call started before invalidate_balances() is not shared with calls made after it.
+        """
+        key = ('GET', endpoint, tuple(sorted(params.items())) if params else (), self._balances_generation)
+        return self._dedup_request(key, lambda: self.client._make_request('GET', endpoint, params=params))
+    
+    def _set_accounts(self, accounts: List[Dict]) -> None:
+        """Store the account list and rebuild the hash lookup from it."""
+        self._account_cache = accounts
+        self._account_cache_ts = time.monotonic()
+        self._hash_by_number = {a.get('accountNumber'): a.get('hashValue') for a in accounts}
+        self._default_hash = accounts[0].get('hashValue') if accounts else None
+    
+    def _load_accounts_from_disk(self) -> None:
+        """Seed the account cache from Config.ACCOUNTS_CACHE_FILE if it is recent enough."""
+        path = Config.ACCOUNTS_CACHE_FILE
+        if not path or not os.path.exists(path):
+            return
+        try:
+            with open(path, 'r') as f:
+                cached = json.load(f)
+            if time.time() - cached['ts'] > Config.ACCOUNTS_CACHE_MAX_AGE:
+                return
+            self._set_accounts(cached['accounts'])
+            self._accounts_from_disk = True
+            logger.info("Loaded %d account(s) from %s", len(cached['accounts']), path)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable accounts cache %s: %s", path, e)
+    
+    def _save_accounts_to_disk(self, accounts: List[Dict]) -> None:
+        """Write the account list to Config.ACCOUNTS_CACHE_FILE atomically."""
+        path = Config.ACCOUNTS_CACHE_FILE
+        if not path:
+            return
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({'ts': time.time(), 'accounts': accounts}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not write accounts cache %s: %s", path, e)
+    
+    def _discard_disk_accounts(self) -> None:
+        """Forget an account list loaded from disk (and the file) after it proved stale."""
+        logger.warning("Cached account hashes look stale - discarding %s", Config.ACCOUNTS_CACHE_FILE)
+        self._accounts_from_disk = False
+        self.invalidate_accounts_cache()
+        try:
+            os.remove(Config.ACCOUNTS_CACHE_FILE)
+        except OSError:
+            pass
+    
+    def invalidate_accounts_cache(self) -> None:
+        """Drop the cached account list so the next lookup refetches it."""
+        self._account_cache = None
+        self._account_cache_ts = 0.0
+        self._missing_accounts.clear()
+    
+    def invalidate_balances(self, account_number: Optional[str] = None) -> None:
+        """
+        Drop cached balances, e.g. after an order changes them.
+        
+        Args:
+            account_number: Account to drop. If None, drops every cached account.
+        """
+        with self._generation_lock:
+            self._balances_generation += 1
+            if account_number is None:
+                self._balances_cache.clear()
+                self._metrics_cache.clear()
+            else:
+                self._balances_cache.pop(account_number, None)
+                self._metrics_cache.pop(account_number, None)
+    
+    def _cache_if_current(self, cache: Dict, cache_key: str, generation: int, value: Any) -> None:
         """
+        Store value in a balances or metrics cache unless balances were invalidated since it was read.
+        
+        Args:
+            cache: _balances_cache or _metrics_cache
+            cache_key: Account number, or '__default__'
+            generation: _balances_generation when the read started
+            value: The value read
+        """
+        with self._generation_lock:
+            if generation == self._balances_generation:
+                cache[cache_key] = (time.monotonic(), value)
+    
+    def _ensure_accounts_loaded(self) -> None:
+        """Fetch the account list (and its hash lookup) unless the cached copy is still fresh."""
+        if (self._account_cache is not None
+                and time.monotonic() - self._account_cache_ts < self._account_cache_ttl):
+            return
+        
         logger.info("Fetching account numbers and hash values...")
         accounts = self.client.get_accounts()
-        self._account_cache = accounts
+        self._set_accounts(accounts)
+        self._accounts_from_disk = False
+        self._save_accounts_to_disk(accounts)
+        
+        logger.info("Found %d account(s)", len(accounts))
+        if logger.isEnabledFor(logging.DEBUG):
+            for account in accounts:
+                logger.debug("  Account: %s, Hash: %.20s...",
+                             account.get('accountNumber', 'N/A'), account.get('hashValue', 'N/A'))
+    
+    def get_account_numbers(self) -> List[Dict]:
+        """
+        Get list of account numbers and their corresponding encrypted hash values.
         
-        logger.info(f"Found {len(accounts)} account(s)")
-        for account in accounts:
-            account_num = account.get('accountNumber', 'N/A')
-            hash_val = account.get('hashValue', 'N/A')
-            logger.debug(f"  Account: {account_num}, Hash: {hash_val[:20]}...")
+        The list is cached for _account_cache_ttl seconds; use
+        invalidate_accounts_cache() to force a refresh.
         
-        return accounts
+        Returns:
+            list: List of dictionaries with 'accountNumber' and 'hashValue' keys
+                  Example: [{'accountNumber': '12345678', 'hashValue': 'ABC123...'}]
+        """
+        self._ensure_accounts_loaded()
+        return self._account_cache
     
     def get_account_hash(self, account_number: Optional[str] = None) -> str:
         """
@@ -49,35 +281,64 @@ class AccountManager:
         Raises:
             ValueError: If account number not found
         """
-        accounts = self.get_account_numbers()
+        if account_number in self._missing_accounts:
+            raise ValueError(f"Account number {account_number} not found")
+        
+        self._ensure_accounts_loaded()
         
         if account_number is None:
             # Return hash for first account if no account number specified
-            if accounts:
-                return accounts[0].get('hashValue')
-            else:
+            if self._default_hash is None:
                 raise ValueError("No accounts found")
+            return self._default_hash
+        
+        try:
+            return self._hash_by_number[account_number]
+        except KeyError:
+            if self._accounts_from_disk:
+                # The disk copy may predate this account; check the API before giving up
+                self._discard_disk_accounts()
+                return self.get_account_hash(account_number)
+            self._missing_accounts.add(account_number)
+            raise ValueError(f"Account number {account_number} not found") from None
+    
+    @classmethod
+    def _get_today_bounds(cls) -> Tuple[str, str]:
+        """
+        Get today's UTC order-time bounds, formatted once per calendar day.
         
-        # Find the account by account number
-        for account in accounts:
-            if account.get('accountNumber') == account_number:
-                return account.get('hashValue')
-        
-        raise ValueError(f"Account number {account_number} not found")
+        Returns:
+            tuple: (fromEnteredTime, toEnteredTime), e.g.
+                   ('2024-03-29T00:00:00.000Z', '2024-03-29T23:59:59.999Z')
+        """
+        today = datetime.now(timezone.utc).date()
+        bounds = cls._today_bounds
+        if bounds is None or bounds[0] != today:
+            today_start = datetime.combine(today, dt_time.min, tzinfo=timezone.utc)
+            today_end = today_start + timedelta(days=1, microseconds=-1000)
+            bounds = (
+                today,
+                today_start.isoformat(timespec='milliseconds').replace('+00:00', 'Z'),
+                today_end.isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+            )
+            cls._today_bounds = bounds
+        return bounds[1], bounds[2]
     
     def get_orders_executed_today(
         self,
         account_number: Optional[str] = None,
         max_results: int = 3000,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        statuses: Optional[List[str]] = None
     ) -> List[Dict]:
         """
         Get all orders executed today for a specific account.
         
         Args:
             account_number: The plain text account number. If None, uses first account.
-            max_results: Maximum number of orders to retrieve (default: 3000)
+            max_results: Maximum number of orders to retrieve per status (default: 3000)
             status: Optional order status filter (e.g., 'FILLED', 'EXECUTED')
+            statuses: Optional list of statuses; orders matching any of them are returned
         
         Returns:
             list: List of order dictionaries
@@ -89,13 +350,9 @@ class AccountManager:
         account_hash = self.get_account_hash(account_number)
         
         # Get today's date range in ISO-8601 format
-        today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-        today_end = datetime.now(timezone.utc).replace(hour=23, minute=59, second=59, microsecond=999000)
-        
-        from_entered_time = today_start.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
-        to_entered_time = today_end.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+        from_entered_time, to_entered_time = self._get_today_bounds()
         
-        logger.info(f"Fetching orders executed today (from {from_entered_time} to {to_entered_time})...")
+        logger.info("Fetching orders executed today (from %s to %s)...", from_entered_time, to_entered_time)
         
         # Build query parameters
         params = {
@@ -104,14 +361,11 @@ class AccountManager:
             'toEnteredTime': to_entered_time
         }
         
-        if status:
-            params['status'] = status
-        
         # Make the API call
         endpoint = f'/accounts/{account_hash}/orders'
-        orders = self.client._make_request('GET', endpoint, params=params)
+        orders = self._get_orders_by_status(endpoint, params, status, statuses)
         
-        logger.info(f"Found {len(orders)} order(s) executed today")
+        logger.info("Found %d order(s) executed today", len(orders))
         
         return orders
     
@@ -121,7 +375,8 @@ class AccountManager:
         from_entered_time: Optional[str] = None,
         to_entered_time: Optional[str] = None,
         max_results: int = 3000,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        statuses: Optional[List[str]] = None
     ) -> List[Dict]:
         """
         Get orders for a specific account with custom date range.
@@ -130,8 +385,9 @@ class AccountManager:
             account_number: The plain text account number. If None, uses first account.
             from_entered_time: Start time in ISO-8601 format (e.g., '2024-03-29T00:00:00.000Z')
             to_entered_time: End time in ISO-8601 format (e.g., '2024-04-28T23:59:59.000Z')
-            max_results: Maximum number of orders to retrieve (default: 3000)
+            max_results: Maximum number of orders to retrieve per status (default: 3000)
             status: Optional order status filter
+            statuses: Optional list of statuses; orders matching any of them are returned
         
         Returns:
             list: List of order dictionaries
@@ -154,23 +410,62 @@ class AccountManager:
         elif from_entered_time or to_entered_time:
             raise ValueError("Both 'fromEnteredTime' and 'toEnteredTime' must be provided together")
         
-        if status:
-            params['status'] = status
-        
-        logger.info(f"Fetching orders for account {account_number or 'default'}...")
+        logger.info("Fetching orders for account %s...", account_number or 'default')
         
         # Make the API call
         endpoint = f'/accounts/{account_hash}/orders'
-        orders = self.client._make_request('GET', endpoint, params=params)
+        orders = self._get_orders_by_status(endpoint, params, status, statuses)
         
-        logger.info(f"Found {len(orders)} order(s)")
+        logger.info("Found %d order(s)", len(orders))
         
         return orders
     
+    def _get_orders_by_status(
+        self,
+        endpoint: str,
+        params: Dict,
+        status: Optional[str] = None,
+        statuses: Optional[List[str]] = None
+    ) -> List[Dict]:
+        """
+        GET an orders endpoint filtered server-side by one or more statuses.
+        
+        The API takes a single `status` per request, so several statuses are
+        requested concurrently and the results concatenated.
+        
+        Args:
+            endpoint: Orders endpoint
+            params: Query parameters without `status`
+            status: Single status filter
+            statuses: Additional status filters
+        
+        Returns:
+            list: Orders matching any requested status (all orders if none requested)
+        """
+        wanted = list(dict.fromkeys(([status] if status else []) + list(statuses or [])))
+        for unknown in (s for s in wanted if s not in ORDER_STATUSES):
+            # Still sent as-is; the API decides whether it accepts the value
+            logger.warning("Order status %s is not a documented Schwab status", unknown)
+        
+        if not wanted:
+            return self._get(endpoint, params=params)
+        if len(wanted) == 1:
+            return self._get(endpoint, params={**params, 'status': wanted[0]})
+        
+        with ThreadPoolExecutor(max_workers=min(len(wanted), 8)) as executor:
+            results = executor.map(
+                lambda s: self._get(endpoint, params={**params, 'status': s}),
+                wanted
+            )
+            return list(itertools.chain.from_iterable(results))
+    
     def get_account_balances(self, account_number: Optional[str] = None) -> Dict:
         """
         Get account balances and details for a specific account.
         
+        Results are reused for _balances_ttl seconds; use invalidate_balances()
+        to drop them early.
+        
         Args:
             account_number: The plain text account number. If None, uses first account.
         
@@ -186,46 +481,143 @@ class AccountManager:
         Raises:
             ValueError: If account number not found
         """
+        cache_key = account_number or '__default__'
+        cached = self._balances_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self._balances_ttl:
+            return cached[1]
+        
+        generation = self._balances_generation
         # Get the encrypted account hash
         account_hash = self.get_account_hash(account_number)
         
-        logger.info(f"Fetching account balances for account {account_number or 'default'}...")
+        logger.info("Fetching account balances for account %s...", account_number or 'default')
         
         # Make the API call
         endpoint = f'/accounts/{account_hash}'
-        account_details = self.client._make_request('GET', endpoint)
+        account_details = self._get(endpoint)
+        self._cache_if_current(self._balances_cache, cache_key, generation, account_details)
         
         logger.info("Account balances retrieved successfully")
         
         return account_details
     
-    def get_net_liquidity(self, account_number: Optional[str] = None) -> float:
+    def get_account_metrics(self, account_number: Optional[str] = None) -> Dict[str, float]:
         """
-        Get net liquidity (liquidation value) for a specific account.
+        Get net liquidity and option buying power from one balances read.
         
-        Net liquidity represents the total value of the account if all positions
-        were liquidated at current market prices.
+        Uses stale-while-revalidate: a result younger than _metrics_fresh_ttl is
+        returned directly; one younger than _metrics_stale_ttl is returned while
+        a background thread refreshes it; anything older is refreshed first.
         
         Args:
             account_number: The plain text account number. If None, uses first account.
         
         Returns:
-            float: Net liquidity value (liquidation value)
+            dict: {'net_liquidity': float, 'option_buying_power': float}
         
         Raises:
             ValueError: If account number not found
         """
-        # Get account balances
+        cache_key = account_number or '__default__'
+        cached = self._metrics_cache.get(cache_key)
+        if cached is not None:
+            age = time.monotonic() - cached[0]
+            if age < self._metrics_fresh_ttl:
+                return cached[1]
+            if age < self._metrics_stale_ttl:
+                with self._metrics_lock:
+                    start_refresh = cache_key not in self._metrics_refreshing
+                    self._metrics_refreshing.add(cache_key)
+                if start_refresh:
+                    threading.Thread(
+                        target=self._refresh_metrics_in_background,
+                        args=(cache_key, account_number),
+                        daemon=True
+                    ).start()
+                return cached[1]
+        
+        return self._refresh_metrics(cache_key, account_number)
+    
+    def _refresh_metrics_in_background(self, cache_key: str, account_number: Optional[str]) -> None:
+        """Refresh a stale get_account_metrics() entry; failures keep the stale value."""
+        try:
+            self._refresh_metrics(cache_key, account_number)
+        except Exception as e:
+            logger.warning("Background refresh of account metrics failed: %s", e)
+        finally:
+            with self._metrics_lock:
+                self._metrics_refreshing.discard(cache_key)
+    
+    def _refresh_metrics(self, cache_key: str, account_number: Optional[str]) -> Dict[str, float]:
+        """Read account metrics from the API and store them in the metrics cache."""
+        generation = self._balances_generation
+        metrics = self._read_account_metrics(account_number)
+        self._cache_if_current(self._metrics_cache, cache_key, generation, metrics)
+        return metrics
+    
+    def _read_account_metrics(self, account_number: Optional[str]) -> Dict[str, float]:
+        """
+        Extract net liquidity and option buying power from the account balances.
+        
+        Args:
+            account_number: The plain text account number. If None, uses first account.
+        
+        Returns:
+            dict: {'net_liquidity': float, 'option_buying_power': float}
+        """
         balances = self.get_account_balances(account_number)
         
-        # Extract net liquidity from currentBalances (liquidationValue)
-        securities_account = balances.get('securitiesAccount', {})
-        current_balances = securities_account.get('currentBalances', {})
+        try:
+            current_balances = balances['securitiesAccount']['currentBalances']
+        except (KeyError, TypeError):
+            current_balances = {}
+        
+        # Net liquidity = liquidation value of all positions at current market prices
         net_liquidity = current_balances.get('liquidationValue', 0.0)
         
-        logger.info(f"Net liquidity for account {account_number or 'default'}: ${net_liquidity:,.2f}")
+        # Use the most specific option buying power field the account reports
+        obp_field = None
+        for field, note in _OBP_PRIORITY:
+            option_buying_power = current_balances.get(field)
+            if option_buying_power is not None:
+                obp_field = field
+                logger.debug(note)
+                break
+        else:
+            # Fallback to regular buyingPower if option-specific field not available
+            option_buying_power = current_balances.get('buyingPower', 0.0)
+            logger.warning("Option-specific buying power field not found in account balances")
+            logger.warning("Available balance fields: %s", list(current_balances))
+            logger.warning(f"Using regular buyingPower as fallback: ${option_buying_power:,.2f}")
+            obp_field = 'buyingPower'
+        
+        # %-formatting has no thousands separator, so only build the f-string when INFO is on
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Account {account_number or 'default'}: net liquidity ${net_liquidity:,.2f}, "
+                        f"option buying power ${option_buying_power:,.2f} ({obp_field})")
+        
+        return {
+            'net_liquidity': net_liquidity,
+            'option_buying_power': float(option_buying_power)
+        }
+    
+    def get_net_liquidity(self, account_number: Optional[str] = None) -> float:
+        """
+        Get net liquidity (liquidation value) for a specific account.
+        
+        Net liquidity represents the total value of the account if all positions
+        were liquidated at current market prices.
+        
+        Args:
+            account_number: The plain text account number. If None, uses first account.
         
-        return net_liquidity
+        Returns:
+            float: Net liquidity value (liquidation value)
+        
+        Raises:
+            ValueError: If account number not found
+        """
+        return self.get_account_metrics(account_number)['net_liquidity']
 
     def get_option_buying_power(self, account_number: Optional[str] = None) -> float:
         """
@@ -243,43 +635,4 @@ class AccountManager:
         Raises:
             ValueError: If account number not found
         """
-        # Get account balances
-        balances = self.get_account_balances(account_number)
-        
-        # Extract option buying power from currentBalances
-        securities_account = balances.get('securitiesAccount', {})
-        current_balances = securities_account.get('currentBalances', {})
-        
-        # Try different possible field names for option buying power
-        option_buying_power = None
-        
-        # Check for optionBuyingPower (camelCase) - specific option buying power field
-        if 'optionBuyingPower' in current_balances:
-            option_buying_power = current_balances.get('optionBuyingPower')
-            logger.info("Found optionBuyingPower field in account balances")
-        # Check for option_buying_power (snake_case)
-        elif 'option_buying_power' in current_balances:
-            option_buying_power = current_balances.get('option_buying_power')
-            logger.info("Found option_buying_power field in account balances")
-        # Check for optionBuyingPowerAvailable
-        elif 'optionBuyingPowerAvailable' in current_balances:
-            option_buying_power = current_balances.get('optionBuyingPowerAvailable')
-            logger.info("Found optionBuyingPowerAvailable field in account balances")
-        # Use buyingPowerNonMarginableTrade for options (non-marginable trades)
-        elif 'buyingPowerNonMarginableTrade' in current_balances:
-            option_buying_power = current_balances.get('buyingPowerNonMarginableTrade')
-            logger.info("Using buyingPowerNonMarginableTrade for option buying power")
-        
-        if option_buying_power is None:
-            # Fallback to regular buyingPower if option-specific field not available
-            option_buying_power = current_balances.get('buyingPower', 0.0)
-            logger.warning(f"Option-specific buying power field not found in account balances")
-            logger.warning(f"Available balance fields: {list(current_balances.keys())}")
-            logger.warning(f"Using regular buyingPower as fallback: ${option_buying_power:,.2f}")
-        else:
-            logger.info(f"Using option buying power: ${option_buying_power:,.2f}")
-        
-        logger.info(f"Option buying power for account {account_number or 'default'}: ${option_buying_power:,.2f}")
-        
-        return float(option_buying_power)
-
+        return self.get_account_metrics(account_number)['option_buying_power']
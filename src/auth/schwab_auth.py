@@ -1,18 +1,75 @@
 """Schwab API authentication module."""
-import json
+import base64
 import logging
-import ssl
-import webbrowser
-import http.server
 import urllib.parse
 import os
-from typing import Optional, Dict
+import re
+import threading
+import time
+from typing import Optional, Dict, Tuple
+import orjson
 import requests
 from src.config import Config
+from src.utils.http import get_session
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Lifetime of the generated localhost certificate; long enough that it is
+# effectively created once per install
+CERT_VALIDITY_DAYS = 3650
+
+# Error codes in a token refresh response meaning the refresh token itself is unusable
+TOKEN_ERROR_RE = re.compile(
+    r'refresh_token_authentication_error|unsupported_token_type|invalid_grant|invalid_token|bad request',
+    re.IGNORECASE
+)
+
+# Logged as a single record when the refresh token can no longer be used
+REAUTH_BANNER = "\n".join([
+    "=" * 70,
+    "REFRESH TOKEN EXPIRED OR INVALID - RE-AUTHENTICATION REQUIRED",
+    "=" * 70,
+    "Status Code: %s",
+    "%s: %s",
+    "",
+    "POSSIBLE CAUSES:",
+    "  1. Refresh token expired (bot offline for >7 days)",
+    "  2. Refresh token is invalid or corrupted",
+    "  3. Client credentials (CLIENT_ID/CLIENT_SECRET) are incorrect",
+    "  4. Token file was manually edited or corrupted",
+    "",
+    "HOW TOKEN REFRESH WORKS:",
+    "  ✓ Access tokens (30 min) → Auto-refresh on every API call",
+    "  ✓ Refresh tokens (7 days) → Auto-extend if bot runs weekly",
+    "",
+    "ACTION REQUIRED: Re-authenticate",
+    "  1. SSH into EC2: ssh ubuntu@<your-ec2-ip>",
+    "  2. Navigate to bot: cd ~/trading_bot",
+    "  3. Delete tokens.json: rm tokens.json",
+    "  4. Re-authenticate: python3 manual_auth.py",
+    "  5. After this, automatic refresh will work again!",
+    "",
+    "NOTE: You do NOT need to re-authenticate every 7 days.",
+    "      Only if the bot is offline for >7 consecutive days.",
+    "=" * 70,
+])
+
+# Refresh this many seconds before the access token actually expires
+TOKEN_REFRESH_MARGIN = 60
+
+
+def _callback_response(status: str, body: str) -> bytes:
+    """Build the complete HTTP/1.1 response sent back to the browser on the callback."""
+    content = f'<html><body>{body}</body></html>'.encode()
+    head = (
+        f'HTTP/1.1 {status}\r\n'
+        'Content-Type: text/html\r\n'
+        f'Content-Length: {len(content)}\r\n'
+        'Connection: close\r\n\r\n'
+    )
+    return head.encode('latin-1') + content
+
 
 class SchwabAuth:
     """Handles authentication with Schwab API using OAuth 2.0."""
@@ -23,9 +80,21 @@ class SchwabAuth:
         self.client_id = Config.CLIENT_ID
         self.client_secret = Config.CLIENT_SECRET
         self.redirect_uri = Config.REDIRECT_URI
+        parsed_redirect = urllib.parse.urlparse(self.redirect_uri)
+        self._callback_port = parsed_redirect.port or 8080
+        self._callback_https = parsed_redirect.scheme == 'https'
         self.token_file = Config.TOKEN_FILE
+        # Schwab token endpoint requires Basic Auth with client_id:client_secret
+        credentials = f"{self.client_id}:{self.client_secret}"
+        self._basic_auth_header = f"Basic {base64.b64encode(credentials.encode()).decode()}"
         self.access_token: Optional[str] = None
         self.refresh_token: Optional[str] = None
+        # time.monotonic() deadline after which the access token is refreshed before use
+        self.token_expiry: Optional[float] = None
+        # (access_token, headers) so get_headers() only rebuilds after the token changes
+        self._cached_headers: Optional[Tuple[str, Dict[str, str]]] = None
+        # Held for every refresh so concurrent callers send a single refresh_token grant
+        self._refresh_lock = threading.RLock()
         
     def get_authorization_url(self) -> str:
         """
@@ -56,7 +125,7 @@ class SchwabAuth:
         cert_file = os.path.join(cert_dir, 'localhost.pem')
         key_file = os.path.join(cert_dir, 'localhost.key')
         
-        # Check if certificate already exists
+        # Check if certificate already exists (generated once and reused across runs)
         if os.path.exists(cert_file) and os.path.exists(key_file):
             return cert_file, key_file
         
@@ -73,7 +142,7 @@ class SchwabAuth:
                 'openssl', 'req', '-x509', '-newkey', 'rsa:2048',
                 '-keyout', key_file,
                 '-out', cert_file,
-                '-days', '365',
+                '-days', str(CERT_VALIDITY_DAYS),
                 '-nodes',
                 '-subj', '/CN=localhost',
                 '-addext', 'subjectAltName=DNS:localhost,IP:127.0.0.1'
@@ -93,64 +162,30 @@ class SchwabAuth:
     
     def _start_callback_server(self) -> str:
         """
-        Start a local HTTPS server to receive the OAuth callback.
+        Listen on the redirect URI's port for the OAuth callback.
+        
+        Only the request line of the browser's GET is needed, so connections are
+        accepted on a plain socket (TLS-wrapped for https redirect URIs) rather
+        than a full http.server. Connections that fail the TLS handshake or carry
+        no code (e.g. favicon requests) are answered and skipped.
         
         Returns:
             str: The authorization code from the callback
-        """
-        code = None
-        
-        class CallbackHandler(http.server.BaseHTTPRequestHandler):
-            def do_GET(self):
-                nonlocal code
-                # Parse the callback URL
-                parsed_path = urllib.parse.urlparse(self.path)
-                query_params = urllib.parse.parse_qs(parsed_path.query)
-                
-                if 'code' in query_params:
-                    code = query_params['code'][0]
-                    self.send_response(200)
-                    self.send_header('Content-type', 'text/html')
-                    self.end_headers()
-                    self.wfile.write(
-                        b'<html><body><h1>Authentication successful!</h1>'
-                        b'<p>You can close this window and return to the application.</p></body></html>'
-                    )
-                elif 'error' in query_params:
-                    error = query_params['error'][0]
-                    self.send_response(400)
-                    self.send_header('Content-type', 'text/html')
-                    self.end_headers()
-                    self.wfile.write(
-                        f'<html><body><h1>Authentication failed</h1>'
-                        f'<p>Error: {error}</p></body></html>'.encode()
-                    )
-                else:
-                    self.send_response(400)
-                    self.send_header('Content-type', 'text/html')
-                    self.end_headers()
-                    self.wfile.write(
-                        b'<html><body><h1>No authorization code received</h1></body></html>'
-                    )
-            
-            def log_message(self, format, *args):
-                # Suppress server logs
-                pass
-        
-        # Extract port from redirect URI
-        parsed_redirect = urllib.parse.urlparse(self.redirect_uri)
-        port = parsed_redirect.port or 8080
-        use_https = parsed_redirect.scheme == 'https'
         
-        server = http.server.HTTPServer(('localhost', port), CallbackHandler)
+        Raises:
+            Exception: If the callback reports an error or none arrives within 5 minutes
+        """
+        # Only needed for the one-time interactive login, not token refresh
+        import html
+        import socket
+        import ssl
         
-        # Wrap with SSL if using HTTPS
-        if use_https:
+        context = None
+        if self._callback_https:
             try:
                 cert_file, key_file = self._get_or_create_certificate()
                 context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
                 context.load_cert_chain(cert_file, key_file)
-                server.socket = context.wrap_socket(server.socket, server_side=True)
                 logger.info("HTTPS server started with self-signed certificate")
                 logger.warning(
                     "Your browser may show a security warning for the self-signed certificate. "
@@ -162,14 +197,57 @@ class SchwabAuth:
         
         # Wait for the callback (with timeout)
         logger.info(f"Waiting for callback on {self.redirect_uri}...")
-        server.timeout = 300  # 5 minute timeout
-        server.handle_request()
-        server.server_close()
-        
-        if not code:
-            raise Exception("No authorization code received from callback")
-        
-        return code
+        deadline = time.monotonic() + 300  # 5 minute timeout
+        
+        with socket.create_server(('localhost', self._callback_port)) as server:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise Exception("No authorization code received from callback")
+                server.settimeout(remaining)
+                try:
+                    raw_conn, _ = server.accept()
+                except socket.timeout:
+                    continue
+                
+                # The raw socket is closed even if the TLS handshake fails
+                with raw_conn:
+                    try:
+                        raw_conn.settimeout(30)
+                        # Closing raw_conn is a no-op once wrap_socket has taken it over
+                        conn = context.wrap_socket(raw_conn, server_side=True) if context else raw_conn
+                        with conn, conn.makefile('rb') as request:
+                            request_line = request.readline(65537).decode('latin-1')
+                            # Drain the headers: closing with unread data would reset the
+                            # connection before the browser reads the response
+                            while request.readline(65537) not in (b'\r\n', b'\n', b''):
+                                pass
+                            parts = request_line.split()
+                            target = parts[1] if len(parts) >= 2 else ''
+                            query_params = urllib.parse.parse_qs(urllib.parse.urlsplit(target).query)
+                            
+                            if 'code' in query_params:
+                                conn.sendall(_callback_response(
+                                    '200 OK',
+                                    '<h1>Authentication successful!</h1>'
+                                    '<p>You can close this window and return to the application.</p>'
+                                ))
+                                return query_params['code'][0]
+                            
+                            if 'error' in query_params:
+                                error = query_params['error'][0]
+                                conn.sendall(_callback_response(
+                                    '400 Bad Request',
+                                    f'<h1>Authentication failed</h1><p>Error: {html.escape(error)}</p>'
+                                ))
+                                raise Exception(f"Authorization failed: {error}")
+                            
+                            conn.sendall(_callback_response(
+                                '400 Bad Request', '<h1>No authorization code received</h1>'
+                            ))
+                    except OSError as e:
+                        # Typically the browser rejecting the self-signed certificate; it retries
+                        logger.debug(f"Callback connection failed: {e}")
     
     def exchange_code_for_tokens(self, authorization_code: str) -> Dict:
         """
@@ -183,13 +261,8 @@ class SchwabAuth:
         """
         url = f"{Config.AUTH_BASE_URL}/v1/oauth/token"
         
-        # Schwab API requires Basic Auth with client_id:client_secret
-        import base64
-        credentials = f"{self.client_id}:{self.client_secret}"
-        encoded_credentials = base64.b64encode(credentials.encode()).decode()
-        
         headers = {
-            'Authorization': f'Basic {encoded_credentials}',
+            'Authorization': self._basic_auth_header,
             'Content-Type': 'application/x-www-form-urlencoded'
         }
         
@@ -199,7 +272,7 @@ class SchwabAuth:
             'redirect_uri': self.redirect_uri
         }
         
-        response = requests.post(url, headers=headers, data=data)
+        response = get_session().post(url, headers=headers, data=data)
         
         if not response.ok:
             error_msg = f"Token exchange failed: {response.status_code}"
@@ -211,9 +284,10 @@ class SchwabAuth:
             logger.error(error_msg)
             response.raise_for_status()
         
-        token_data = response.json()
+        token_data = orjson.loads(response.content)
         self.access_token = token_data.get('access_token')
         self.refresh_token = token_data.get('refresh_token')
+        self._set_token_expiry(token_data)
         
         # Save tokens to file
         self._save_tokens(token_data)
@@ -238,13 +312,8 @@ class SchwabAuth:
         
         url = f"{Config.AUTH_BASE_URL}/v1/oauth/token"
         
-        # Schwab API requires Basic Auth with client_id:client_secret
-        import base64
-        credentials = f"{self.client_id}:{self.client_secret}"
-        encoded_credentials = base64.b64encode(credentials.encode()).decode()
-        
         headers = {
-            'Authorization': f'Basic {encoded_credentials}',
+            'Authorization': self._basic_auth_header,
             'Content-Type': 'application/x-www-form-urlencoded'
         }
         
@@ -253,7 +322,7 @@ class SchwabAuth:
             'refresh_token': self.refresh_token
         }
         
-        response = requests.post(url, headers=headers, data=data)
+        response = get_session().post(url, headers=headers, data=data)
         
         if not response.ok:
             error_msg = f"Token refresh failed: {response.status_code}"
@@ -272,45 +341,15 @@ class SchwabAuth:
             # 400 Bad Request often means invalid/expired refresh token
             is_token_error = False
             if error_text:
-                error_str = error_text.lower()
-                is_token_error = any(keyword in error_str for keyword in [
-                    'refresh_token_authentication_error',
-                    'unsupported_token_type',
-                    'invalid_grant',
-                    'invalid_token',
-                    'bad request'
-                ]) or response.status_code == 400
+                is_token_error = bool(TOKEN_ERROR_RE.search(error_text)) or response.status_code == 400
             
             if is_token_error:
-                logger.error("="*70)
-                logger.error("REFRESH TOKEN EXPIRED OR INVALID - RE-AUTHENTICATION REQUIRED")
-                logger.error("="*70)
-                logger.error(f"Status Code: {response.status_code}")
-                if error_data:
-                    logger.error(f"Error Details: {error_data}")
-                elif error_text:
-                    logger.error(f"Error Response: {error_text}")
-                logger.error("")
-                logger.error("POSSIBLE CAUSES:")
-                logger.error("  1. Refresh token expired (bot offline for >7 days)")
-                logger.error("  2. Refresh token is invalid or corrupted")
-                logger.error("  3. Client credentials (CLIENT_ID/CLIENT_SECRET) are incorrect")
-                logger.error("  4. Token file was manually edited or corrupted")
-                logger.error("")
-                logger.error("HOW TOKEN REFRESH WORKS:")
-                logger.error("  ✓ Access tokens (30 min) → Auto-refresh on every API call")
-                logger.error("  ✓ Refresh tokens (7 days) → Auto-extend if bot runs weekly")
-                logger.error("")
-                logger.error("ACTION REQUIRED: Re-authenticate")
-                logger.error("  1. SSH into EC2: ssh ubuntu@<your-ec2-ip>")
-                logger.error("  2. Navigate to bot: cd ~/trading_bot")
-                logger.error("  3. Delete tokens.json: rm tokens.json")
-                logger.error("  4. Re-authenticate: python3 manual_auth.py")
-                logger.error("  5. After this, automatic refresh will work again!")
-                logger.error("")
-                logger.error("NOTE: You do NOT need to re-authenticate every 7 days.")
-                logger.error("      Only if the bot is offline for >7 consecutive days.")
-                logger.error("="*70)
+                logger.error(
+                    REAUTH_BANNER,
+                    response.status_code,
+                    'Error Details' if error_data else 'Error Response',
+                    error_data or error_text
+                )
                 
                 # Clear invalid tokens to prevent retry loops
                 self.access_token = None
@@ -328,8 +367,9 @@ class SchwabAuth:
             else:
                 response.raise_for_status()
         
-        token_data = response.json()
+        token_data = orjson.loads(response.content)
         self.access_token = token_data.get('access_token')
+        self._set_token_expiry(token_data)
         
         # Update refresh token if provided in response
         if 'refresh_token' in token_data:
@@ -381,6 +421,7 @@ class SchwabAuth:
             logger.info(f"{auth_url}")
             
             # Try to open browser automatically
+            import webbrowser
             try:
                 webbrowser.open(auth_url)
                 logger.info("Opened authorization URL in your default browser.")
@@ -418,14 +459,70 @@ class SchwabAuth:
             # Need to authenticate
             return self.authenticate()
         
-        # Token might be expired, but we'll handle that in API calls
-        # For now, return the token we have
+        # Refresh ahead of expiry instead of waiting for an API call to 401.
+        # Tokens without a known expiry still rely on the 401 retry in SchwabClient.
+        if self.token_expiry is not None and time.monotonic() >= self.token_expiry:
+            with self._refresh_lock:
+                # Another thread may have refreshed while this one waited
+                if self.token_expiry is not None and time.monotonic() >= self.token_expiry:
+                    try:
+                        self.refresh_access_token()
+                    except requests.RequestException as e:
+                        logger.warning(f"Proactive token refresh failed, using current token: {e}")
+                        self.token_expiry = None
+        
         return self.access_token
     
+    def refresh_if_current(self, headers: Dict[str, str]):
+        """
+        Refresh the access token after a 401, unless it has already been replaced.
+        
+        Every 401 handler calls this with the headers of the rejected request.
+        When several requests fail together, the first refreshes and the others
+        find the token already changed and just retry with get_headers().
+        
+        Args:
+            headers: Headers sent with the request that got the 401
+        """
+        with self._refresh_lock:
+            if headers.get('Authorization') == f'Bearer {self.access_token}':
+                logger.warning("Token expired, refreshing...")
+                self.refresh_access_token()
+    
+    def _set_token_expiry(self, token_data: Dict):
+        """
+        Record when the access token in token_data expires.
+        
+        Args:
+            token_data: Token response; expires_in (seconds) is stamped as an
+                absolute expires_at so the expiry survives a reload from file
+        """
+        expires_in = token_data.get('expires_in')
+        if expires_in:
+            token_data['expires_at'] = time.time() + expires_in
+        self._set_expiry_from_epoch(token_data.get('expires_at'))
+    
+    def _set_expiry_from_epoch(self, expires_at: Optional[float]):
+        """Convert a wall-clock expiry into the monotonic refresh deadline."""
+        if expires_at is None:
+            self.token_expiry = None
+        else:
+            self.token_expiry = time.monotonic() + (expires_at - time.time()) - TOKEN_REFRESH_MARGIN
+    
     def _save_tokens(self, token_data: Dict):
-        """Save tokens to file."""
-        with open(self.token_file, 'w') as f:
-            json.dump(token_data, f, indent=2)
+        """
+        Save tokens to file.
+        
+        Written to a temp file, fsynced, then renamed over the token file so a
+        crash mid-write leaves either the old or the new tokens, never a
+        truncated file that forces re-authentication.
+        """
+        tmp_file = f"{self.token_file}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(token_data, option=orjson.OPT_INDENT_2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.token_file)
         logger.debug(f"Tokens saved to {self.token_file}")
     
     def _load_tokens(self) -> bool:
@@ -436,15 +533,16 @@ class SchwabAuth:
             bool: True if tokens were loaded successfully
         """
         try:
-            with open(self.token_file, 'r') as f:
-                token_data = json.load(f)
+            with open(self.token_file, 'rb') as f:
+                token_data = orjson.loads(f.read())
                 self.access_token = token_data.get('access_token')
                 self.refresh_token = token_data.get('refresh_token')
+                self._set_expiry_from_epoch(token_data.get('expires_at'))
                 return True
         except FileNotFoundError:
             logger.debug("No existing token file found")
             return False
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.warning("Token file exists but is invalid")
             return False
     
@@ -452,12 +550,19 @@ class SchwabAuth:
         """
         Get HTTP headers with authorization token.
         
+        The same dict is returned until the token changes, so callers that need
+        extra headers must copy it rather than modify it.
+        
         Returns:
             dict: Headers dictionary with Authorization header
         """
         token = self.get_access_token()
-        return {
-            'Authorization': f'Bearer {token}',
-            'Accept': 'application/json'
-        }
+        cached = self._cached_headers
+        if cached is None or cached[0] != token:
+            cached = (token, {
+                'Authorization': f'Bearer {token}',
+                'Accept': 'application/json'
+            })
+            self._cached_headers = cached
+        return cached[1]
 
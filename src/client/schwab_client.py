@@ -1,9 +1,12 @@
 """Schwab API client for making authenticated requests."""
 import logging
+import threading
+import orjson
 import requests
 from typing import Dict, Optional
 from src.auth.schwab_auth import SchwabAuth
 from src.config import Config
+from src.utils.http import get_session
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -17,6 +20,20 @@ class SchwabClient:
         self.auth = SchwabAuth()
         self.base_url = Config.API_BASE_URL
     
+    def prewarm(self):
+        """
+        Open a keep-alive connection to the API host ahead of the first real request.
+        
+        Sends an unauthenticated HEAD through the shared session so the TCP and
+        TLS handshakes are done and the connection waits in the pool. Any status
+        is fine; failures are only logged.
+        """
+        try:
+            get_session().head(self.base_url, timeout=5)
+            logger.debug(f"Prewarmed connection to {self.base_url}")
+        except requests.RequestException as e:
+            logger.debug(f"Connection prewarm failed (first request will connect): {e}")
+    
     def _make_request(
         self,
         method: str,
@@ -42,7 +59,7 @@ class SchwabClient:
         headers = self.auth.get_headers()
         
         try:
-            response = requests.request(
+            response = get_session().request(
                 method=method,
                 url=url,
                 headers=headers,
@@ -53,10 +70,9 @@ class SchwabClient:
             
             # If token expired, try refreshing
             if response.status_code == 401:
-                logger.warning("Token expired, refreshing...")
-                self.auth.refresh_access_token()
+                self.auth.refresh_if_current(headers)
                 headers = self.auth.get_headers()
-                response = requests.request(
+                response = get_session().request(
                     method=method,
                     url=url,
                     headers=headers,
@@ -68,12 +84,15 @@ class SchwabClient:
             response.raise_for_status()
             
             # Some endpoints return empty responses (204 No Content) for successful operations
-            if response.status_code == 204 or not response.text:
+            if response.status_code == 204 or not response.content:
                 logger.info("Request successful (empty response)")
-                return {}
+                # Creates (e.g. placing an order) answer 201 with the new resource's URL
+                location = response.headers.get('Location')
+                return {'location': location} if location else {}
             
             try:
-                return response.json()
+                # orjson parses straight from bytes; large order lists parse several times faster
+                return orjson.loads(response.content)
             except ValueError:
                 # If response is not JSON, return the text
                 logger.warning(f"Response is not JSON, returning text")
@@ -89,6 +108,8 @@ class SchwabClient:
         """
         Get list of account numbers and their encrypted values.
         
+        Not cached here; AccountManager keeps the list (in memory and on disk).
+        
         Returns:
             dict: Account information with account numbers and encrypted values
         """
@@ -132,3 +153,23 @@ class SchwabClient:
         params = {'maxResults': max_results}
         return self._make_request('GET', f'/v1/accounts/{account_id}/orders', params=params)
 
+
+_shared_client: Optional[SchwabClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_client() -> SchwabClient:
+    """
+    Get the process-wide SchwabClient, creating it on first use.
+    
+    Sharing one client means tokens are loaded and refreshed once for every
+    manager in the process.
+    
+    Returns:
+        SchwabClient: Shared client instance
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = SchwabClient()
+        return _shared_client
@@ -1,5 +1,6 @@
 """Configuration management for SPX ATM Credit Spread Bot."""
 import os
+from datetime import time as dt_time
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -21,6 +22,13 @@ class Config:
     # Token storage
     TOKEN_FILE = 'tokens.json'
     
+    # Account number -> hash cache reused across restarts (set to '' to disable)
+    ACCOUNTS_CACHE_FILE = os.getenv('ACCOUNTS_CACHE_FILE', os.path.expanduser('~/.cache/spx_bot/accounts.json'))
+    ACCOUNTS_CACHE_MAX_AGE = 24 * 3600  # seconds
+    
+    # Per-order text reports written by OrderManager to reports/ (set to false to skip)
+    ORDER_REPORTS = os.getenv('ORDER_REPORTS', 'true').lower() == 'true'
+    
     # Safety Gates (MANDATORY)
     # DRY_RUN: If True, NEVER place/modify/cancel orders. Default: True (SAFE)
     DRY_RUN = os.getenv('DRY_RUN', 'true').lower() == 'true'
@@ -72,13 +80,26 @@ class Config:
     ENTRY_END_HOUR = 12
     ENTRY_END_MINUTE = 0
     
+    # The same times as immutable datetime.time objects, ready for datetime.combine()
+    MARKET_OPEN = dt_time(MARKET_OPEN_HOUR, MARKET_OPEN_MINUTE)
+    MARKET_CLOSE = dt_time(MARKET_CLOSE_HOUR, MARKET_CLOSE_MINUTE)
+    OR_START = dt_time(OR_START_HOUR, OR_START_MINUTE)
+    OR_END = dt_time(OR_END_HOUR, OR_END_MINUTE)
+    ENTRY_END = dt_time(ENTRY_END_HOUR, ENTRY_END_MINUTE)
+    
+    # Set once validate() has passed; credentials are only read at import
+    _validated = False
+    
     @classmethod
     def validate(cls):
-        """Validate that required configuration is present."""
+        """Validate that required configuration is present (checked once per process)."""
+        if cls._validated:
+            return
         if not cls.CLIENT_ID:
             raise ValueError("SCHWAB_CLIENT_ID is not set in environment variables")
         if not cls.CLIENT_SECRET:
             raise ValueError("SCHWAB_CLIENT_SECRET is not set in environment variables")
         if not cls.REDIRECT_URI:
             raise ValueError("SCHWAB_REDIRECT_URI is not set in environment variables")
+        cls._validated = True
 
@@ -1,16 +1,82 @@
 """Order Manager - Places credit spread orders."""
+import functools
 import logging
 import os
-from datetime import datetime
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Union
-from src.client.schwab_client import SchwabClient
+import requests
+from src.client.schwab_client import SchwabClient, get_shared_client
 from src.accounts.account_manager import AccountManager
+from src.config import Config
 from src.quotes.quotes_manager import QuotesManager
-from src.strategy.contract_scaling import ContractScaler
+from src.utils.http import get_session
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Sleeps (seconds) between looks for a just-placed order in today's orders, ~1.5s in total
+ORDER_POLL_DELAYS = (0.05, 0.1, 0.2, 0.4, 0.8)
+# Slack (seconds) for the broker's enteredTime clock running behind ours
+ORDER_CLOCK_SKEW = 2
+
+# Placed order URL from the POST's Location header, e.g. .../accounts/{hash}/orders/{orderId}
+_LOCATION_ORDER_ID_RE = re.compile(r'/orders/(\d+)$')
+# enteredTime, e.g. '2025-11-14T15:00:00+0000', also with fractional seconds, 'Z' or '+00:00'
+_ENTERED_TIME_RE = re.compile(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.\d+)?(Z|[+-]\d{2}:?\d{2})?$')
+
+# Per strategy symbol: spread width, underlying used for option quotes and symbols,
+# and the index quoted for the underlying price
+_SYMBOL_SPEC = {
+    'SPXW': {'width': 5, 'underlying': 'SPXW', 'quote': '$SPX'},
+    'XSP': {'width': 1, 'underlying': '$XSP', 'quote': '$XSP'},
+}
+
+# Accepted bias spellings and the form used throughout order placement
+_BIAS_NORMALIZE = {'bull': 'bullish', 'bullish': 'bullish', 'bear': 'bearish', 'bearish': 'bearish'}
+
+# Runs work whose result the order does not wait for (reports, advisory logging)
+# off the order placement path. Its worker is joined at interpreter exit, so
+# queued reports are still written on shutdown.
+_background_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='order-background')
+
+# Fields every credit spread order shares; place_credit_spread_order() adds price and legs
+_ORDER_TEMPLATE = {
+    "orderType": "NET_CREDIT",
+    "session": "NORMAL",
+    "duration": "DAY",
+    "orderStrategyType": "SINGLE",
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _yymmdd_to_iso(date: str) -> str:
+    """
+    Convert a YYMMDD date to YYYY-MM-DD, e.g. '251114' to '2025-11-14'.
+    
+    Raises:
+        ValueError: If date is not a valid YYMMDD date
+    """
+    return datetime.strptime(date, '%y%m%d').strftime('%Y-%m-%d')
+
+
+def _parse_entered_time(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an order's enteredTime to an aware datetime (fractional seconds dropped).
+    
+    Returns:
+        datetime: The time, taken as UTC if it has no offset, or None if it does not parse
+    """
+    match = _ENTERED_TIME_RE.match(value or '')
+    if not match:
+        return None
+    seconds, offset = match.groups()
+    if offset in (None, 'Z'):
+        return datetime.strptime(seconds, '%Y-%m-%dT%H:%M:%S').replace(tzinfo=timezone.utc)
+    return datetime.strptime(seconds + offset.replace(':', ''), '%Y-%m-%dT%H:%M:%S%z')
+
 
 class OrderManager:
     """
@@ -19,18 +85,54 @@ class OrderManager:
     """
     
     def __init__(self):
-        """Initialize the order manager."""
-        self.client = SchwabClient()
-        self.account_mgr = AccountManager()
-        self.quotes_mgr = QuotesManager()
-        self.contract_scaler = ContractScaler()
+        """
+        Initialize the order manager.
+        
+        The API client and the account, quotes and contract scaling helpers are
+        created on first use, so report-only callers never load credentials.
+        """
+        self._client: Optional[SchwabClient] = None
+        self._account_mgr: Optional[AccountManager] = None
+        self._quotes_mgr: Optional[QuotesManager] = None
+        self._contract_scaler = None
         
         # Create reports directory if it doesn't exist
+        self._reports_enabled = Config.ORDER_REPORTS
         self.reports_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'reports')
-        os.makedirs(self.reports_dir, exist_ok=True)
+        if self._reports_enabled:
+            os.makedirs(self.reports_dir, exist_ok=True)
         
         logger.info("OrderManager initialized")
     
+    @property
+    def client(self) -> SchwabClient:
+        """Shared SchwabClient, created on first use."""
+        if self._client is None:
+            self._client = get_shared_client()
+        return self._client
+    
+    @property
+    def account_mgr(self) -> AccountManager:
+        """AccountManager, created on first use."""
+        if self._account_mgr is None:
+            self._account_mgr = AccountManager(self.client)
+        return self._account_mgr
+    
+    @property
+    def quotes_mgr(self) -> QuotesManager:
+        """QuotesManager, created on first use."""
+        if self._quotes_mgr is None:
+            self._quotes_mgr = QuotesManager(client=self.client)
+        return self._quotes_mgr
+    
+    @property
+    def contract_scaler(self):
+        """ContractScaler, imported and created on first use."""
+        if self._contract_scaler is None:
+            from src.strategy.contract_scaling import ContractScaler
+            self._contract_scaler = ContractScaler()
+        return self._contract_scaler
+    
     def place_credit_spread_order(
         self,
         date: str,
@@ -105,37 +207,26 @@ class OrderManager:
         """
         # Validate inputs
         symbol_upper = symbol.upper()
-        if symbol_upper not in ['SPXW', 'XSP']:
+        spec = _SYMBOL_SPEC.get(symbol_upper)
+        if spec is None:
             raise ValueError(f"symbol must be 'SPXW' or 'XSP', got '{symbol}'")
         
-        bias_lower = bias.lower()
-        if bias_lower not in ['bullish', 'bearish', 'bull', 'bear']:
+        # Normalize bias (handle 'bull'/'bear' variants)
+        bias_normalized = _BIAS_NORMALIZE.get(bias.lower())
+        if bias_normalized is None:
             raise ValueError(f"bias must be 'bullish' or 'bearish', got '{bias}'")
         
-        # Normalize bias (handle 'bull'/'bear' variants)
-        if bias_lower in ['bull', 'bullish']:
-            bias_normalized = 'bullish'
-        else:
-            bias_normalized = 'bearish'
-        
-        # Determine spread width and underlying symbol based on strategy symbol
-        # Strategy provides: SPXW or XSP
-        # For quotes: SPXW uses 'SPXW', XSP uses '$XSP'
-        if symbol_upper == 'SPXW':
-            width = 5  # SPXW spreads are 5 points wide
-            underlying_symbol = 'SPXW'
-        else:  # XSP
-            width = 1  # XSP spreads are 1 point wide
-            underlying_symbol = '$XSP'
+        # Spread width and underlying symbol for the strategy symbol (SPXW or XSP)
+        width = spec['width']
+        underlying_symbol = spec['underlying']
         
         # Round strike to correct interval (as per strategy requirements)
         # SPXW: nearest $5, XSP: nearest $1
         # Note: The strategy's calculate_midpoint() already rounds, but we round again
         # here to ensure consistency in case the value wasn't pre-rounded
-        if symbol_upper == 'SPXW':
-            rounded_strike = self.quotes_mgr._round_strike_to_interval(short_strike, 'SPXW')
-        else:  # XSP
-            rounded_strike = self.quotes_mgr._round_strike_to_interval(short_strike, '$XSP')
+        # Both symbols list strikes at the same interval as their spread width, so this
+        # matches QuotesManager._round_strike_to_interval() without the symbol dispatch
+        rounded_strike = int(round(float(short_strike) / width) * width)
         
         # Calculate quantity using contract scaling if not provided
         # Only recalculate if quantity is None (not provided)
@@ -151,41 +242,45 @@ class OrderManager:
                 logger.warning(f"Failed to calculate contracts using scaling: {e}. Using default quantity of 1 contract")
                 quantity = 1
         else:
-            # Quantity was explicitly provided, log scaling info for reference
-            try:
-                option_buying_power = self.account_mgr.get_option_buying_power(account_number)
-                scaling_info = self.contract_scaler.get_scaling_info(option_buying_power)
-                recommended = scaling_info.get('contracts', quantity)
-                logger.info(f"Contract scaling info: Option Buying Power=${option_buying_power:,.2f}, Recommended={recommended}, Using={quantity} (explicitly provided)")
-                if recommended != quantity:
-                    logger.warning(f"⚠️  Quantity mismatch: Recommended {recommended} contracts but using {quantity} contracts")
-            except Exception as e:
-                logger.debug(f"Could not get scaling info: {e}")
-        
-        # Log strategy parameters being used
-        logger.info(f"Placing credit spread order based on strategy parameters:")
-        logger.info(f"  Symbol: {symbol_upper} (from strategy)")
-        logger.info(f"  Date: {date} (from strategy breakout detection)")
-        logger.info(f"  Bias: {bias_normalized} (from breakout direction)")
-        logger.info(f"  Short Strike: ${rounded_strike} (midpoint from opening range, rounded from ${short_strike})")
-        logger.info(f"  Spread Width: ${width} ({symbol_upper} default)")
-        logger.info(f"  Quantity: {quantity} contracts (FINAL - will be used in order)")
-        
-        # Get quote for the credit spread
-        logger.info(f"Getting quote for {symbol_upper} credit spread:")
-        logger.info(f"  Date: {date}, Bias: {bias_normalized}, Short Strike: ${rounded_strike}")
-        
-        # Get quote using strategy parameters
+            # Quantity was explicitly provided; the scaling info is only logged for
+            # reference, so look it up in the background rather than before the order
+            _background_executor.submit(self._log_scaling_info, account_number, quantity)
+        
+        # Log strategy parameters being used, as one record
+        logger.info(
+            "Placing credit spread order based on strategy parameters:\n"
+            "  Symbol: %s (from strategy)\n"
+            "  Date: %s (from strategy breakout detection)\n"
+            "  Bias: %s (from breakout direction)\n"
+            "  Short Strike: $%s (midpoint from opening range, rounded from $%s)\n"
+            "  Spread Width: $%s (%s default)\n"
+            "  Quantity: %s contracts (FINAL - will be used in order)\n"
+            "Getting quote for %s credit spread:\n"
+            "  Date: %s, Bias: %s, Short Strike: $%s",
+            symbol_upper, date, bias_normalized, rounded_strike, short_strike, width, symbol_upper,
+            quantity, symbol_upper, date, bias_normalized, rounded_strike
+        )
+        
+        # The spread quote, underlying price and account hash are independent lookups,
+        # so put all three on the wire at once instead of paying for three round trips
         # bias_normalized determines spread type:
         # - 'bearish' → Call Credit Spread (sell call at short_strike, buy call at short_strike + width)
         # - 'bullish' → Put Credit Spread (sell put at short_strike, buy put at short_strike - width)
-        spread_quote = self.quotes_mgr.get_credit_spread_quote_by_bias(
-            symbol=underlying_symbol,
-            bias=bias_normalized,
-            short_strike=rounded_strike,
-            width=width,
-            expiration_date=date
-        )
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            spread_quote_future = executor.submit(
+                self.quotes_mgr.get_credit_spread_quote_by_bias,
+                symbol=underlying_symbol,
+                bias=bias_normalized,
+                short_strike=rounded_strike,
+                width=width,
+                expiration_date=date
+            )
+            underlying_future = executor.submit(self._get_underlying_price, spec['quote'])
+            account_hash_future = executor.submit(self.account_mgr.get_account_hash, account_number)
+            spread_quote = spread_quote_future.result()
+            # Capture underlying SPX price at order placement time
+            underlying_price_at_fill = underlying_future.result()
+            account_hash = account_hash_future.result()
         
         spread_info = spread_quote.get('spread_info', {})
         net_mid = spread_info.get('net_mid', 0)
@@ -193,66 +288,49 @@ class OrderManager:
         long_strike_actual = spread_info.get('long_strike')
         spread_type = spread_info.get('spread_type', '')
         
-        # Capture underlying SPX price at order placement time
-        underlying_price_at_fill = None
-        try:
-            # Get SPX price (for SPXW) or XSP price (for XSP)
-            underlying_symbol_for_quote = '$SPX' if symbol_upper == 'SPXW' else '$XSP'
-            underlying_quote = self.quotes_mgr.get_quotes(underlying_symbol_for_quote, fields='quote')
-            if underlying_quote and underlying_symbol_for_quote in underlying_quote:
-                quote_data = underlying_quote[underlying_symbol_for_quote].get('quote', {})
-                underlying_price_at_fill = quote_data.get('lastPrice') or quote_data.get('mark')
-                logger.info(f"Underlying price at order placement: ${underlying_price_at_fill:.2f} ({underlying_symbol_for_quote})")
-        except Exception as e:
-            logger.warning(f"Could not get underlying price at order placement: {e}")
-        
         # Use provided order_price if given, otherwise use net_mid from quote
         # This ensures we use the validated price (which may be higher than minimum)
         if order_price is not None:
             price_to_use = order_price
-            logger.info(f"Using provided order price: ${price_to_use:.2f}")
+            price_source = "provided order"
         else:
             price_to_use = net_mid
-            logger.info(f"Using quote mid price: ${price_to_use:.2f}")
-        
-        logger.info(f"Spread quote: Net Mid=${net_mid:.2f}")
-        logger.info(f"  Short Strike: ${short_strike_actual}, Long Strike: ${long_strike_actual}")
-        logger.info(f"  Order will be placed at: ${price_to_use:.2f}")
+            price_source = "quote mid"
         
         # Get option symbols for both legs
-        if 'PUT' in spread_type.upper():
+        spread_type_upper = spread_type.upper()
+        if 'PUT' in spread_type_upper:
             option_type = 'P'
-        elif 'CALL' in spread_type.upper():
+        elif 'CALL' in spread_type_upper:
             option_type = 'C'
         else:
             raise ValueError(f"Could not determine option type from spread_type: {spread_type}")
         
-        # Format option symbols
-        short_symbol = self.quotes_mgr._format_option_symbol(
-            underlying_symbol, date, option_type, short_strike_actual
-        )
-        long_symbol = self.quotes_mgr._format_option_symbol(
-            underlying_symbol, date, option_type, long_strike_actual
+        # Format option symbols; both legs share everything but the strike
+        symbol_prefix = self.quotes_mgr._format_option_symbol_prefix(underlying_symbol, date, option_type)
+        short_symbol = f"{symbol_prefix}{int(short_strike_actual) * 1000:08d}"
+        long_symbol = f"{symbol_prefix}{int(long_strike_actual) * 1000:08d}"
+        
+        logger.info(
+            "Using %s price: $%.2f\n"
+            "Spread quote: Net Mid=$%.2f\n"
+            "  Short Strike: $%s, Long Strike: $%s\n"
+            "  Order will be placed at: $%.2f\n"
+            "Short leg: %s\n"
+            "Long leg: %s\n"
+            "Placing order in account: %s",
+            price_source, price_to_use, net_mid, short_strike_actual, long_strike_actual,
+            price_to_use, short_symbol, long_symbol, account_number or 'default'
         )
         
-        logger.info(f"Short leg: {short_symbol}")
-        logger.info(f"Long leg: {long_symbol}")
-        
-        # Get account hash
-        account_hash = self.account_mgr.get_account_hash(account_number)
-        logger.info(f"Placing order in account: {account_number or 'default'}")
-        
         # Build order JSON
         # For credit spreads:
         # - SELL_TO_OPEN the short leg (the one we're selling for credit)
         # - BUY_TO_OPEN the long leg (the one we're buying for protection)
         # Note: Order matters - short leg should be second in the array for NET_CREDIT orders
         order = {
-            "orderType": "NET_CREDIT",
-            "session": "NORMAL",
+            **_ORDER_TEMPLATE,
             "price": f"{price_to_use:.2f}",  # Use validated price (actual mid, not minimum)
-            "duration": "DAY",
-            "orderStrategyType": "SINGLE",
             "orderLegCollection": [
                 {
                     "instruction": "BUY_TO_OPEN",
@@ -273,41 +351,42 @@ class OrderManager:
             ]
         }
         
-        logger.info(f"Order JSON structure:")
-        logger.info(f"  Order Type: NET_CREDIT")
-        logger.info(f"  Price: ${price_to_use:.2f}")
-        logger.info(f"  Quantity: {quantity}")
-        logger.info(f"  Long Leg: {long_symbol} (BUY_TO_OPEN)")
-        logger.info(f"  Short Leg: {short_symbol} (SELL_TO_OPEN)")
-        
-        logger.info(f"Placing order: {order}")
+        logger.info(
+            "Order JSON structure:\n"
+            "  Order Type: NET_CREDIT\n"
+            "  Price: $%.2f\n"
+            "  Quantity: %s\n"
+            "  Long Leg: %s (BUY_TO_OPEN)\n"
+            "  Short Leg: %s (SELL_TO_OPEN)",
+            price_to_use, quantity, long_symbol, short_symbol
+        )
+        # The summary above has every field; the raw dict is only for debugging
+        logger.debug("Placing order: %s", order)
         
         # Place the order
         # Note: The endpoint should be relative to the base URL (which includes /v1)
         endpoint = f'/accounts/{account_hash}/orders'
         
+        # Allow for the broker's clock running slightly behind ours
+        submitted_at = datetime.now(timezone.utc) - timedelta(seconds=ORDER_CLOCK_SKEW)
         try:
             response = self.client._make_request('POST', endpoint, json_data=order)
-            logger.info("Order placed successfully")
+            location_match = _LOCATION_ORDER_ID_RE.search(response.get('location') or '')
+            placed_order_id = location_match.group(1) if location_match else None
+            logger.info(f"Order placed successfully (Order ID: {placed_order_id or 'not in response'})")
+            # The order ties up buying power, so don't size the next one from cached balances
+            self.account_mgr.invalidate_balances(account_number)
             
-            # Check order status by getting recent orders
+            # Check order status by finding the order in today's orders
             logger.info("Checking order status...")
-            import time
-            time.sleep(1)  # Wait a moment for order to be processed
-            
-            # Get orders executed today to find our order
-            recent_orders = self.account_mgr.get_orders_executed_today(
-                account_number=account_number,
-                max_results=10
-            )
+            latest_order = self._await_order_visible(account_number, placed_order_id, submitted_at)
             
-            if recent_orders:
-                # Find the most recent order (should be ours)
-                latest_order = recent_orders[0]
-                logger.info(f"Latest order found:")
-                logger.info(f"  Order ID: {latest_order.get('orderId', 'N/A')}")
-                logger.info(f"  Status: {latest_order.get('status', 'N/A')}")
-                logger.info(f"  Entered Time: {latest_order.get('enteredTime', 'N/A')}")
+            if latest_order:
+                logger.info(
+                    "Latest order found:\n  Order ID: %s\n  Status: %s\n  Entered Time: %s",
+                    latest_order.get('orderId', 'N/A'), latest_order.get('status', 'N/A'),
+                    latest_order.get('enteredTime', 'N/A')
+                )
                 
                 # Add order details to response
                 response['order_details'] = latest_order
@@ -315,20 +394,22 @@ class OrderManager:
                 # Add underlying price to response (captured at order placement time)
                 if underlying_price_at_fill is not None:
                     response['underlying_price_at_fill'] = underlying_price_at_fill
-                    response['underlying_symbol'] = 'SPX' if symbol_upper == 'SPXW' else 'XSP'
+                    response['underlying_symbol'] = spec['quote'].lstrip('$')
                 
-                # Generate report for the order
-                self._generate_order_report(
-                    order_details=latest_order,
-                    symbol=symbol_upper,
-                    bias=bias_normalized,
-                    short_strike=short_strike_actual,
-                    long_strike=long_strike_actual,
-                    net_mid=net_mid,
-                    date=date,
-                    opening_range_data=opening_range_data,
-                    breakout_data=breakout_data
-                )
+                # Write the report in the background; it is only for later review
+                if self._reports_enabled:
+                    _background_executor.submit(
+                        self._generate_order_report,
+                        order_details=latest_order,
+                        symbol=symbol_upper,
+                        bias=bias_normalized,
+                        short_strike=short_strike_actual,
+                        long_strike=long_strike_actual,
+                        net_mid=net_mid,
+                        date=date,
+                        opening_range_data=opening_range_data,
+                        breakout_data=breakout_data
+                    )
             else:
                 logger.warning("Could not find order in recent orders list")
             
@@ -337,19 +418,105 @@ class OrderManager:
             # If there's an error, try to get more details
             logger.error(f"Error placing order: {e}")
             # Try to get the raw response
-            import requests
             url = f"{self.client.base_url}{endpoint}"
             headers = self.client.auth.get_headers()
             try:
-                raw_response = requests.post(url, headers=headers, json=order)
+                # Same pooled keep-alive connections as the original request
+                raw_response = get_session().post(url, headers=headers, json=order, timeout=10)
                 logger.error(f"Response status: {raw_response.status_code}")
                 if raw_response.status_code in [200, 201, 204]:
                     logger.info("Order may have been placed successfully (check your account)")
                 logger.error(f"Response text: {raw_response.text[:500]}")
-            except:
+            except requests.RequestException:
                 pass
             raise
     
+    def _log_scaling_info(self, account_number: Optional[str], quantity: int) -> None:
+        """
+        Log the contract count scaling would recommend next to an explicitly provided quantity.
+        
+        Args:
+            account_number: Account whose option buying power to scale from
+            quantity: Quantity the order is being placed with
+        """
+        try:
+            option_buying_power = self.account_mgr.get_option_buying_power(account_number)
+            scaling_info = self.contract_scaler.get_scaling_info(option_buying_power)
+            recommended = scaling_info.get('contracts', quantity)
+            logger.info(f"Contract scaling info: Option Buying Power=${option_buying_power:,.2f}, Recommended={recommended}, Using={quantity} (explicitly provided)")
+            if recommended != quantity:
+                logger.warning(f"⚠️  Quantity mismatch: Recommended {recommended} contracts but using {quantity} contracts")
+        except Exception as e:
+            logger.debug(f"Could not get scaling info: {e}")
+    
+    def _await_order_visible(
+        self,
+        account_number: Optional[str],
+        order_id: Optional[str],
+        submitted_at: datetime
+    ) -> Optional[Dict]:
+        """
+        Poll today's orders with a short backoff until the placed order shows up.
+        
+        The order is matched on order_id when the POST returned one, otherwise on
+        being the newest order entered after submitted_at. If it has not shown up
+        once the polls run out, the newest order is taken instead.
+        
+        Args:
+            account_number: Account the order was placed in. If None, uses first account.
+            order_id: Order ID from the POST's Location header, if any
+            submitted_at: UTC time the order was sent (less a clock skew allowance)
+        
+        Returns:
+            dict: The placed order (or the newest order), or None if no orders were returned
+        """
+        recent_orders = None
+        for delay in ORDER_POLL_DELAYS:
+            time.sleep(delay)
+            recent_orders = self.account_mgr.get_orders_executed_today(
+                account_number=account_number,
+                max_results=10
+            ) or recent_orders
+            if not recent_orders:
+                continue
+            if order_id:
+                for order in recent_orders:
+                    if str(order.get('orderId', '')) == order_id:
+                        return order
+                continue
+            # Most recent first; anything entered before the POST belongs to an earlier order
+            entered_at = _parse_entered_time(recent_orders[0].get('enteredTime'))
+            if entered_at is not None and entered_at >= submitted_at:
+                return recent_orders[0]
+        
+        if not recent_orders:
+            return None
+        logger.warning(
+            f"Order {order_id or '(no ID in response)'} not confirmed in recent orders, using the most recent order"
+        )
+        return recent_orders[0]
+    
+    def _get_underlying_price(self, underlying_symbol_for_quote: str) -> Optional[float]:
+        """
+        Get the current underlying index price.
+        
+        Args:
+            underlying_symbol_for_quote: Index quote symbol, '$SPX' (for SPXW) or '$XSP' (for XSP)
+        
+        Returns:
+            float: Last (or mark) price, or None if it could not be fetched
+        """
+        try:
+            underlying_quote = self.quotes_mgr.get_quotes(underlying_symbol_for_quote, fields='quote')
+            if underlying_quote and underlying_symbol_for_quote in underlying_quote:
+                quote_data = underlying_quote[underlying_symbol_for_quote].get('quote', {})
+                underlying_price = quote_data.get('lastPrice') or quote_data.get('mark')
+                logger.info(f"Underlying price at order placement: ${underlying_price:.2f} ({underlying_symbol_for_quote})")
+                return underlying_price
+        except Exception as e:
+            logger.warning(f"Could not get underlying price at order placement: {e}")
+        return None
+    
     def _generate_order_report(
         self,
         order_details: Dict,
@@ -379,19 +546,16 @@ class OrderManager:
         Returns:
             str: Path to the generated report file
         """
-        order_id = order_details.get('orderId', 'UNKNOWN')
-        entered_time = order_details.get('enteredTime', '')
-        status = order_details.get('status', 'UNKNOWN')
+        og = order_details.get
+        order_id = og('orderId', 'UNKNOWN')
+        entered_time = og('enteredTime', '')
+        status = og('status', 'UNKNOWN')
         
         # Parse date for filename (use expiration date, not order time)
         # Convert YYMMDD format to YYYY-MM-DD for readability
         try:
-            # date is in YYMMDD format (e.g., '251114')
-            year = 2000 + int(date[:2])
-            month = int(date[2:4])
-            day = int(date[4:6])
-            date_formatted = f"{year:04d}-{month:02d}-{day:02d}"
-        except:
+            date_formatted = _yymmdd_to_iso(date)
+        except (TypeError, ValueError):
             # Fallback to current date if parsing fails
             date_formatted = datetime.now().strftime('%Y-%m-%d')
         
@@ -400,128 +564,119 @@ class OrderManager:
         filename = f"{symbol}_{date_formatted}_{bias.upper()}.txt"
         filepath = os.path.join(self.reports_dir, filename)
         
-        # Build report content
-        report_lines = []
-        report_lines.append("=" * 80)
-        report_lines.append("CREDIT SPREAD ORDER REPORT")
-        report_lines.append("=" * 80)
-        report_lines.append("")
-        
-        # Order Information
-        report_lines.append("ORDER INFORMATION")
-        report_lines.append("-" * 80)
-        report_lines.append(f"Order ID:           {order_id}")
-        report_lines.append(f"Status:            {status}")
-        report_lines.append(f"Entered Time:       {entered_time}")
-        report_lines.append(f"Order Type:        {order_details.get('orderType', 'N/A')}")
-        report_lines.append(f"Session:           {order_details.get('session', 'N/A')}")
-        report_lines.append(f"Duration:          {order_details.get('duration', 'N/A')}")
-        report_lines.append(f"Quantity:          {order_details.get('quantity', 0)}")
-        report_lines.append(f"Filled Quantity:   {order_details.get('filledQuantity', 0)}")
-        report_lines.append(f"Remaining Qty:     {order_details.get('remainingQuantity', 0)}")
-        report_lines.append(f"Cancelable:        {order_details.get('cancelable', False)}")
-        report_lines.append(f"Editable:          {order_details.get('editable', False)}")
-        report_lines.append("")
-        
-        # Strategy Parameters
-        report_lines.append("STRATEGY PARAMETERS")
-        report_lines.append("-" * 80)
-        report_lines.append(f"Symbol:            {symbol}")
-        report_lines.append(f"Bias:              {bias.upper()}")
-        report_lines.append(f"Expiration Date:   {date} (YYMMDD format)")
-        report_lines.append("")
+        # Build report content one section at a time, each as a single f-string
+        rule = "=" * 80
+        dashes = "-" * 80
+        header = f"""{rule}
+CREDIT SPREAD ORDER REPORT
+{rule}
+
+ORDER INFORMATION
+{dashes}
+Order ID:           {order_id}
+Status:            {status}
+Entered Time:       {entered_time}
+Order Type:        {og('orderType', 'N/A')}
+Session:           {og('session', 'N/A')}
+Duration:          {og('duration', 'N/A')}
+Quantity:          {og('quantity', 0)}
+Filled Quantity:   {og('filledQuantity', 0)}
+Remaining Qty:     {og('remainingQuantity', 0)}
+Cancelable:        {og('cancelable', False)}
+Editable:          {og('editable', False)}
+
+STRATEGY PARAMETERS
+{dashes}
+Symbol:            {symbol}
+Bias:              {bias.upper()}
+Expiration Date:   {date} (YYMMDD format)
+
+"""
         
         # Opening Range Data
         if opening_range_data:
             orh = opening_range_data.get('high')
             orl = opening_range_data.get('low')
             midpoint = opening_range_data.get('midpoint')
-            report_lines.append("Opening Range:")
+            opening_range = "Opening Range:\n"
             if orh is not None:
-                report_lines.append(f"  ORH (High):       ${orh:.2f}")
+                opening_range += f"  ORH (High):       ${orh:.2f}\n"
             if orl is not None:
-                report_lines.append(f"  ORL (Low):        ${orl:.2f}")
+                opening_range += f"  ORL (Low):        ${orl:.2f}\n"
             if midpoint is not None:
-                report_lines.append(f"  Midpoint:        ${midpoint:.2f}")
+                opening_range += f"  Midpoint:        ${midpoint:.2f}\n"
         else:
-            report_lines.append("Opening Range:     N/A")
-        report_lines.append("")
+            opening_range = "Opening Range:     N/A\n"
         
         # Breakout Candle Data
         if breakout_data:
             close_price = breakout_data.get('close_price')
             direction = breakout_data.get('direction', 'N/A')
-            if close_price is not None and opening_range_data:
-                midpoint = opening_range_data.get('midpoint')
+            breakout = ""
+            if close_price is not None:
+                breakout = f"""Breakout Candle:
+  Close Price:     ${close_price:.2f}
+  Direction:       {direction.upper()}
+"""
+                midpoint = opening_range_data.get('midpoint') if opening_range_data else None
                 if midpoint is not None:
-                    distance = abs(close_price - midpoint)
-                    report_lines.append("Breakout Candle:")
-                    report_lines.append(f"  Close Price:     ${close_price:.2f}")
-                    report_lines.append(f"  Direction:       {direction.upper()}")
-                    report_lines.append(f"  Distance from Midpoint: ${distance:.2f}")
-                else:
-                    report_lines.append("Breakout Candle:")
-                    report_lines.append(f"  Close Price:     ${close_price:.2f}")
-                    report_lines.append(f"  Direction:       {direction.upper()}")
-            elif close_price is not None:
-                report_lines.append("Breakout Candle:")
-                report_lines.append(f"  Close Price:     ${close_price:.2f}")
-                report_lines.append(f"  Direction:       {direction.upper()}")
+                    breakout += f"  Distance from Midpoint: ${abs(close_price - midpoint):.2f}\n"
         else:
-            report_lines.append("Breakout Candle:   N/A")
-        report_lines.append("")
+            breakout = "Breakout Candle:   N/A\n"
         
         # Spread Details
-        report_lines.append("SPREAD DETAILS")
-        report_lines.append("-" * 80)
         spread_type = "Call Credit Spread" if bias == 'bearish' else "Put Credit Spread"
-        report_lines.append(f"Spread Type:       {spread_type}")
-        report_lines.append(f"Short Strike:       ${short_strike:.2f}")
-        report_lines.append(f"Long Strike:      ${long_strike:.2f}")
         width = abs(long_strike - short_strike)
-        report_lines.append(f"Width:             ${width:.2f}")
-        report_lines.append(f"Net Mid Price:     ${net_mid:.2f}")
-        report_lines.append(f"Max Profit:        ${net_mid:.2f} (net credit)")
         max_loss = width - net_mid
-        report_lines.append(f"Max Loss:          ${max_loss:.2f}")
         if bias == 'bearish':
             breakeven = short_strike + net_mid
         else:
             breakeven = short_strike - net_mid
-        report_lines.append(f"Breakeven:         ${breakeven:.2f}")
-        report_lines.append("")
+        spread = f"""
+SPREAD DETAILS
+{dashes}
+Spread Type:       {spread_type}
+Short Strike:       ${short_strike:.2f}
+Long Strike:      ${long_strike:.2f}
+Width:             ${width:.2f}
+Net Mid Price:     ${net_mid:.2f}
+Max Profit:        ${net_mid:.2f} (net credit)
+Max Loss:          ${max_loss:.2f}
+Breakeven:         ${breakeven:.2f}
+
+ORDER LEGS
+{dashes}
+"""
         
         # Order Legs
-        report_lines.append("ORDER LEGS")
-        report_lines.append("-" * 80)
-        order_legs = order_details.get('orderLegCollection', [])
-        for i, leg in enumerate(order_legs, 1):
-            instrument = leg.get('instrument', {})
-            report_lines.append(f"Leg {i}:")
-            report_lines.append(f"  Instruction:     {leg.get('instruction', 'N/A')}")
-            report_lines.append(f"  Symbol:          {instrument.get('symbol', 'N/A')}")
-            report_lines.append(f"  Description:      {instrument.get('description', 'N/A')}")
-            report_lines.append(f"  Quantity:        {leg.get('quantity', 0)}")
-            report_lines.append(f"  Asset Type:      {instrument.get('assetType', 'N/A')}")
-            report_lines.append(f"  Put/Call:        {instrument.get('putCall', 'N/A')}")
-            report_lines.append("")
-        
-        # Account Information
-        report_lines.append("ACCOUNT INFORMATION")
-        report_lines.append("-" * 80)
-        report_lines.append(f"Account Number:    {order_details.get('accountNumber', 'N/A')}")
-        report_lines.append("")
-        
-        # Footer
-        report_lines.append("=" * 80)
-        report_lines.append(f"Report Generated:  {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report_lines.append(f"Report File:       {filename}")
-        report_lines.append("=" * 80)
-        
-        # Write report to file
+        legs = []
+        for i, leg in enumerate(og('orderLegCollection', []), 1):
+            lg = leg.get
+            ig = lg('instrument', {}).get
+            legs.append(f"""Leg {i}:
+  Instruction:     {lg('instruction', 'N/A')}
+  Symbol:          {ig('symbol', 'N/A')}
+  Description:      {ig('description', 'N/A')}
+  Quantity:        {lg('quantity', 0)}
+  Asset Type:      {ig('assetType', 'N/A')}
+  Put/Call:        {ig('putCall', 'N/A')}
+
+""")
+        
+        # Account Information and footer
+        footer = f"""ACCOUNT INFORMATION
+{dashes}
+Account Number:    {og('accountNumber', 'N/A')}
+
+{rule}
+Report Generated:  {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Report File:       {filename}
+{rule}"""
+        
+        # Write report to file section by section, without joining it into one string first
         try:
-            with open(filepath, 'w') as f:
-                f.write('\n'.join(report_lines))
+            with open(filepath, 'w', buffering=1 << 16) as f:
+                f.writelines([header, opening_range, '\n', breakout, spread, *legs, footer])
             logger.info(f"Order report generated: {filepath}")
             return filepath
         except Exception as e:
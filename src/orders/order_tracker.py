@@ -1,55 +1,183 @@
 """Order Tracker - Tracks placed orders to prevent duplicates."""
 import os
-import json
+import re
 import logging
-from datetime import datetime, date
-from typing import Optional, Dict, List
+import threading
+from datetime import datetime, date, timedelta
+from typing import Iterator, Optional, Dict, List, Set, Tuple
+import orjson
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# YYYY-MM-DD at the start of a record's placed_at
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+def _file_stamp(st: os.stat_result) -> Tuple[int, int, int]:
+    """Identify a version of the tracking file: (inode, mtime in ns, size)."""
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
 
 class OrderTracker:
     """
     Tracks placed orders to prevent duplicate orders on the same day.
-    Stores order information in a JSON file.
+    Stores order information in an append-only JSON Lines file, one order per line.
     """
     
-    def __init__(self, tracking_file: str = 'order_tracking.json'):
+    def __init__(self, tracking_file: str = 'order_tracking.jsonl'):
         """
         Initialize the order tracker.
         
         Args:
-            tracking_file: Path to the JSON file storing order tracking data
+            tracking_file: Path to the JSON Lines file storing order tracking data
         """
         # Store tracking file in project root
         project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
         self.tracking_file = os.path.join(project_root, tracking_file)
+        # Keeps an append from landing in the old file while clear_old_data() replaces it
+        self._write_lock = threading.Lock()
+        # (YYYY-MM-DD, orders placed that day, their upper-cased symbols),
+        # loaded from the file once per day
+        self._today_cache: Optional[Tuple[str, List[Dict], Set[str]]] = None
+        # _file_stamp() of the tracking file as of the cache above, so a write by
+        # another process (or a compaction) is noticed with one stat() per lookup
+        self._cache_stamp: Optional[Tuple[int, int, int]] = None
         self._ensure_tracking_file()
         logger.info(f"OrderTracker initialized with tracking file: {self.tracking_file}")
     
     def _ensure_tracking_file(self):
-        """Create tracking file if it doesn't exist."""
+        """Create tracking file if it doesn't exist, converting a legacy JSON file once."""
         if not os.path.exists(self.tracking_file):
-            with open(self.tracking_file, 'w') as f:
-                json.dump({}, f)
-            logger.info(f"Created tracking file: {self.tracking_file}")
+            legacy_file = f"{os.path.splitext(self.tracking_file)[0]}.json"
+            if os.path.exists(legacy_file):
+                self._migrate_legacy_file(legacy_file)
+            else:
+                open(self.tracking_file, 'a').close()
+                logger.info(f"Created tracking file: {self.tracking_file}")
     
-    def _load_tracking_data(self) -> Dict:
-        """Load tracking data from file."""
+    def _migrate_legacy_file(self, legacy_file: str):
+        """
+        Convert the legacy {YYYY-MM-DD: [orders]} JSON file to JSON Lines.
+        
+        The legacy file is left in place; it is no longer read once the JSON
+        Lines file exists.
+        
+        Args:
+            legacy_file: Path to the legacy order_tracking.json
+        """
         try:
-            with open(self.tracking_file, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
+            with open(legacy_file, 'rb') as f:
+                legacy_data = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"Could not read legacy tracking file {legacy_file}: {e}")
+            legacy_data = {}
+        
+        records = []
+        if isinstance(legacy_data, dict):
+            for day_str in sorted(legacy_data):
+                for record in legacy_data[day_str] or []:
+                    if isinstance(record, dict):
+                        # Orders are looked up by placed_at, which legacy records filed by day always had
+                        record.setdefault('placed_at', f"{day_str}T00:00:00")
+                        records.append(record)
+        
+        tmp_file = f"{self.tracking_file}.tmp"
+        with open(tmp_file, 'wb') as f:
+            for record in records:
+                f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.tracking_file)
+        logger.info(f"Migrated {len(records)} order(s) from {legacy_file} to {self.tracking_file}")
     
-    def _save_tracking_data(self, data: Dict):
-        """Save tracking data to file."""
+    def _read_records(self, contains: Optional[bytes] = None) -> Iterator[Dict]:
+        """
+        Yield every order record in the tracking file, oldest first.
+        
+        Lines that do not parse (e.g. a write cut short by a crash) are skipped.
+        
+        Args:
+            contains: Only parse lines containing these bytes; the rest, with their
+                      order_details, are skipped without being decoded
+        """
         try:
-            with open(self.tracking_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(self.tracking_file, 'rb') as f:
+                for line in f:
+                    if contains is not None and contains not in line:
+                        continue
+                    try:
+                        record = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        continue
+                    if isinstance(record, dict):
+                        yield record
+        except FileNotFoundError:
+            return
+    
+    def _load_orders_for(self, day_str: str) -> List[Dict]:
+        """
+        Load the orders placed on one day.
+        
+        Args:
+            day_str: Date in YYYY-MM-DD format
+        
+        Returns:
+            list: Order records whose placed_at falls on that day
+        """
+        # Every record placed that day has the date in its line; other lines may
+        # mention it too (e.g. inside order_details), so placed_at is still checked
+        return [record for record in self._read_records(day_str.encode())
+                if record.get('placed_at', '').startswith(day_str)]
+    
+    def _get_today(self) -> Tuple[List[Dict], Set[str]]:
+        """
+        Get today's orders from memory, re-reading the tracking file when the day changes.
+        
+        Each call stats the file and also re-reads it when its _file_stamp() differs
+        from the one the cache was loaded under (another process appended, or the
+        file was compacted).
+        
+        Returns:
+            tuple: (today's order records, set of their upper-cased symbols) - the
+                   cached objects themselves; do not modify
+        """
+        today_str = date.today().isoformat()
+        try:
+            stamp = _file_stamp(os.stat(self.tracking_file))
+        except FileNotFoundError:
+            stamp = None
+        cached = self._today_cache
+        if cached is None or cached[0] != today_str or stamp != self._cache_stamp:
+            # Stamp taken before the read: a write landing in between only causes a reload later
+            self._cache_stamp = stamp
+            orders = self._load_orders_for(today_str)
+            symbols = {order.get('symbol', '').upper() for order in orders}
+            cached = (today_str, orders, symbols)
+            self._today_cache = cached
+        return cached[1], cached[2]
+    
+    def _append_record(self, record: Dict) -> bool:
+        """
+        Append one order record to the tracking file and flush it to disk.
+        
+        Returns:
+            bool: True if the record was written, False if the write failed (logged)
+        """
+        try:
+            with self._write_lock, open(self.tracking_file, 'ab') as f:
+                before = _file_stamp(os.fstat(f.fileno()))
+                f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+                f.flush()
+                os.fsync(f.fileno())
+                # The caller adds the record to the cache itself; only carry the cache
+                # forward if nobody else wrote to the file since it was loaded
+                if before == self._cache_stamp:
+                    self._cache_stamp = _file_stamp(os.fstat(f.fileno()))
         except Exception as e:
             logger.error(f"Failed to save tracking data: {e}")
+            return False
+        return True
     
     def has_order_placed_today(self, symbol: Optional[str] = None) -> bool:
         """
@@ -61,21 +189,17 @@ class OrderTracker:
         Returns:
             bool: True if an order has been placed today, False otherwise
         """
-        today_str = date.today().isoformat()
-        tracking_data = self._load_tracking_data()
+        today_orders, today_symbols = self._get_today()
         
-        if today_str not in tracking_data:
+        if not today_orders:
             return False
         
-        today_orders = tracking_data[today_str]
-        
         if symbol:
             symbol_upper = symbol.upper()
             # Check if there's an order for this specific symbol
-            for order in today_orders:
-                if order.get('symbol', '').upper() == symbol_upper:
-                    logger.info(f"Order already placed today for {symbol_upper}")
-                    return True
+            if symbol_upper in today_symbols:
+                logger.info(f"Order already placed today for {symbol_upper}")
+                return True
             return False
         else:
             # Check if there's any order for today
@@ -93,7 +217,7 @@ class OrderTracker:
         order_details: Optional[Dict] = None,
         underlying_price_at_fill: Optional[float] = None,
         underlying_symbol: Optional[str] = None
-    ):
+    ) -> bool:
         """
         Record a placed order in the tracking file.
         
@@ -105,13 +229,13 @@ class OrderTracker:
             order_details: Optional full order details
             underlying_price_at_fill: Underlying price (SPX/XSP) at order placement time
             underlying_symbol: Underlying symbol ('SPX' or 'XSP')
-        """
-        today_str = date.today().isoformat()
-        tracking_data = self._load_tracking_data()
-        
-        if today_str not in tracking_data:
-            tracking_data[today_str] = []
         
+        Returns:
+            bool: True if the order was written to the tracking file
+        """
+        # Fetched before placed_at is taken, so an order recorded across midnight
+        # lands in a list that is reloaded from the file on the next call
+        today_orders, today_symbols = self._get_today()
         order_record = {
             'order_id': order_id,
             'symbol': symbol.upper(),
@@ -123,12 +247,17 @@ class OrderTracker:
             'underlying_symbol': underlying_symbol
         }
         
-        tracking_data[today_str].append(order_record)
-        self._save_tracking_data(tracking_data)
+        # Only cache what is on disk, so this process and the file agree on what was placed
+        if not self._append_record(order_record):
+            logger.error(f"Order {order_id} for {symbol} ({bias}) was NOT recorded in tracking file")
+            return False
+        today_orders.append(order_record)
+        today_symbols.add(order_record['symbol'])
         
         logger.info(f"Recorded order {order_id} for {symbol} ({bias}) in tracking file")
         if underlying_price_at_fill is not None:
             logger.info(f"  Underlying price at fill: ${underlying_price_at_fill:.2f} ({underlying_symbol})")
+        return True
     
     def get_today_orders(self, symbol: Optional[str] = None) -> List[Dict]:
         """
@@ -140,45 +269,59 @@ class OrderTracker:
         Returns:
             list: List of order records
         """
-        today_str = date.today().isoformat()
-        tracking_data = self._load_tracking_data()
-        
-        if today_str not in tracking_data:
-            return []
-        
-        today_orders = tracking_data[today_str]
+        today_orders, _ = self._get_today()
         
         if symbol:
             symbol_upper = symbol.upper()
             return [order for order in today_orders if order.get('symbol', '').upper() == symbol_upper]
         
-        return today_orders
+        return list(today_orders)
     
     def clear_old_data(self, days_to_keep: int = 30):
         """
         Clear tracking data older than specified days.
         
+        Compacts the file in one pass: the records worth keeping are written to
+        a temporary file that then replaces the tracking file. Run this
+        occasionally (e.g. at startup), not after every order.
+        
         Args:
             days_to_keep: Number of days of history to keep (default: 30)
         """
-        from datetime import timedelta
-        cutoff_date = date.today() - timedelta(days=days_to_keep)
+        cutoff_str = (date.today() - timedelta(days=days_to_keep)).isoformat()
         
-        tracking_data = self._load_tracking_data()
-        dates_to_remove = []
+        with self._write_lock:
+            self._compact(cutoff_str)
+    
+    def _compact(self, cutoff_str: str):
+        """
+        Rewrite the tracking file without records placed before cutoff_str.
         
-        for date_str in tracking_data.keys():
-            try:
-                order_date = datetime.fromisoformat(date_str).date()
-                if order_date < cutoff_date:
-                    dates_to_remove.append(date_str)
-            except:
-                dates_to_remove.append(date_str)
+        Args:
+            cutoff_str: Oldest date to keep, in YYYY-MM-DD format
+        """
+        kept = []
+        removed = 0
+        for record in self._read_records():
+            placed_at = record.get('placed_at')
+            # ISO dates sort as strings, so compare the date prefix without parsing it;
+            # records without a well-formed date are dropped
+            if isinstance(placed_at, str) and _ISO_DATE_RE.match(placed_at) and placed_at[:10] >= cutoff_str:
+                kept.append(record)
+            else:
+                removed += 1
         
-        for date_str in dates_to_remove:
-            del tracking_data[date_str]
-            logger.info(f"Removed old tracking data for {date_str}")
+        if not removed:
+            return
         
-        if dates_to_remove:
-            self._save_tracking_data(tracking_data)
-
+        tmp_file = f"{self.tracking_file}.tmp"
+        try:
+            with open(tmp_file, 'wb') as f:
+                for record in kept:
+                    f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.tracking_file)
+            logger.info(f"Removed {removed} tracking record(s) older than {cutoff_str}")
+        except Exception as e:
+            logger.error(f"Failed to save tracking data: {e}")
@@ -6,6 +6,12 @@ from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Schwab leg instructions: +1 for sells (credit received), -1 for buys (debit paid)
+_INSTRUCTION_SIGN = {
+    'SELL': 1, 'SELL_TO_OPEN': 1, 'SELL_TO_CLOSE': 1, 'SELL_SHORT': 1, 'SELL_SHORT_EXEMPT': 1,
+    'BUY': -1, 'BUY_TO_OPEN': -1, 'BUY_TO_CLOSE': -1, 'BUY_TO_COVER': -1,
+}
+
 
 def get_actual_fill_credit_from_order(order_details: Dict) -> Optional[float]:
     """
@@ -49,12 +55,7 @@ def get_actual_fill_credit_from_order(order_details: Dict) -> Optional[float]:
         logger.warning("Order has no orderLegCollection")
         return None
     
-    leg_map = {}
-    for leg in order_legs:
-        leg_id = leg.get('legId')
-        instruction = leg.get('instruction', '')
-        if leg_id is not None:
-            leg_map[leg_id] = instruction
+    leg_map = {leg['legId']: leg.get('instruction', '') for leg in order_legs if leg.get('legId') is not None}
     
     if not leg_map:
         logger.warning("Could not build leg map from orderLegCollection")
@@ -87,12 +88,13 @@ def get_actual_fill_credit_from_order(order_details: Dict) -> Optional[float]:
             continue
         
         instruction = leg_map.get(leg_id, '')
+        sign = _INSTRUCTION_SIGN.get(instruction, 0)
         
-        if 'SELL' in instruction or 'SELL_TO_OPEN' in instruction:
+        if sign > 0:
             credit = price * quantity
             total_credit += credit
             logger.debug(f"Leg {leg_id} ({instruction}): ${price:.2f} × {quantity} = ${credit:.2f} (credit)")
-        elif 'BUY' in instruction or 'BUY_TO_OPEN' in instruction:
+        elif sign < 0:
             debit = price * quantity
             total_debit += debit
             logger.debug(f"Leg {leg_id} ({instruction}): ${price:.2f} × {quantity} = ${debit:.2f} (debit)")
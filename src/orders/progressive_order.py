@@ -1,18 +1,19 @@
 """Progressive order placement with automatic adjustments for better fill probability."""
 import time
 import logging
-from datetime import datetime, time as dt_time
+from datetime import datetime
 from typing import Optional, Dict
-import pytz
+from zoneinfo import ZoneInfo
 from src.orders.order_manager import OrderManager
 from src.quotes.quotes_manager import QuotesManager
 from src.accounts.account_manager import AccountManager
+from src.config import Config
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
-ET = pytz.timezone('US/Eastern')
-MARKET_CLOSE = dt_time(16, 0)  # 4:00 PM ET
+ET = ZoneInfo('America/New_York')
+MARKET_CLOSE = Config.MARKET_CLOSE  # 4:00 PM ET
 
 
 def place_order_with_progressive_adjustments(
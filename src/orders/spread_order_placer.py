@@ -5,7 +5,7 @@ import re
 import time
 from datetime import datetime
 from typing import Optional, Dict
-from src.client.schwab_client import SchwabClient
+from src.client.schwab_client import SchwabClient, get_shared_client
 from src.accounts.account_manager import AccountManager
 from src.quotes.quotes_manager import QuotesManager
 from src.config import Config
@@ -19,11 +19,16 @@ class SpreadOrderPlacer:
     
     SPREAD_WIDTH = 10.0  # Always 10 points wide
     
-    def __init__(self):
-        """Initialize order placer."""
-        self.client = SchwabClient()
-        self.account_mgr = AccountManager()
-        self.quotes_mgr = QuotesManager(default_symbol='SPXW')
+    def __init__(self, client: Optional[SchwabClient] = None):
+        """
+        Initialize order placer.
+        
+        Args:
+            client: Shared SchwabClient. If None, uses get_shared_client().
+        """
+        self.client = client or get_shared_client()
+        self.account_mgr = AccountManager(client=self.client)
+        self.quotes_mgr = QuotesManager(default_symbol='SPXW', client=self.client)
     
     def place_10wide_credit_spread(
         self,
@@ -138,17 +143,14 @@ class SpreadOrderPlacer:
         
         # Place order via API
         url = f"{self.client.base_url}/accounts/{account_hash}/orders"
-        headers = self.client.auth.get_headers()
-        headers['Content-Type'] = 'application/json'
+        headers = {**self.client.auth.get_headers(), 'Content-Type': 'application/json'}
         
         try:
             response = requests.post(url, json=order, headers=headers, timeout=10)
             
             if response.status_code == 401:
-                logger.info("Token expired, refreshing...")
-                self.client.auth.refresh_access_token()
-                headers = self.client.auth.get_headers()
-                headers['Content-Type'] = 'application/json'
+                self.client.auth.refresh_if_current(headers)
+                headers = {**self.client.auth.get_headers(), 'Content-Type': 'application/json'}
                 response = requests.post(url, json=order, headers=headers, timeout=10)
             
             # Log response details for debugging
@@ -158,6 +160,9 @@ class SpreadOrderPlacer:
             
             response.raise_for_status()
             
+            # The order ties up buying power, so don't serve pre-order balances from cache
+            self.account_mgr.invalidate_balances()
+            
             # Handle 201 Created or empty response body (Schwab API returns 201 Created with empty body)
             # Order ID is in the Location header
             if response.status_code == 201 or response.status_code == 204 or not response.text or response.text.strip() == '':
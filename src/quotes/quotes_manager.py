@@ -2,8 +2,9 @@
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Union
-from src.client.schwab_client import SchwabClient
+from src.client.schwab_client import SchwabClient, get_shared_client
 from src.config import Config
+from src.utils.http import get_session
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -19,15 +20,16 @@ class QuotesManager:
         'XSP': {'SPXW': 10.0}  # XSP to SPXW: multiply by 10
     }
     
-    def __init__(self, default_symbol: Optional[str] = None):
+    def __init__(self, default_symbol: Optional[str] = None, client: Optional[SchwabClient] = None):
         """
         Initialize the quotes manager.
         
         Args:
             default_symbol: Default option symbol to use ('SPXW' or 'XSP').
                           If None, uses Config.DEFAULT_OPTION_SYMBOL.
+            client: Shared SchwabClient. If None, uses get_shared_client().
         """
-        self.client = SchwabClient()
+        self.client = client or get_shared_client()
         # Market data uses a different base URL
         self.market_data_base_url = 'https://api.schwabapi.com/marketdata/v1'
         
@@ -69,7 +71,7 @@ class QuotesManager:
         
         try:
             import requests
-            response = requests.request(
+            response = get_session().request(
                 method=method,
                 url=url,
                 headers=headers,
@@ -78,10 +80,9 @@ class QuotesManager:
             
             # If token expired, try refreshing
             if response.status_code == 401:
-                logger.warning("Token expired, refreshing...")
-                self.client.auth.refresh_access_token()
+                self.client.auth.refresh_if_current(headers)
                 headers = self.client.auth.get_headers()
-                response = requests.request(
+                response = get_session().request(
                     method=method,
                     url=url,
                     headers=headers,
@@ -698,6 +699,23 @@ class QuotesManager:
         strike_formatted = strike_int * 1000
         strike_str = f"{strike_formatted:08d}"
         
+        return f"{self._format_option_symbol_prefix(symbol, expiration_date, option_type)}{strike_str}"
+    
+    def _format_option_symbol_prefix(self, symbol: str, expiration_date: str, option_type: str) -> str:
+        """
+        Format the part of an option symbol before the strike.
+        
+        Build this once when formatting several strikes of the same expiration and
+        type, then append f"{strike * 1000:08d}" for each strike.
+        
+        Args:
+            symbol: Underlying symbol (e.g., 'SPXW' or '$XSP')
+            expiration_date: YYMMDD format
+            option_type: 'C' or 'P'
+        
+        Returns:
+            str: Symbol prefix, e.g. "SPXW  251114C" or "XSP   251114P"
+        """
         # For $XSP, the option symbol uses "XSP" (without $) and 3 spaces
         # For SPXW, it uses 2 spaces
         if symbol == '$XSP':
@@ -707,5 +725,5 @@ class QuotesManager:
             option_symbol_base = symbol
             spaces = '  '  # 2 spaces for SPXW
         
-        return f"{option_symbol_base}{spaces}{expiration_date}{option_type.upper()}{strike_str}"
+        return f"{option_symbol_base}{spaces}{expiration_date}{option_type.upper()}"
 
@@ -10,13 +10,13 @@ from pathlib import Path
 from typing import Dict, Optional, List
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-import pytz
+from zoneinfo import ZoneInfo
 
 from src.accounts.account_manager import AccountManager
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
-ET = pytz.timezone('US/Eastern')
+ET = ZoneInfo('America/New_York')
 
 
 class EODReport:
@@ -194,7 +194,8 @@ class EODReport:
         smtp_server: str = 'smtp.gmail.com',
         smtp_port: int = 587,
         sender_email: Optional[str] = None,
-        sender_password: Optional[str] = None
+        sender_password: Optional[str] = None,
+        smtp_timeout: float = 15
     ) -> bool:
         """
         Send EOD report via email.
@@ -206,6 +207,7 @@ class EODReport:
             smtp_port: SMTP port (default: 587 for TLS)
             sender_email: Sender email address (from environment if None)
             sender_password: Sender password/app password (from environment if None)
+            smtp_timeout: Socket timeout in seconds for each SMTP operation
         
         Returns:
             bool: True if email sent successfully, False otherwise
@@ -261,7 +263,7 @@ class EODReport:
             # Send email
             recipient_list_str = ', '.join(recipients)
             logger.info(f"Sending EOD email to {len(recipients)} recipient(s): {recipient_list_str}")
-            with smtplib.SMTP(smtp_server, smtp_port) as server:
+            with smtplib.SMTP(smtp_server, smtp_port, timeout=smtp_timeout) as server:
                 server.starttls()
                 server.login(sender_email, sender_password)
                 server.sendmail(sender_email, recipients, msg.as_string())
@@ -7,13 +7,13 @@ import os
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
-import pytz
+from zoneinfo import ZoneInfo
 from src.utils.logger import setup_logger
 from src.storage.s3_service import S3Service
 
 logger = setup_logger(__name__)
 
-ET = pytz.timezone('US/Eastern')
+ET = ZoneInfo('America/New_York')
 
 
 class LogArchiver:
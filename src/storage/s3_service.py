@@ -21,7 +21,8 @@ class S3Service:
         bucket_name: Optional[str] = None,
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
-        region_name: str = 'us-east-2'
+        region_name: str = 'us-east-2',
+        session: Optional[boto3.session.Session] = None
     ):
         """
         Initialize S3 service.
@@ -31,6 +32,9 @@ class S3Service:
             aws_access_key_id: AWS access key. If None, reads from environment variable.
             aws_secret_access_key: AWS secret key. If None, reads from environment variable.
             region_name: AWS region name (default: us-east-2)
+            session: Optional boto3 Session to create the client from. Sharing one
+                     session across buckets avoids reloading botocore service models
+                     and repeating credential discovery.
         """
         # Get credentials from environment if not provided
         self.bucket_name = bucket_name or os.getenv('AWS_S3_BUCKET_NAME')
@@ -39,9 +43,10 @@ class S3Service:
         self.region_name = region_name or os.getenv('AWS_REGION', 'us-east-2')
         
         # Initialize S3 client
+        client_factory = session.client if session is not None else boto3.client
         try:
             if aws_access_key_id and aws_secret_access_key:
-                self.s3_client = boto3.client(
+                self.s3_client = client_factory(
                     's3',
                     aws_access_key_id=aws_access_key_id,
                     aws_secret_access_key=aws_secret_access_key,
@@ -50,7 +55,7 @@ class S3Service:
             else:
                 # Use default credentials (IAM role, environment, or ~/.aws/credentials)
                 # This allows S3Service to work on EC2 with IAM role (no credentials needed)
-                self.s3_client = boto3.client('s3', region_name=self.region_name)
+                self.s3_client = client_factory('s3', region_name=self.region_name)
             
             if self.bucket_name:
                 logger.info(f"S3Service initialized for bucket: {self.bucket_name}")
@@ -59,7 +64,7 @@ class S3Service:
         except NoCredentialsError:
             # On EC2 with IAM role, this shouldn't happen, but if it does, log warning
             logger.warning("AWS credentials not found. If using IAM role on EC2, this should work. Continuing anyway...")
-            self.s3_client = boto3.client('s3', region_name=self.region_name)
+            self.s3_client = client_factory('s3', region_name=self.region_name)
         except Exception as e:
             logger.error(f"Failed to initialize S3 client: {e}")
             raise
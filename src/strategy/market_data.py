@@ -1,21 +1,26 @@
 """Market data fetcher for SPX index."""
-import requests
 from datetime import datetime
 from typing import List, Dict, Optional
-import pytz
+from zoneinfo import ZoneInfo
+from src.utils.http import get_session
 from src.utils.logger import setup_logger
-from src.client.schwab_client import SchwabClient
+from src.client.schwab_client import SchwabClient, get_shared_client
 
 logger = setup_logger(__name__)
-ET = pytz.timezone('US/Eastern')
+ET = ZoneInfo('America/New_York')
 
 
 class MarketDataFetcher:
     """Fetches SPX index market data (30-minute candles)."""
     
-    def __init__(self):
-        """Initialize market data fetcher."""
-        self.client = SchwabClient()
+    def __init__(self, client: Optional[SchwabClient] = None):
+        """
+        Initialize market data fetcher.
+        
+        Args:
+            client: Shared SchwabClient. If None, uses get_shared_client().
+        """
+        self.client = client or get_shared_client()
         self.base_url = 'https://api.schwabapi.com/marketdata/v1'
         self.spx_symbol = '$SPX'  # SPX index symbol
     
@@ -42,7 +47,7 @@ class MarketDataFetcher:
         """
         # Create datetime objects for start and end times
         if date.tzinfo is None:
-            date = ET.localize(date)
+            date = date.replace(tzinfo=ET)
         
         day_start = date.replace(hour=start_hour, minute=start_minute, second=0, microsecond=0)
         day_end = date.replace(hour=end_hour, minute=end_minute, second=0, microsecond=0)
@@ -66,13 +71,12 @@ class MarketDataFetcher:
         url = f'{self.base_url}/pricehistory'
         
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = get_session().get(url, headers=headers, params=params, timeout=10)
             
             if response.status_code == 401:
-                logger.info("Token expired, refreshing...")
-                self.client.auth.refresh_access_token()
+                self.client.auth.refresh_if_current(headers)
                 headers = self.client.auth.get_headers()
-                response = requests.get(url, headers=headers, params=params, timeout=10)
+                response = get_session().get(url, headers=headers, params=params, timeout=10)
             
             if response.status_code != 200:
                 logger.error(f"Failed to get candles: {response.status_code} - {response.text}")
@@ -1,20 +1,27 @@
 """Opening Range (OR) calculator for SPX."""
 from datetime import datetime
 from typing import Dict, Optional
-import pytz
+from zoneinfo import ZoneInfo
+from src.client.schwab_client import SchwabClient
+from src.config import Config
 from src.strategy.market_data import MarketDataFetcher
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
-ET = pytz.timezone('US/Eastern')
+ET = ZoneInfo('America/New_York')
 
 
 class OpeningRangeTracker:
     """Tracks the Opening Range (09:30-10:00 ET candle) for SPX."""
     
-    def __init__(self):
-        """Initialize opening range tracker."""
-        self.market_data = MarketDataFetcher()
+    def __init__(self, client: Optional[SchwabClient] = None):
+        """
+        Initialize opening range tracker.
+        
+        Args:
+            client: Shared SchwabClient. If None, uses get_shared_client().
+        """
+        self.market_data = MarketDataFetcher(client=client)
     
     def get_opening_range(self, date: datetime) -> Optional[Dict]:
         """
@@ -30,10 +37,10 @@ class OpeningRangeTracker:
         # Get 30-minute candles for the OR window
         candles = self.market_data.get_30min_candles(
             date,
-            start_hour=9,
-            start_minute=30,
-            end_hour=10,
-            end_minute=0
+            start_hour=Config.OR_START.hour,
+            start_minute=Config.OR_START.minute,
+            end_hour=Config.OR_END.hour,
+            end_minute=Config.OR_END.minute
         )
         
         if not candles:
@@ -1,21 +1,27 @@
 """Quote monitor for checking credit spreads."""
 from datetime import datetime
 from typing import Dict, Optional, Tuple
-import pytz
+from zoneinfo import ZoneInfo
+from src.client.schwab_client import SchwabClient
 from src.quotes.quotes_manager import QuotesManager
 from src.config import Config
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
-ET = pytz.timezone('US/Eastern')
+ET = ZoneInfo('America/New_York')
 
 
 class QuoteMonitor:
     """Monitors option quotes and calculates credit for spreads."""
     
-    def __init__(self):
-        """Initialize quote monitor."""
-        self.quotes_mgr = QuotesManager(default_symbol='SPXW')
+    def __init__(self, client: Optional[SchwabClient] = None):
+        """
+        Initialize quote monitor.
+        
+        Args:
+            client: Shared SchwabClient. If None, uses get_shared_client().
+        """
+        self.quotes_mgr = QuotesManager(default_symbol='SPXW', client=client)
     
     def get_expiration_date(self, date: datetime) -> str:
         """
@@ -83,19 +89,52 @@ class QuoteMonitor:
             - long_ask: Long leg ask
             Returns None if quotes unavailable
         """
+        short_symbol, long_symbol = self.build_symbols(date, k_short, k_long, option_type)
+        return self.get_spread_credit_by_symbol(short_symbol, long_symbol)
+    
+    def build_symbols(
+        self,
+        date: datetime,
+        k_short: float,
+        k_long: float,
+        option_type: str  # 'PUT' or 'CALL'
+    ) -> Tuple[str, str]:
+        """
+        Build the OCC option symbols for the short and long legs.
+        
+        The strikes are fixed once a setup triggers, so callers polling the same
+        spread should build the symbols once and reuse them.
+        
+        Args:
+            date: Trading date
+            k_short: Short strike
+            k_long: Long strike
+            option_type: 'PUT' or 'CALL'
+        
+        Returns:
+            Tuple of (short_symbol, long_symbol)
+        """
         expiration_date = self.get_expiration_date(date)
         option_type_char = 'P' if option_type == 'PUT' else 'C'
         
         # Format strikes - QuotesManager expects strike in original format (not multiplied)
         # It will multiply by 1000 internally
-        short_strike_for_api = int(k_short)
-        long_strike_for_api = int(k_long)
+        short_symbol = self.quotes_mgr._format_option_symbol('SPXW', expiration_date, option_type_char, int(k_short))
+        long_symbol = self.quotes_mgr._format_option_symbol('SPXW', expiration_date, option_type_char, int(k_long))
+        return short_symbol, long_symbol
+    
+    def get_spread_credit_by_symbol(self, short_symbol: str, long_symbol: str) -> Optional[Dict]:
+        """
+        Get credit spread quote for prebuilt leg symbols and calculate C_gross and C_net.
+        
+        Args:
+            short_symbol: OCC symbol of the short leg (from build_symbols())
+            long_symbol: OCC symbol of the long leg (from build_symbols())
         
+        Returns:
+            Same dictionary as get_spread_credit(), or None if quotes unavailable
+        """
         try:
-            # Use the same pattern as original bot: format symbols and get quotes together
-            short_symbol = self.quotes_mgr._format_option_symbol('SPXW', expiration_date, option_type_char, short_strike_for_api)
-            long_symbol = self.quotes_mgr._format_option_symbol('SPXW', expiration_date, option_type_char, long_strike_for_api)
-            
             # Get both quotes in one API call (like original bot does)
             quotes = self.quotes_mgr.get_quotes([short_symbol, long_symbol], fields='quote')
             
@@ -148,8 +187,8 @@ class QuoteMonitor:
             logger.info("SPREAD QUOTE DETAILS")
             logger.info("=" * 70)
             logger.info(f"Option Symbols:")
-            logger.info(f"  Short leg: {short_symbol} (K_short=${k_short:.2f})")
-            logger.info(f"  Long leg:  {long_symbol} (K_long=${k_long:.2f})")
+            logger.info(f"  Short leg: {short_symbol}")
+            logger.info(f"  Long leg:  {long_symbol}")
             logger.info("")
             logger.info("Short Leg (SELL) Quote:")
             logger.info(f"  Bid: ${short_bid:.2f}")
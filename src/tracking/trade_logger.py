@@ -4,11 +4,11 @@ import os
 from datetime import datetime
 from typing import Dict, Optional
 from pathlib import Path
-import pytz
+from zoneinfo import ZoneInfo
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
-ET = pytz.timezone('US/Eastern')
+ET = ZoneInfo('America/New_York')
 
 # CSV column definitions
 CSV_COLUMNS = [
@@ -152,6 +152,54 @@ class TradeLogger:
             logger.debug(traceback.format_exc())
             return False
     
+    def update_trade(self, order_id: str, fields: Dict) -> bool:
+        """
+        Update the logged trade row for an order in place.
+        
+        Used at EOD to fill in P/L columns on the row written at entry instead of
+        appending a duplicate row. If no row matches order_id, the fields are
+        appended as a new row.
+        
+        Args:
+            order_id: Order ID of the trade to update
+            fields: Column values to set (keys outside CSV_COLUMNS are ignored)
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with open(self.csv_file_path, 'r', newline='', encoding='utf-8') as f:
+                rows = list(csv.DictReader(f))
+            
+            # Update the most recent row for this order
+            target = None
+            for row in reversed(rows):
+                if row.get('order_id') == str(order_id):
+                    target = row
+                    break
+            
+            if target is None:
+                logger.warning(f"No logged trade found for order {order_id}, appending new row")
+                return self.log_trade({**fields, 'order_id': str(order_id)})
+            
+            for col in CSV_COLUMNS:
+                if col in fields:
+                    target[col] = fields[col]
+            
+            with open(self.csv_file_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS, extrasaction='ignore')
+                writer.writeheader()
+                writer.writerows(rows)
+            
+            logger.info(f"Trade {order_id} updated in {self.csv_file_path}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error updating trade: {e}")
+            import traceback
+            logger.debug(traceback.format_exc())
+            return False
+    
     def format_value(self, value) -> str:
         """
         Format a value for CSV (handle None, floats, etc.).
@@ -0,0 +1,67 @@
+"""Shared HTTP session for broker and market data requests."""
+import atexit
+import socket
+import threading
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+# Small request/response payloads dominate (quotes, candles, orders). urllib3's
+# defaults already disable Nagle (TCP_NODELAY); also keep idle pooled connections
+# alive between polls so the OS does not silently drop them.
+SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+# Retry only failures where the request never reached the server or a gateway
+# bounced it, and only for idempotent methods - never resend an order POST
+RETRY = Retry(
+    total=2,
+    connect=2,
+    read=0,
+    status=2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({'GET', 'HEAD', 'OPTIONS'}),
+    backoff_factor=0.2,
+    raise_on_status=False,
+)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+class NoDelayHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections use SOCKET_OPTIONS."""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+def get_session() -> requests.Session:
+    """
+    Get the process-wide requests session.
+    
+    Reusing one session keeps TCP/TLS connections to the Schwab API open
+    across calls instead of reconnecting on every request. Responses are
+    requested gzip-compressed.
+    
+    Returns:
+        Shared requests.Session with TCP_NODELAY, keepalive and RETRY enabled
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            session.headers.update({
+                'Accept-Encoding': 'gzip, deflate',
+                'Connection': 'keep-alive',
+            })
+            adapter = NoDelayHTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=RETRY)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            atexit.register(session.close)
+            _session = session
+        return _session
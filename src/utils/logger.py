@@ -2,7 +2,7 @@
 import logging
 import sys
 import os
-import pytz
+from zoneinfo import ZoneInfo
 from pathlib import Path
 from datetime import datetime
 
@@ -12,7 +12,7 @@ class ETFormatter(logging.Formatter):
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.et_tz = pytz.timezone('US/Eastern')
+        self.et_tz = ZoneInfo('America/New_York')
     
     def formatTime(self, record, datefmt=None):
         """Convert timestamp to Eastern Time."""
@@ -63,7 +63,7 @@ def setup_logger(name: str = "spx_atm_bot", level: int = logging.INFO) -> loggin
         logs_dir.mkdir(parents=True, exist_ok=True)
         
         # Create log file with today's date
-        today = datetime.now(pytz.timezone('US/Eastern')).strftime('%Y-%m-%d')
+        today = datetime.now(ZoneInfo('America/New_York')).strftime('%Y-%m-%d')
         log_file = logs_dir / f'bot_{today}.log'
         
         file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
@@ -11,14 +11,14 @@ import sys
 import os
 import json
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.accounts.account_manager import AccountManager
 from src.utils.logger import setup_logger
 
 logger = setup_logger("investigate_filled_order")
-ET = pytz.timezone('US/Eastern')
+ET = ZoneInfo('America/New_York')
 
 
 def investigate_filled_order_data():
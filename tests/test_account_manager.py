@@ -0,0 +1,389 @@
+"""
+Test AccountManager caching with a stub Schwab client (no API calls).
+"""
+import sys
+import os
+import json
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timezone
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+from src.accounts.account_manager import AccountManager
+from src.config import Config
+
+
+ACCOUNTS = [
+    {'accountNumber': '11111111', 'hashValue': 'HASH_A'},
+    {'accountNumber': '22222222', 'hashValue': 'HASH_B'},
+]
+
+_saved_cache_file = None
+
+
+def setUpModule():
+    """Keep the on-disk account cache out of tests that do not ask for it."""
+    global _saved_cache_file
+    _saved_cache_file = Config.ACCOUNTS_CACHE_FILE
+    Config.ACCOUNTS_CACHE_FILE = None
+
+
+def tearDownModule():
+    Config.ACCOUNTS_CACHE_FILE = _saved_cache_file
+
+
+class StubClient:
+    """Stands in for SchwabClient and records every request made."""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def get_accounts(self):
+        self.calls.append(('GET', '/accounts/accountNumbers', None))
+        return [dict(a) for a in ACCOUNTS]
+    
+    def _make_request(self, method, endpoint, params=None, data=None, json_data=None):
+        self.calls.append((method, endpoint, params))
+        if endpoint.endswith('/orders'):
+            return []
+        return {'securitiesAccount': {'currentBalances': {'liquidationValue': 50000.0}}}
+    
+    def count(self, endpoint):
+        return sum(1 for _, e, _ in self.calls if e == endpoint)
+
+
+class TestAccountCache(unittest.TestCase):
+    """Test that the account list is fetched once per TTL."""
+    
+    def setUp(self):
+        self.client = StubClient()
+        self.account_mgr = AccountManager(client=self.client)
+    
+    def test_account_list_is_cached(self):
+        """Test repeated hash lookups reuse the cached account list."""
+        self.assertEqual(self.account_mgr.get_account_hash(), 'HASH_A')
+        self.assertEqual(self.account_mgr.get_account_hash('22222222'), 'HASH_B')
+        self.account_mgr.get_account_numbers()
+        self.assertEqual(self.client.count('/accounts/accountNumbers'), 1)
+    
+    def test_expired_cache_refetches(self):
+        """Test the account list is refetched once the TTL has passed."""
+        self.account_mgr.get_account_numbers()
+        self.account_mgr._account_cache_ttl = 0
+        self.account_mgr.get_account_numbers()
+        self.assertEqual(self.client.count('/accounts/accountNumbers'), 2)
+    
+    def test_invalidate_accounts_cache(self):
+        """Test invalidate_accounts_cache() forces the next lookup to refetch."""
+        self.account_mgr.get_account_numbers()
+        self.account_mgr.invalidate_accounts_cache()
+        self.account_mgr.get_account_numbers()
+        self.assertEqual(self.client.count('/accounts/accountNumbers'), 2)
+    
+    def test_unknown_account_raises(self):
+        """Test an unknown account number still raises ValueError."""
+        with self.assertRaises(ValueError):
+            self.account_mgr.get_account_hash('99999999')
+    
+    def test_missing_account_is_remembered(self):
+        """Test an unknown account keeps failing without refetching, even after the TTL."""
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                self.account_mgr.get_account_hash('99999999')
+            self.account_mgr._account_cache_ttl = 0
+        self.assertEqual(self.client.count('/accounts/accountNumbers'), 1)
+    
+    def test_no_accounts_raises(self):
+        """Test the default hash lookup raises ValueError when no accounts exist."""
+        self.client.get_accounts = lambda: []
+        with self.assertRaises(ValueError):
+            self.account_mgr.get_account_hash()
+
+
+class TestBalancesCache(unittest.TestCase):
+    """Test the short-lived balances cache."""
+    
+    def setUp(self):
+        self.client = StubClient()
+        self.account_mgr = AccountManager(client=self.client)
+    
+    def test_back_to_back_reads_share_one_call(self):
+        """Test net liquidity and option buying power read together hit the API once."""
+        self.account_mgr.get_net_liquidity()
+        self.account_mgr.get_option_buying_power()
+        self.assertEqual(self.client.count('/accounts/HASH_A'), 1)
+    
+    def test_expired_balances_refetch(self):
+        """Test balances are refetched once the TTL has passed."""
+        self.account_mgr._balances_ttl = 0
+        self.account_mgr.get_account_balances()
+        self.account_mgr.get_account_balances()
+        self.assertEqual(self.client.count('/accounts/HASH_A'), 2)
+    
+    def test_account_metrics(self):
+        """Test get_account_metrics() returns both figures from one balances read."""
+        metrics = self.account_mgr.get_account_metrics()
+        self.assertEqual(metrics['net_liquidity'], 50000.0)
+        self.assertEqual(metrics['option_buying_power'], 0.0)
+        self.assertEqual(self.client.count('/accounts/HASH_A'), 1)
+    
+    def test_option_buying_power_field_priority(self):
+        """Test the most specific option buying power field wins over the fallbacks."""
+        self.account_mgr._balances_cache['__default__'] = (time.monotonic(), {
+            'securitiesAccount': {'currentBalances': {
+                'liquidationValue': 50000.0,
+                'buyingPower': 90000.0,
+                'buyingPowerNonMarginableTrade': 30000.0,
+                'optionBuyingPower': 25000.0,
+            }}
+        })
+        self.assertEqual(self.account_mgr.get_option_buying_power(), 25000.0)
+    
+    def test_null_option_buying_power_field_is_skipped(self):
+        """Test a field reported as null falls through to the next one."""
+        self.account_mgr._balances_cache['__default__'] = (time.monotonic(), {
+            'securitiesAccount': {'currentBalances': {
+                'optionBuyingPower': None,
+                'buyingPowerNonMarginableTrade': 30000.0,
+            }}
+        })
+        self.assertEqual(self.account_mgr.get_option_buying_power(), 30000.0)
+    
+    def test_invalidate_balances(self):
+        """Test invalidate_balances() forces the next read to refetch."""
+        self.account_mgr.get_account_balances()
+        self.account_mgr.invalidate_balances()
+        self.account_mgr.get_account_balances()
+        self.assertEqual(self.client.count('/accounts/HASH_A'), 2)
+    
+    def test_read_overtaken_by_invalidation_is_not_cached(self):
+        """Test balances read before an invalidation (e.g. an order placed meanwhile) are not written back."""
+        make_request = self.client._make_request
+        
+        def request(method, endpoint, params=None, data=None, json_data=None):
+            response = make_request(method, endpoint, params, data, json_data)
+            self.account_mgr.invalidate_balances()
+            return response
+        self.client._make_request = request
+        
+        self.account_mgr.get_account_metrics()
+        self.assertEqual(self.account_mgr._balances_cache, {})
+        self.assertEqual(self.account_mgr._metrics_cache, {})
+        self.client._make_request = make_request
+        self.account_mgr.get_account_metrics()
+        self.assertEqual(self.client.count('/accounts/HASH_A'), 2)
+
+
+class TestMetricsStaleWhileRevalidate(unittest.TestCase):
+    """Test the stale-while-revalidate cache behind get_account_metrics()."""
+    
+    STALE = {'net_liquidity': 1.0, 'option_buying_power': 1.0}
+    
+    def setUp(self):
+        self.client = StubClient()
+        self.account_mgr = AccountManager(client=self.client)
+    
+    def _seed(self, age):
+        self.account_mgr._metrics_cache['__default__'] = (time.monotonic() - age, dict(self.STALE))
+    
+    def _wait_for_refresh(self):
+        deadline = time.monotonic() + 5
+        while self.account_mgr._metrics_refreshing and time.monotonic() < deadline:
+            time.sleep(0.01)
+    
+    def test_fresh_value_is_served_without_request(self):
+        """Test a value younger than the fresh TTL never touches the API."""
+        self._seed(age=0)
+        self.assertEqual(self.account_mgr.get_net_liquidity(), 1.0)
+        self.assertEqual(self.client.count('/accounts/HASH_A'), 0)
+    
+    def test_stale_value_is_served_then_refreshed(self):
+        """Test a stale value is returned immediately and refreshed in the background."""
+        self._seed(age=10)
+        self.assertEqual(self.account_mgr.get_net_liquidity(), 1.0)
+        self._wait_for_refresh()
+        self.assertEqual(self.client.count('/accounts/HASH_A'), 1)
+        self.assertEqual(self.account_mgr.get_net_liquidity(), 50000.0)
+    
+    def test_expired_value_blocks_on_refresh(self):
+        """Test a value older than the stale TTL is refreshed before returning."""
+        self._seed(age=60)
+        self.assertEqual(self.account_mgr.get_net_liquidity(), 50000.0)
+        self.assertEqual(self.client.count('/accounts/HASH_A'), 1)
+
+
+class TestOrdersExecutedToday(unittest.TestCase):
+    """Test the date range sent by get_orders_executed_today()."""
+    
+    def test_today_bounds_format(self):
+        """Test the bounds cover the whole UTC day with millisecond precision."""
+        client = StubClient()
+        account_mgr = AccountManager(client=client)
+        account_mgr.get_orders_executed_today(max_results=10)
+        
+        params = client.calls[-1][2]
+        today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+        self.assertEqual(params['fromEnteredTime'], f"{today}T00:00:00.000Z")
+        self.assertEqual(params['toEnteredTime'], f"{today}T23:59:59.999Z")
+    
+    def test_multiple_statuses_request_each_status(self):
+        """Test several statuses are filtered server-side, one request per status."""
+        client = StubClient()
+        account_mgr = AccountManager(client=client)
+        account_mgr.get_orders_executed_today(statuses=['FILLED', 'WORKING'])
+        
+        sent = sorted(params['status'] for _, endpoint, params in client.calls
+                      if endpoint == '/accounts/HASH_A/orders')
+        self.assertEqual(sent, ['FILLED', 'WORKING'])
+    
+    def test_unknown_status_is_passed_through(self):
+        """Test an undocumented status is still sent to the API, with a warning."""
+        client = StubClient()
+        account_mgr = AccountManager(client=client)
+        with self.assertLogs('src.accounts.account_manager', level='WARNING'):
+            account_mgr.get_orders(status='EXECUTED')
+        self.assertEqual(client.calls[-1][2]['status'], 'EXECUTED')
+
+
+class BlockingClient(StubClient):
+    """StubClient whose balance requests block until released."""
+    
+    def __init__(self):
+        super().__init__()
+        self.entered = threading.Event()
+        self.release = threading.Event()
+    
+    def _make_request(self, method, endpoint, params=None, data=None, json_data=None):
+        self.entered.set()
+        self.release.wait(5)
+        return super()._make_request(method, endpoint, params, data, json_data)
+
+
+class TestRequestDedup(unittest.TestCase):
+    """Test that identical concurrent requests share one API call."""
+    
+    def test_concurrent_balance_requests_share_one_call(self):
+        """Test a balance request made while an identical one is in flight waits for it."""
+        client = BlockingClient()
+        account_mgr = AccountManager(client=client)
+        account_mgr.get_account_numbers()
+        
+        results = []
+        first = threading.Thread(target=lambda: results.append(account_mgr.get_account_balances()))
+        first.start()
+        self.assertTrue(client.entered.wait(5))
+        second = threading.Thread(target=lambda: results.append(account_mgr.get_account_balances()))
+        second.start()
+        time.sleep(0.1)
+        client.release.set()
+        first.join(5)
+        second.join(5)
+        
+        self.assertEqual(len(results), 2)
+        self.assertIs(results[0], results[1])
+        self.assertEqual(client.count('/accounts/HASH_A'), 1)
+    
+    def test_different_params_are_not_shared(self):
+        """Test requests with different parameters are sent separately."""
+        client = StubClient()
+        account_mgr = AccountManager(client=client)
+        account_mgr.get_orders(max_results=10)
+        account_mgr.get_orders(max_results=20)
+        self.assertEqual(client.count('/accounts/HASH_A/orders'), 2)
+
+
+class TestAccountDiskCache(unittest.TestCase):
+    """Test the account list is reused from disk across AccountManager instances."""
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'spx_bot', 'accounts.json')
+        Config.ACCOUNTS_CACHE_FILE = self.path
+    
+    def tearDown(self):
+        Config.ACCOUNTS_CACHE_FILE = None
+        self.tmpdir.cleanup()
+    
+    def test_second_process_skips_account_fetch(self):
+        """Test a fresh manager reads hashes from the file written by the first one."""
+        AccountManager(client=StubClient()).get_account_hash()
+        self.assertTrue(os.path.exists(self.path))
+        
+        client = StubClient()
+        account_mgr = AccountManager(client=client)
+        self.assertEqual(account_mgr.get_account_hash('22222222'), 'HASH_B')
+        self.assertEqual(client.count('/accounts/accountNumbers'), 0)
+    
+    def test_old_file_is_ignored(self):
+        """Test a file older than ACCOUNTS_CACHE_MAX_AGE triggers a normal fetch."""
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, 'w') as f:
+            json.dump({'ts': time.time() - Config.ACCOUNTS_CACHE_MAX_AGE - 1, 'accounts': ACCOUNTS}, f)
+        client = StubClient()
+        AccountManager(client=client).get_account_hash()
+        self.assertEqual(client.count('/accounts/accountNumbers'), 1)
+    
+    def test_unknown_account_refetches_before_failing(self):
+        """Test an account missing from the file is looked up via the API."""
+        AccountManager(client=StubClient()).get_account_hash()
+        ACCOUNTS.append({'accountNumber': '33333333', 'hashValue': 'HASH_C'})
+        try:
+            client = StubClient()
+            account_mgr = AccountManager(client=client)
+            self.assertEqual(account_mgr.get_account_hash('33333333'), 'HASH_C')
+            self.assertEqual(client.count('/accounts/accountNumbers'), 1)
+        finally:
+            ACCOUNTS.pop()
+    
+    def write_stale_file(self):
+        """Write a cache file whose hash for the first account the API no longer accepts."""
+        os.makedirs(os.path.dirname(self.path))
+        stale = [{'accountNumber': '11111111', 'hashValue': 'OLD_HASH'}] + ACCOUNTS[1:]
+        with open(self.path, 'w') as f:
+            json.dump({'ts': time.time(), 'accounts': stale}, f)
+    
+    def rejecting_client(self, status_code):
+        """StubClient whose requests for OLD_HASH fail with status_code."""
+        client = StubClient()
+        response = requests.Response()
+        response.status_code = status_code
+        make_request = client._make_request
+        def request(method, endpoint, params=None, data=None, json_data=None):
+            if 'OLD_HASH' in endpoint:
+                client.calls.append((method, endpoint, params))
+                raise requests.HTTPError(response=response)
+            return make_request(method, endpoint, params=params)
+        client._make_request = request
+        return client
+    
+    def test_rejected_hash_is_refreshed_and_retried(self):
+        """Test a 404 for a disk-cached hash refetches the hashes and retries once."""
+        self.write_stale_file()
+        client = self.rejecting_client(404)
+        account_mgr = AccountManager(client=client)
+        
+        balances = account_mgr.get_account_balances()
+        
+        self.assertEqual(balances['securitiesAccount']['currentBalances']['liquidationValue'], 50000.0)
+        self.assertEqual(client.count('/accounts/OLD_HASH'), 1)
+        self.assertEqual(client.count('/accounts/HASH_A'), 1)
+        self.assertEqual(client.count('/accounts/accountNumbers'), 1)
+        with open(self.path) as f:
+            self.assertEqual(json.load(f)['accounts'][0]['hashValue'], 'HASH_A')
+    
+    def test_401_keeps_disk_cache(self):
+        """Test a 401 is raised without discarding the cached hashes."""
+        self.write_stale_file()
+        client = self.rejecting_client(401)
+        account_mgr = AccountManager(client=client)
+        
+        with self.assertRaises(requests.HTTPError):
+            account_mgr.get_account_balances()
+        self.assertTrue(os.path.exists(self.path))
+        self.assertEqual(client.count('/accounts/accountNumbers'), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,10 +7,10 @@ using mock data that simulates what the API would return.
 import sys
 import os
 from datetime import datetime, time as dt_time
-import pytz
+from zoneinfo import ZoneInfo
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-ET = pytz.timezone('US/Eastern')
+ET = ZoneInfo('America/New_York')
 
 
 def test_candle_selection_logic():
@@ -34,7 +34,7 @@ def test_candle_selection_logic():
     
     # Simulate today's date
     today = datetime.now(ET)
-    today_dt = ET.localize(datetime.combine(today.date(), dt_time(9, 30)))
+    today_dt = datetime.combine(today.date(), dt_time(9, 30), tzinfo=ET)
     
     print(f"Testing with date: {today_dt.strftime('%Y-%m-%d')}")
     print()
@@ -142,7 +142,7 @@ def test_candle_selection_logic():
         # NEW FIXED CODE: Find the candle that matches the requested time window
         window_start = today_dt.replace(hour=start_hour, minute=start_min, second=0, microsecond=0)
         if window_start.tzinfo is None:
-            window_start = ET.localize(window_start)
+            window_start = window_start.replace(tzinfo=ET)
         window_start_ts = int(window_start.timestamp() * 1000)
         
         # Find candle where datetime matches our target window start
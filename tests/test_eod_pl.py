@@ -0,0 +1,43 @@
+"""
+Test the EOD P/L step with mocked market data and account manager.
+"""
+import sys
+import os
+import unittest
+from datetime import datetime
+from unittest.mock import patch, MagicMock
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from automate_trading import ET, calculate_eod_pl
+
+
+class TestCalculateEodPl(unittest.TestCase):
+    """Test calculate_eod_pl() records P/L even when optional lookups fail."""
+    
+    def setUp(self):
+        self.trade_data = {'trade_type': 'PUT', 'K_short': '5000', 'C_net_fill': '1.00', 'qty': '1', 'order_id': ''}
+        patchers = [
+            patch('automate_trading.get_client'),
+            patch('src.strategy.market_data.MarketDataFetcher'),
+            patch('src.tracking.trade_logger.TradeLogger'),
+        ]
+        _, fetcher_cls, self.logger_cls = [p.start() for p in patchers]
+        for p in patchers:
+            self.addCleanup(p.stop)
+        fetcher_cls.return_value.get_spx_close_price.return_value = 5010.0
+    
+    def test_expired_token_does_not_stop_pl_row(self):
+        """Test an auth error from get_net_liquidity() leaves equity_after out and still updates the trade."""
+        account_mgr = MagicMock()
+        account_mgr.get_net_liquidity.side_effect = Exception("Refresh token expired or invalid")
+        
+        result = calculate_eod_pl(datetime(2026, 3, 9, 16, 0, tzinfo=ET), self.trade_data, account_mgr)
+        
+        self.assertEqual(result['SPX_close'], 5010.0)
+        self.assertIn('total_pnl', result)
+        self.assertNotIn('equity_after', result)
+        self.logger_cls.return_value.update_trade.assert_called_once_with('', result)
+
+
+if __name__ == '__main__':
+    unittest.main()
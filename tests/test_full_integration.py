@@ -2,7 +2,7 @@
 import sys
 import os
 from datetime import datetime, time as dt_time
-import pytz
+from zoneinfo import ZoneInfo
 import time
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -16,7 +16,7 @@ from src.config import Config
 from src.utils.logger import setup_logger
 
 logger = setup_logger("test_full_integration")
-ET = pytz.timezone('US/Eastern')
+ET = ZoneInfo('America/New_York')
 
 def test_full_bot_logic():
     """Test full bot logic flow without placing orders."""
@@ -32,7 +32,7 @@ def test_full_bot_logic():
     print()
     
     today = datetime.now(ET)
-    today_dt = ET.localize(datetime.combine(today.date(), datetime.min.time().replace(hour=9, minute=30)))
+    today_dt = datetime.combine(today.date(), datetime.min.time().replace(hour=9, minute=30), tzinfo=ET)
     
     print(f"Testing with date: {today_dt.strftime('%Y-%m-%d')}")
     print()
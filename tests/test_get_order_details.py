@@ -12,7 +12,7 @@ import json
 import requests
 import re
 from datetime import datetime, timedelta
-import pytz
+from zoneinfo import ZoneInfo
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.client.schwab_client import SchwabClient
@@ -21,7 +21,7 @@ from src.quotes.quotes_manager import QuotesManager
 from src.utils.logger import setup_logger
 
 logger = setup_logger("test_get_order")
-ET = pytz.timezone('US/Eastern')
+ET = ZoneInfo('America/New_York')
 
 
 def test_get_order_details():
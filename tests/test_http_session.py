@@ -0,0 +1,43 @@
+"""
+Test the shared HTTP session used for Schwab API requests.
+"""
+import sys
+import os
+import socket
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.http import get_session, NoDelayHTTPAdapter
+
+
+class TestSharedSession(unittest.TestCase):
+    """Test the process-wide requests session."""
+    
+    def test_session_is_shared(self):
+        """Test every caller gets the same session (and so the same connection pool)."""
+        self.assertIs(get_session(), get_session())
+    
+    def test_https_adapter_socket_options(self):
+        """Test pooled HTTPS connections disable Nagle and enable keepalive."""
+        adapter = get_session().get_adapter('https://api.schwabapi.com')
+        self.assertIsInstance(adapter, NoDelayHTTPAdapter)
+        options = adapter.poolmanager.connection_pool_kw['socket_options']
+        self.assertIn((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1), options)
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), options)
+    
+    def test_default_headers(self):
+        """Test the session asks for compressed, kept-alive responses."""
+        headers = get_session().headers
+        self.assertIn('gzip', headers['Accept-Encoding'])
+        self.assertEqual(headers['Connection'], 'keep-alive')
+    
+    def test_post_is_never_retried(self):
+        """Test retries are limited to idempotent methods so orders are never resent."""
+        retry = get_session().get_adapter('https://api.schwabapi.com').max_retries
+        self.assertIn('GET', retry.allowed_methods)
+        self.assertNotIn('POST', retry.allowed_methods)
+        self.assertEqual(retry.read, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
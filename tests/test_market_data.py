@@ -2,7 +2,7 @@
 import sys
 import os
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.strategy.market_data import MarketDataFetcher
@@ -11,7 +11,7 @@ from src.config import Config
 from src.utils.logger import setup_logger
 
 logger = setup_logger("test_market_data")
-ET = pytz.timezone('US/Eastern')
+ET = ZoneInfo('America/New_York')
 
 def test_get_opening_range():
     """Test getting Opening Range from real API."""
@@ -22,7 +22,7 @@ def test_get_opening_range():
     
     # Use today's date
     today = datetime.now(ET)
-    today_dt = ET.localize(datetime.combine(today.date(), datetime.min.time().replace(hour=9, minute=30)))
+    today_dt = datetime.combine(today.date(), datetime.min.time().replace(hour=9, minute=30), tzinfo=ET)
     
     print(f"Testing with date: {today_dt.strftime('%Y-%m-%d')}")
     print()
@@ -80,7 +80,7 @@ def test_get_30min_candles():
     print()
     
     today = datetime.now(ET)
-    today_dt = ET.localize(datetime.combine(today.date(), datetime.min.time().replace(hour=9, minute=30)))
+    today_dt = datetime.combine(today.date(), datetime.min.time().replace(hour=9, minute=30), tzinfo=ET)
     
     print(f"Testing with date: {today_dt.strftime('%Y-%m-%d')}")
     print()
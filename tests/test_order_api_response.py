@@ -9,7 +9,7 @@ import os
 import json
 import requests
 from datetime import datetime, timedelta
-import pytz
+from zoneinfo import ZoneInfo
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.client.schwab_client import SchwabClient
@@ -18,7 +18,7 @@ from src.quotes.quotes_manager import QuotesManager
 from src.utils.logger import setup_logger
 
 logger = setup_logger("test_order_api")
-ET = pytz.timezone('US/Eastern')
+ET = ZoneInfo('America/New_York')
 
 
 def test_order_api_response():
@@ -0,0 +1,143 @@
+"""
+Test OrderManager without credentials or API calls.
+"""
+import sys
+import os
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch, MagicMock
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import Config
+from src.orders.order_manager import ORDER_POLL_DELAYS, OrderManager
+
+
+class TestLazyInit(unittest.TestCase):
+    """Test OrderManager creates its API helpers only when first used."""
+    
+    def setUp(self):
+        patcher = patch.object(Config, 'ORDER_REPORTS', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_constructor_creates_no_client(self):
+        """Test creating an OrderManager does not build a SchwabClient."""
+        with patch('src.orders.order_manager.get_shared_client') as get_client:
+            mgr = OrderManager()
+        get_client.assert_not_called()
+        self.assertIsNone(mgr._account_mgr)
+        self.assertIsNone(mgr._quotes_mgr)
+    
+    def test_account_manager_uses_the_shared_client(self):
+        """Test the account manager is built once, on the shared client."""
+        mgr = OrderManager()
+        with patch('src.orders.order_manager.get_shared_client') as get_client, \
+                patch('src.accounts.account_manager.AccountManager._load_accounts_from_disk'):
+            account_mgr = mgr.account_mgr
+        
+        get_client.assert_called_once_with()
+        self.assertIs(account_mgr.client, get_client.return_value)
+        self.assertIs(mgr.account_mgr, account_mgr)
+
+
+
+class TestPlaceOrder(unittest.TestCase):
+    """Test place_credit_spread_order() against mocked managers."""
+    
+    def setUp(self):
+        patcher = patch.object(Config, 'ORDER_REPORTS', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mgr = OrderManager()
+        self.mgr._client = MagicMock()
+        self.mgr._client._make_request.return_value = {'location': 'https://api/accounts/HASH/orders/1'}
+        self.mgr._account_mgr = MagicMock()
+        self.mgr._account_mgr.get_account_hash.return_value = 'HASH'
+        self.mgr._account_mgr.get_orders_executed_today.return_value = [
+            {'orderId': 1, 'status': 'WORKING', 'enteredTime': '2099-01-01T15:00:00+0000'}
+        ]
+        self.mgr._quotes_mgr = MagicMock()
+        self.mgr._quotes_mgr._format_option_symbol_prefix.return_value = 'XSP   251114P'
+        self.mgr._quotes_mgr.get_credit_spread_quote_by_bias.return_value = {'spread_info': {
+            'net_mid': 0.42, 'short_strike': 675, 'long_strike': 674, 'spread_type': 'PUT Credit Spread'
+        }}
+        self.mgr._quotes_mgr.get_quotes.return_value = {'$XSP': {'quote': {'lastPrice': 676.1}}}
+    
+    def test_explicit_quantity_order(self):
+        """Test the order sent for an explicit quantity, with scaling info left to the background."""
+        with patch('src.orders.order_manager._background_executor') as executor:
+            response = self.mgr.place_credit_spread_order('251114', 'xsp', 'bull', 675.4, quantity=2)
+        
+        executor.submit.assert_called_once_with(self.mgr._log_scaling_info, None, 2)
+        self.mgr._account_mgr.get_option_buying_power.assert_not_called()
+        quote_kwargs = self.mgr._quotes_mgr.get_credit_spread_quote_by_bias.call_args.kwargs
+        self.assertEqual((quote_kwargs['symbol'], quote_kwargs['short_strike'], quote_kwargs['width']), ('$XSP', 675, 1))
+        endpoint = self.mgr._client._make_request.call_args.args[1]
+        order = self.mgr._client._make_request.call_args.kwargs['json_data']
+        self.assertEqual(endpoint, '/accounts/HASH/orders')
+        self.assertEqual(order['orderType'], 'NET_CREDIT')
+        self.assertEqual(order['price'], '0.42')
+        self.assertEqual(
+            [(leg['instruction'], leg['quantity'], leg['instrument']['symbol']) for leg in order['orderLegCollection']],
+            [('BUY_TO_OPEN', 2, 'XSP   251114P00674000'), ('SELL_TO_OPEN', 2, 'XSP   251114P00675000')]
+        )
+        self.assertEqual(response['order_details']['orderId'], 1)
+        self.assertEqual(response['underlying_price_at_fill'], 676.1)
+        self.assertEqual(response['underlying_symbol'], 'XSP')
+        self.mgr._account_mgr.invalidate_balances.assert_called_once_with(None)
+
+    
+    def test_unknown_bias_is_rejected(self):
+        """Test a bias other than bull(ish)/bear(ish) raises before any request."""
+        with self.assertRaises(ValueError):
+            self.mgr.place_credit_spread_order('251114', 'XSP', 'sideways', 675)
+        self.mgr._quotes_mgr.get_credit_spread_quote_by_bias.assert_not_called()
+
+
+class TestAwaitOrderVisible(unittest.TestCase):
+    """Test the placed order is found in today's orders after the POST."""
+    
+    def setUp(self):
+        patcher = patch.object(Config, 'ORDER_REPORTS', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch('src.orders.order_manager.time.sleep')
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mgr = OrderManager()
+        self.mgr._account_mgr = MagicMock()
+        self.submitted_at = datetime(2026, 3, 9, 15, 0, tzinfo=timezone.utc)
+    
+    def await_order(self, orders, order_id=None):
+        self.mgr._account_mgr.get_orders_executed_today.return_value = orders
+        return self.mgr._await_order_visible(None, order_id, self.submitted_at)
+    
+    def test_order_id_from_location_is_matched(self):
+        """Test the order with the ID from the Location header is taken, even if it is not the newest."""
+        orders = [{'orderId': 2, 'enteredTime': '2026-03-09T15:00:01+0000'},
+                  {'orderId': 1, 'enteredTime': '2026-03-09T15:00:00+0000'}]
+        self.assertEqual(self.await_order(orders, '1')['orderId'], 1)
+        self.assertEqual(self.sleep.call_count, 1)
+    
+    def test_entered_time_with_fractional_seconds(self):
+        """Test an enteredTime with fractional seconds and a colon offset still matches on time."""
+        orders = [{'orderId': 1, 'enteredTime': '2026-03-09T15:00:00.250+00:00'}]
+        self.assertEqual(self.await_order(orders)['orderId'], 1)
+        self.assertEqual(self.sleep.call_count, 1)
+    
+    def test_unparseable_or_skewed_time_falls_back_to_newest(self):
+        """Test an order that cannot be confirmed by time is still returned once the polls run out."""
+        for entered_time in ('not a time', '2026-03-09T14:59:00+0000'):
+            self.sleep.reset_mock()
+            orders = [{'orderId': 1, 'enteredTime': entered_time}]
+            with self.assertLogs('src.orders.order_manager', level='WARNING'):
+                self.assertEqual(self.await_order(orders)['orderId'], 1)
+            self.assertEqual(self.sleep.call_count, len(ORDER_POLL_DELAYS))
+    
+    def test_no_orders_returns_none(self):
+        """Test None is returned only when no orders come back at all."""
+        self.assertIsNone(self.await_order([], '1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,13 +14,13 @@ import json
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.orders.spread_order_placer import SpreadOrderPlacer
 from src.config import Config
 
-ET = pytz.timezone('US/Eastern')
+ET = ZoneInfo('America/New_York')
 
 
 class TestOrderPlacementFix(unittest.TestCase):
@@ -0,0 +1,149 @@
+"""
+Test OrderTracker against a temporary tracking file.
+"""
+import sys
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+from datetime import date, datetime, timedelta
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import orjson
+from src.orders.order_tracker import OrderTracker
+
+
+class TestOrderTracker(unittest.TestCase):
+    """Test recording, querying and clearing tracked orders."""
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.tracking_file = os.path.join(self.tmpdir.name, 'order_tracking.jsonl')
+        self.tracker = OrderTracker(self.tracking_file)
+    
+    def write_record(self, placed_at, symbol='XSP', **fields):
+        with open(self.tracking_file, 'a') as f:
+            f.write(json.dumps({'order_id': placed_at, 'symbol': symbol, 'placed_at': placed_at, **fields}) + '\n')
+    
+    def test_record_and_query_today(self):
+        """Test a recorded order is seen for its symbol only."""
+        self.assertFalse(self.tracker.has_order_placed_today())
+        self.tracker.record_order('1', 'xsp', 'bullish', '251114', underlying_price_at_fill=676.1)
+        
+        self.assertTrue(self.tracker.has_order_placed_today())
+        self.assertTrue(self.tracker.has_order_placed_today('XSP'))
+        self.assertFalse(self.tracker.has_order_placed_today('SPXW'))
+        orders = self.tracker.get_today_orders('xsp')
+        self.assertEqual([(o['order_id'], o['symbol'], o['bias']) for o in orders], [('1', 'XSP', 'BULLISH')])
+    
+    def test_records_are_appended_one_per_line(self):
+        """Test each order adds one line and earlier lines are left as they were."""
+        self.write_record('2020-01-02T10:00:00')
+        with open(self.tracking_file) as f:
+            before = f.read()
+        self.tracker.record_order('1', 'XSP', 'bullish', '251114')
+        self.tracker.record_order('2', 'SPXW', 'bearish', '251114')
+        
+        with open(self.tracking_file) as f:
+            after = f.read()
+        self.assertTrue(after.startswith(before))
+        self.assertEqual(len(after.splitlines()), 3)
+        self.assertEqual(len(self.tracker.get_today_orders()), 2)
+    
+    def test_other_days_and_torn_lines_are_ignored(self):
+        """Test yesterday's orders and an unparseable line do not count as today's."""
+        yesterday = datetime.now() - timedelta(days=1)
+        self.write_record(yesterday.isoformat())
+        with open(self.tracking_file, 'a') as f:
+            f.write('{"order_id": "torn", "symb\n')
+        
+        self.assertFalse(self.tracker.has_order_placed_today())
+        self.assertEqual(self.tracker.get_today_orders(), [])
+    
+    def test_failed_write_is_not_cached(self):
+        """Test an order whose record could not be written is not reported as tracked."""
+        with patch('src.orders.order_tracker.orjson.dumps', side_effect=OSError('disk full')), \
+                self.assertLogs('src.orders.order_tracker', level='ERROR'):
+            self.assertFalse(self.tracker.record_order('1', 'XSP', 'bullish', '251114'))
+        
+        self.assertFalse(self.tracker.has_order_placed_today('XSP'))
+        self.assertTrue(self.tracker.record_order('2', 'XSP', 'bullish', '251114'))
+        self.assertEqual([o['order_id'] for o in self.tracker.get_today_orders()], ['2'])
+    
+    def test_only_lines_mentioning_today_are_parsed(self):
+        """Test older records are skipped without decoding, but a stray mention of today is not counted."""
+        yesterday = datetime.now() - timedelta(days=1)
+        self.write_record('2020-01-02T10:00:00')
+        self.write_record(yesterday.isoformat(), order_details={'enteredTime': date.today().isoformat()})
+        
+        with patch('src.orders.order_tracker.orjson.loads', wraps=orjson.loads) as loads:
+            self.assertEqual(self.tracker.get_today_orders(), [])
+        self.assertEqual(loads.call_count, 1)
+    
+    def test_today_is_read_from_file_once(self):
+        """Test repeated checks and new orders are served from memory until the date changes."""
+        self.write_record(datetime.now().isoformat())
+        with patch.object(self.tracker, '_read_records', wraps=self.tracker._read_records) as read:
+            self.assertTrue(self.tracker.has_order_placed_today('XSP'))
+            self.tracker.record_order('2', 'SPXW', 'bearish', '251114')
+            self.assertTrue(self.tracker.has_order_placed_today('SPXW'))
+            self.assertEqual(len(self.tracker.get_today_orders()), 2)
+            self.assertEqual(read.call_count, 1)
+            
+            # A new day starts from the file again
+            self.tracker._today_cache = ('2000-01-01', [], set())
+            self.assertEqual(len(self.tracker.get_today_orders()), 2)
+            self.assertEqual(read.call_count, 2)
+    
+    def test_order_from_another_process_is_seen(self):
+        """Test an order another tracker appends to the same file invalidates the cache."""
+        self.assertFalse(self.tracker.has_order_placed_today('XSP'))
+        
+        OrderTracker(self.tracking_file).record_order('1', 'XSP', 'bullish', '251114')
+        
+        self.assertTrue(self.tracker.has_order_placed_today('XSP'))
+        self.tracker.record_order('2', 'SPXW', 'bearish', '251114')
+        self.assertEqual([o['order_id'] for o in self.tracker.get_today_orders()], ['1', '2'])
+    
+    def test_legacy_json_file_is_migrated(self):
+        """Test orders in a legacy order_tracking.json still count after the switch to JSON Lines."""
+        tracking_file = os.path.join(self.tmpdir.name, 'legacy', 'order_tracking.jsonl')
+        os.makedirs(os.path.dirname(tracking_file))
+        today = date.today().isoformat()
+        with open(os.path.join(self.tmpdir.name, 'legacy', 'order_tracking.json'), 'w') as f:
+            json.dump({
+                '2020-01-02': [{'order_id': 'old', 'symbol': 'SPXW', 'placed_at': '2020-01-02T10:00:00'}],
+                today: [{'order_id': 'today', 'symbol': 'XSP', 'placed_at': f'{today}T10:00:00'}],
+            }, f)
+        
+        tracker = OrderTracker(tracking_file)
+        
+        self.assertTrue(tracker.has_order_placed_today('XSP'))
+        self.assertFalse(tracker.has_order_placed_today('SPXW'))
+        with open(tracking_file) as f:
+            self.assertEqual([json.loads(line)['order_id'] for line in f], ['old', 'today'])
+        # Converted once; a second tracker reads the JSON Lines file as is
+        tracker.record_order('2', 'SPXW', 'bearish', '251114')
+        self.assertEqual(len(OrderTracker(tracking_file).get_today_orders()), 2)
+    
+    def test_clear_old_data_compacts_file(self):
+        """Test records older than the cutoff or without a date are dropped and recent ones kept."""
+        old = (date.today() - timedelta(days=40)).isoformat()
+        recent = (date.today() - timedelta(days=5)).isoformat()
+        self.write_record(f'{old}T10:00:00')
+        self.write_record(f'{recent}T10:00:00')
+        self.write_record('not a date')
+        self.tracker.record_order('today', 'XSP', 'bullish', '251114')
+        
+        self.tracker.clear_old_data(days_to_keep=30)
+        
+        with open(self.tracking_file) as f:
+            order_ids = [json.loads(line)['order_id'] for line in f]
+        self.assertEqual(order_ids, [f'{recent}T10:00:00', 'today'])
+        self.assertFalse(os.path.exists(self.tracking_file + '.tmp'))
+
+
+if __name__ == '__main__':
+    unittest.main()
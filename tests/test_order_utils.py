@@ -161,6 +161,28 @@ class TestOrderUtils(unittest.TestCase):
         expected = (11.06 * 2.0) - (6.36 * 2.0)  # 22.12 - 12.72 = 9.40
         self.assertEqual(result, expected)
         print(f"✅ Test passed: Multiple contracts - net credit = ${result:.2f}")
+    
+    def test_get_actual_fill_credit_from_order_closing_and_unknown_legs(self):
+        """Test closing instructions are signed like opening ones and unknown ones are skipped."""
+        order = {
+            'status': 'FILLED',
+            'orderLegCollection': [
+                {'legId': 1, 'instruction': 'BUY_TO_CLOSE'},
+                {'legId': 2, 'instruction': 'SELL_TO_CLOSE'},
+                {'legId': 3, 'instruction': 'EXCHANGE'}
+            ],
+            'orderActivityCollection': [{
+                'executionLegs': [
+                    {'legId': 1, 'price': 1.25, 'quantity': 1.0},
+                    {'legId': 2, 'price': 3.00, 'quantity': 1.0},
+                    {'legId': 3, 'price': 9.99, 'quantity': 1.0}
+                ]
+            }]
+        }
+        
+        result = get_actual_fill_credit_from_order(order)
+        
+        self.assertAlmostEqual(result, 3.00 - 1.25)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,32 @@
+"""
+Test the adaptive quote monitor poll interval.
+"""
+import sys
+import os
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import Config
+from automate_trading import next_poll_interval
+
+
+class TestNextPollInterval(unittest.TestCase):
+    """Test that the poll interval tracks the distance from MIN_NET_CREDIT."""
+    
+    def test_far_below_threshold_polls_slower(self):
+        """Test C_net more than $1.00 below threshold waits the longest."""
+        interval = next_poll_interval(Config.MIN_NET_CREDIT - 2.0)
+        self.assertEqual(interval, min(30, Config.QUOTE_MONITOR_INTERVAL * 3))
+    
+    def test_moderately_below_threshold_uses_default(self):
+        """Test C_net within $1.00 but more than $0.20 below uses the configured interval."""
+        interval = next_poll_interval(Config.MIN_NET_CREDIT - 0.5)
+        self.assertEqual(interval, Config.QUOTE_MONITOR_INTERVAL)
+    
+    def test_close_to_threshold_polls_faster(self):
+        """Test C_net within $0.20 of threshold polls every 2 seconds."""
+        self.assertEqual(next_poll_interval(Config.MIN_NET_CREDIT - 0.1), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
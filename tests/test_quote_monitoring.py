@@ -2,7 +2,7 @@
 import sys
 import os
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 import time
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -12,7 +12,7 @@ from src.config import Config
 from src.utils.logger import setup_logger
 
 logger = setup_logger("test_quote_monitoring")
-ET = pytz.timezone('US/Eastern')
+ET = ZoneInfo('America/New_York')
 
 def test_get_spread_credit():
     """Test getting spread credit from real API."""
@@ -22,7 +22,7 @@ def test_get_spread_credit():
     print()
     
     today = datetime.now(ET)
-    today_dt = ET.localize(datetime.combine(today.date(), datetime.min.time().replace(hour=9, minute=30)))
+    today_dt = datetime.combine(today.date(), datetime.min.time().replace(hour=9, minute=30), tzinfo=ET)
     
     # Example strikes (you can adjust these)
     # Using current SPX price rounded to nearest 5
@@ -85,7 +85,7 @@ def test_quote_monitoring_loop():
     print()
     
     today = datetime.now(ET)
-    today_dt = ET.localize(datetime.combine(today.date(), datetime.min.time().replace(hour=9, minute=30)))
+    today_dt = datetime.combine(today.date(), datetime.min.time().replace(hour=9, minute=30), tzinfo=ET)
     
     spx_entry = 5430.0  # Example - adjust based on current market
     k_short, k_long = StrikeCalculator.calculate_put_spread_strikes(spx_entry)
@@ -0,0 +1,132 @@
+"""
+Test the Step B candle scan windows.
+"""
+import sys
+import os
+import unittest
+from datetime import datetime, time as dt_time
+from unittest.mock import patch, MagicMock
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from automate_trading import ET, OR_END, ENTRY_END, CANDLE_STEP, get_scan_windows, get_completed_candle
+
+
+class TestScanWindows(unittest.TestCase):
+    """Test that the scan windows tile OR_END..ENTRY_END in 30-minute candles."""
+    
+    def setUp(self):
+        self.windows = get_scan_windows(datetime(2026, 3, 9, 9, 30, tzinfo=ET))
+    
+    def test_default_windows(self):
+        """Test the default session scans 10:00-10:30 through 11:30-12:00."""
+        labels = [(w_start.time(), w_end.time()) for w_start, w_end in self.windows]
+        self.assertEqual(labels, [
+            (dt_time(10, 0), dt_time(10, 30)),
+            (dt_time(10, 30), dt_time(11, 0)),
+            (dt_time(11, 0), dt_time(11, 30)),
+            (dt_time(11, 30), dt_time(12, 0)),
+        ])
+    
+    def test_windows_are_contiguous(self):
+        """Test each window starts where the previous one ended and spans one candle."""
+        self.assertEqual(self.windows[0][0].time(), OR_END)
+        self.assertEqual(self.windows[-1][1].time(), ENTRY_END)
+        for (_, prev_end), (start, end) in zip(self.windows, self.windows[1:]):
+            self.assertEqual(prev_end, start)
+            self.assertEqual(end - start, CANDLE_STEP)
+    
+    def test_windows_are_eastern_time(self):
+        """Test window bounds are ET-aware so candle timestamps match the API."""
+        for w_start, w_end in self.windows:
+            self.assertIs(w_start.tzinfo, ET)
+            self.assertIs(w_end.tzinfo, ET)
+
+
+class TestCompletedCandleCache(unittest.TestCase):
+    """Test a still-forming candle is refetched instead of served from the cache."""
+    
+    def ms(self, hour, minute, second=0):
+        return int(datetime(2026, 3, 9, hour, minute, second, tzinfo=ET).timestamp() * 1000)
+    
+    def test_partial_next_bar_is_refetched(self):
+        """Test the 10:30 bar returned early at the 10:30 check is fetched again at 11:00."""
+        date = datetime(2026, 3, 9, 9, 30, tzinfo=ET)
+        market_data = MagicMock()
+        market_data.get_30min_candles.side_effect = [
+            # At 10:30:05 the 10:30 bar has only just started
+            [{'datetime': self.ms(10, 0), 'close': 5000.0}, {'datetime': self.ms(10, 30), 'close': 4990.0}],
+            [{'datetime': self.ms(10, 0), 'close': 5000.0}, {'datetime': self.ms(10, 30), 'close': 4950.0}],
+        ]
+        candles_by_start = {}
+        
+        with patch('automate_trading.time.time', return_value=self.ms(10, 30, 5) / 1000):
+            first = get_completed_candle(market_data, date, self.ms(10, 0), candles_by_start)
+        with patch('automate_trading.time.time', return_value=self.ms(11, 0, 5) / 1000):
+            second = get_completed_candle(market_data, date, self.ms(10, 30), candles_by_start)
+        
+        self.assertEqual(first['close'], 5000.0)
+        self.assertEqual(second['close'], 4950.0)
+        self.assertEqual(market_data.get_30min_candles.call_count, 2)
+    
+    def test_completed_bars_are_reused(self):
+        """Test a bar that had already closed at the last fetch needs no new request."""
+        date = datetime(2026, 3, 9, 9, 30, tzinfo=ET)
+        market_data = MagicMock()
+        market_data.get_30min_candles.return_value = [
+            {'datetime': self.ms(10, 0), 'close': 5000.0}, {'datetime': self.ms(10, 30), 'close': 4950.0}
+        ]
+        candles_by_start = {}
+        
+        # A late start: both bars had closed by the first fetch
+        with patch('automate_trading.time.time', return_value=self.ms(11, 0, 5) / 1000):
+            get_completed_candle(market_data, date, self.ms(10, 0), candles_by_start)
+            candle = get_completed_candle(market_data, date, self.ms(10, 30), candles_by_start)
+        
+        self.assertEqual(candle['close'], 4950.0)
+        self.assertEqual(market_data.get_30min_candles.call_count, 1)
+    
+    def test_forming_or_missing_bar_is_retried(self):
+        """Test a bar still forming at the first fetch, then missing, is fetched again until it closes."""
+        date = datetime(2026, 3, 9, 9, 30, tzinfo=ET)
+        market_data = MagicMock()
+        market_data.get_30min_candles.side_effect = [
+            # Woke a few ms before 10:30: the 10:00 bar is still forming
+            [{'datetime': self.ms(10, 0), 'close': 5001.0}],
+            [],
+            [{'datetime': self.ms(10, 0), 'close': 5000.0}],
+        ]
+        clock = [self.ms(10, 29, 59) / 1000]
+        
+        def wait(delay):
+            clock[0] += delay
+            return False
+        with patch('automate_trading.time.time', side_effect=lambda: clock[0]), \
+                patch('automate_trading._shutdown.wait', side_effect=wait) as shutdown_wait:
+            candle = get_completed_candle(market_data, date, self.ms(10, 0), {},
+                                          retry_until=self.ms(11, 0) / 1000)
+        
+        self.assertEqual(candle['close'], 5000.0)
+        self.assertEqual([c.args[0] for c in shutdown_wait.call_args_list], [2, 4])
+    
+    def test_retry_stops_at_deadline(self):
+        """Test a bar that never arrives gives up once the next wait would pass retry_until."""
+        date = datetime(2026, 3, 9, 9, 30, tzinfo=ET)
+        market_data = MagicMock()
+        market_data.get_30min_candles.return_value = []
+        clock = [self.ms(10, 59, 50) / 1000]
+        
+        def wait(delay):
+            clock[0] += delay
+            return False
+        with patch('automate_trading.time.time', side_effect=lambda: clock[0]), \
+                patch('automate_trading._shutdown.wait', side_effect=wait):
+            candle = get_completed_candle(market_data, date, self.ms(10, 30), {},
+                                          retry_until=self.ms(11, 0) / 1000)
+        
+        self.assertIsNone(candle)
+        # 10:59:50, +2s, +4s; a further 8s wait would pass 11:00
+        self.assertEqual(market_data.get_30min_candles.call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,255 @@
+"""
+Test SchwabAuth token handling with a temporary token file (no API calls).
+"""
+import sys
+import os
+import json
+import socket
+import ssl
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.auth.schwab_auth import SchwabAuth, TOKEN_ERROR_RE, TOKEN_REFRESH_MARGIN
+from src.config import Config
+
+
+def make_token_response(access_token, expires_in=1800):
+    response = MagicMock()
+    response.ok = True
+    response.content = json.dumps({'access_token': access_token, 'expires_in': expires_in}).encode()
+    return response
+
+
+class TestTokenExpiry(unittest.TestCase):
+    """Test the access token is refreshed ahead of expiry."""
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.token_file = os.path.join(self.tmpdir.name, 'tokens.json')
+        with patch.object(Config, 'validate'):
+            self.auth = SchwabAuth()
+        self.auth.token_file = self.token_file
+        self.session = MagicMock()
+        patcher = patch('src.auth.schwab_auth.get_session', return_value=self.session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def write_tokens(self, expires_at):
+        with open(self.token_file, 'w') as f:
+            json.dump({'access_token': 'OLD', 'refresh_token': 'R', 'expires_at': expires_at}, f)
+    
+    def test_fresh_token_is_not_refreshed(self):
+        """Test a token well inside its lifetime is returned without a refresh call."""
+        self.write_tokens(time.time() + 1800)
+        self.assertEqual(self.auth.get_access_token(), 'OLD')
+        self.session.post.assert_not_called()
+    
+    def test_token_near_expiry_is_refreshed(self):
+        """Test a token inside the refresh margin is refreshed before it is handed out."""
+        self.write_tokens(time.time() + TOKEN_REFRESH_MARGIN - 1)
+        self.session.post.return_value = make_token_response('NEW')
+        
+        self.assertEqual(self.auth.get_access_token(), 'NEW')
+        self.assertEqual(self.session.post.call_count, 1)
+        
+        # The new expiry is persisted, so a later load does not refresh again
+        with open(self.token_file) as f:
+            self.assertGreater(json.load(f)['expires_at'], time.time() + 1000)
+        self.assertEqual(self.auth.get_access_token(), 'NEW')
+        self.assertEqual(self.session.post.call_count, 1)
+    
+    def test_concurrent_401s_refresh_once(self):
+        """Test several requests rejected with the same token trigger a single refresh."""
+        self.write_tokens(time.time() + 1800)
+        stale_headers = dict(self.auth.get_headers())
+        self.session.post.return_value = make_token_response('NEW')
+        
+        threads = [threading.Thread(target=self.auth.refresh_if_current, args=(stale_headers,))
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        
+        self.assertEqual(self.session.post.call_count, 1)
+        self.assertEqual(self.auth.get_headers()['Authorization'], 'Bearer NEW')
+    
+    def test_failed_save_keeps_previous_tokens(self):
+        """Test a write that dies part way leaves the existing token file intact."""
+        self.write_tokens(time.time() + 1800)
+        with patch('src.auth.schwab_auth.orjson.dumps', side_effect=RuntimeError('killed')):
+            with self.assertRaises(RuntimeError):
+                self.auth._save_tokens({'access_token': 'NEW'})
+        
+        with open(self.token_file) as f:
+            self.assertEqual(json.load(f)['access_token'], 'OLD')
+        self.auth._save_tokens({'access_token': 'NEW'})
+        with open(self.token_file) as f:
+            self.assertEqual(json.load(f)['access_token'], 'NEW')
+    
+    def test_unknown_expiry_is_not_refreshed(self):
+        """Test tokens saved without an expiry fall back to the 401 retry path."""
+        with open(self.token_file, 'w') as f:
+            json.dump({'access_token': 'OLD', 'refresh_token': 'R'}, f)
+        self.assertEqual(self.auth.get_access_token(), 'OLD')
+        self.session.post.assert_not_called()
+
+
+class TestHeaders(unittest.TestCase):
+    """Test get_headers() reuses its dict until the token changes."""
+    
+    def setUp(self):
+        with patch.object(Config, 'validate'):
+            self.auth = SchwabAuth()
+        self.auth.access_token = 'OLD'
+    
+    def test_headers_are_reused(self):
+        """Test repeated calls return the same headers without rebuilding them."""
+        headers = self.auth.get_headers()
+        self.assertEqual(headers['Authorization'], 'Bearer OLD')
+        self.assertIs(self.auth.get_headers(), headers)
+    
+    def test_new_token_rebuilds_headers(self):
+        """Test a changed access token is picked up on the next call."""
+        self.auth.get_headers()
+        self.auth.access_token = 'NEW'
+        self.assertEqual(self.auth.get_headers()['Authorization'], 'Bearer NEW')
+
+
+class TestTokenErrorDetection(unittest.TestCase):
+    """Test refresh failures caused by an unusable refresh token are recognised."""
+    
+    def test_error_codes_match_case_insensitively(self):
+        """Test each known error code is found regardless of case."""
+        for text in ('{"error": "invalid_grant"}', 'INVALID_TOKEN', '400 Bad Request',
+                     'refresh_token_authentication_error', 'unsupported_token_type'):
+            self.assertTrue(TOKEN_ERROR_RE.search(text), text)
+    
+    def test_unrelated_error_does_not_match(self):
+        """Test a server-side failure is not mistaken for an expired refresh token."""
+        self.assertIsNone(TOKEN_ERROR_RE.search('{"error": "internal_server_error"}'))
+    
+    def test_expired_refresh_token_logs_banner_once(self):
+        """Test an invalid_grant refresh logs the re-auth banner as one record and clears tokens."""
+        with patch.object(Config, 'validate'):
+            auth = SchwabAuth()
+        auth.access_token = 'OLD'
+        auth.refresh_token = 'R'
+        response = MagicMock()
+        response.ok = False
+        response.status_code = 400
+        response.json.return_value = {'error': 'invalid_grant'}
+        session = MagicMock()
+        session.post.return_value = response
+        
+        with patch('src.auth.schwab_auth.get_session', return_value=session), \
+                self.assertLogs('src.auth.schwab_auth', level='ERROR') as logs:
+            with self.assertRaises(Exception):
+                auth.refresh_access_token()
+        
+        banners = [line for line in logs.output if 'RE-AUTHENTICATION REQUIRED' in line]
+        self.assertEqual(len(banners), 1)
+        self.assertIn("Error Details: {'error': 'invalid_grant'}", banners[0])
+        self.assertIsNone(auth.refresh_token)
+
+
+class TestCallbackServer(unittest.TestCase):
+    """Test the OAuth callback listener over plain HTTP on a free local port."""
+    
+    def setUp(self):
+        with socket.socket() as probe:
+            probe.bind(('localhost', 0))
+            self.port = probe.getsockname()[1]
+        with patch.object(Config, 'validate'), \
+                patch.object(Config, 'REDIRECT_URI', f'http://127.0.0.1:{self.port}/callback'):
+            self.auth = SchwabAuth()
+        self.result = {}
+        
+        def serve():
+            try:
+                self.result['code'] = self.auth._start_callback_server()
+            except Exception as e:
+                self.result['error'] = e
+        self.thread = threading.Thread(target=serve, daemon=True)
+        self.thread.start()
+    
+    def get(self, path):
+        """Send one GET to the listener and return the raw response."""
+        for _ in range(50):
+            try:
+                conn = socket.create_connection(('localhost', self.port), timeout=5)
+                break
+            except ConnectionRefusedError:
+                time.sleep(0.05)
+        with conn:
+            conn.sendall(f'GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n'.encode())
+            chunks = []
+            while True:
+                data = conn.recv(4096)
+                if not data:
+                    return b''.join(chunks)
+                chunks.append(data)
+    
+    def test_code_is_returned(self):
+        """Test the code query parameter is returned after non-callback requests are skipped."""
+        self.assertIn(b'400 Bad Request', self.get('/favicon.ico'))
+        response = self.get('/callback?code=ABC%40123&session=x')
+        self.thread.join(5)
+        
+        self.assertIn(b'200 OK', response)
+        self.assertEqual(self.result, {'code': 'ABC@123'})
+    
+    def test_error_is_raised(self):
+        """Test an error callback is reported to the browser and raised."""
+        response = self.get('/callback?error=access_denied')
+        self.thread.join(5)
+        
+        self.assertIn(b'access_denied', response)
+        self.assertIn('access_denied', str(self.result['error']))
+    
+    def test_failed_handshake_closes_socket(self):
+        """Test a connection whose TLS handshake fails is closed and the wait continues."""
+        self.get('/callback?code=FIRST')
+        self.thread.join(5)
+        
+        with patch.object(Config, 'validate'), \
+                patch.object(Config, 'REDIRECT_URI', f'https://127.0.0.1:{self.port}/callback'):
+            auth = SchwabAuth()
+        wrapped = []
+        
+        def wrap_socket(sock, server_side):
+            wrapped.append(sock)
+            if len(wrapped) == 1:
+                raise ssl.SSLError('certificate rejected by browser')
+            return sock
+        context = MagicMock()
+        context.wrap_socket.side_effect = wrap_socket
+        self.result = {}
+        
+        def serve():
+            self.result['code'] = auth._start_callback_server()
+        with patch.object(auth, '_get_or_create_certificate', return_value=('cert', 'key')), \
+                patch('ssl.SSLContext', return_value=context):
+            thread = threading.Thread(target=serve, daemon=True)
+            thread.start()
+            try:
+                # Closed unanswered; with the request unread the close may arrive as a reset
+                self.assertEqual(self.get('/callback?code=IGNORED'), b'')
+            except ConnectionResetError:
+                pass
+            self.get('/callback?code=SECOND')
+            thread.join(5)
+        
+        self.assertEqual(wrapped[0].fileno(), -1)
+        self.assertEqual(self.result, {'code': 'SECOND'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Test SchwabClient request handling with a fake auth and session (no API calls).
+"""
+import sys
+import os
+import unittest
+from unittest.mock import patch, MagicMock
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+from src.client.schwab_client import SchwabClient
+
+
+class FakeAuth:
+    """Stands in for SchwabAuth and counts token refreshes."""
+    
+    def __init__(self):
+        self.token = 'OLD'
+        self.refreshes = 0
+    
+    def get_headers(self):
+        return {'Authorization': f'Bearer {self.token}', 'Accept': 'application/json'}
+    
+    def refresh_if_current(self, headers):
+        if headers == self.get_headers():
+            self.refreshes += 1
+            self.token = 'NEW'
+
+
+def make_client():
+    """Build a SchwabClient without loading credentials."""
+    client = SchwabClient.__new__(SchwabClient)
+    client.auth = FakeAuth()
+    client.base_url = 'https://api.schwabapi.com/trader/v1'
+    return client
+
+
+def make_response(status_code, content=b'{}'):
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.text = content.decode()
+    return response
+
+
+class TestMakeRequest(unittest.TestCase):
+    """Test the 401 refresh-and-retry path."""
+    
+    def test_401_refreshes_once_and_retries(self):
+        """Test an expired token is refreshed and the request is resent with the new one."""
+        client = make_client()
+        session = MagicMock()
+        session.request.side_effect = [make_response(401), make_response(200, b'{"ok": true}')]
+        
+        with patch('src.client.schwab_client.get_session', return_value=session):
+            result = client._make_request('GET', '/accounts/accountNumbers')
+        
+        self.assertEqual(result, {'ok': True})
+        self.assertEqual(client.auth.refreshes, 1)
+        retry_headers = session.request.call_args_list[1].kwargs['headers']
+        self.assertEqual(retry_headers['Authorization'], 'Bearer NEW')
+    
+    def test_stale_401_does_not_refresh_again(self):
+        """Test a 401 for a token another thread already replaced skips the refresh."""
+        client = make_client()
+        session = MagicMock()
+        
+        def request(**kwargs):
+            if kwargs['headers']['Authorization'] == 'Bearer OLD':
+                # Simulate a concurrent request refreshing the token meanwhile
+                client.auth.token = 'NEW'
+                return make_response(401)
+            return make_response(200)
+        session.request.side_effect = request
+        
+        with patch('src.client.schwab_client.get_session', return_value=session):
+            client._make_request('GET', '/accounts/accountNumbers')
+        
+        self.assertEqual(client.auth.refreshes, 0)
+        self.assertEqual(session.request.call_count, 2)
+    
+    def test_created_resource_location_is_returned(self):
+        """Test an empty 201 answer returns the Location header, e.g. a placed order's URL."""
+        client = make_client()
+        session = MagicMock()
+        created = make_response(201, b'')
+        created.headers = {'Location': f'{client.base_url}/accounts/HASH/orders/123'}
+        session.request.return_value = created
+        
+        with patch('src.client.schwab_client.get_session', return_value=session):
+            result = client._make_request('POST', '/accounts/HASH/orders', json_data={})
+        
+        self.assertEqual(result, {'location': f'{client.base_url}/accounts/HASH/orders/123'})
+
+
+class TestGetAccounts(unittest.TestCase):
+    """Test get_accounts() is a plain fetch; AccountManager owns the cache."""
+    
+    def test_each_call_fetches(self):
+        """Test every call requests the account list."""
+        client = make_client()
+        client._make_request = MagicMock(return_value=[{'accountNumber': '1', 'hashValue': 'H'}])
+        client.get_accounts()
+        client.get_accounts()
+        self.assertEqual(client._make_request.call_count, 2)
+
+
+class TestPrewarm(unittest.TestCase):
+    """Test SchwabClient.prewarm()."""
+    
+    def test_constructor_makes_no_request(self):
+        """Test creating a client opens no connection by itself."""
+        session = MagicMock()
+        with patch('src.client.schwab_client.SchwabAuth'), \
+                patch('src.client.schwab_client.get_session', return_value=session):
+            SchwabClient()
+        session.head.assert_not_called()
+    
+    def test_prewarm_is_unauthenticated_head(self):
+        """Test the prewarm sends a HEAD without asking auth for a token."""
+        session = MagicMock()
+        with patch('src.client.schwab_client.SchwabAuth') as auth_cls, \
+                patch('src.client.schwab_client.get_session', return_value=session):
+            client = SchwabClient()
+            client.prewarm()
+        
+        session.head.assert_called_with(client.base_url, timeout=5)
+        auth_cls.return_value.get_headers.assert_not_called()
+    
+    def test_prewarm_failure_is_swallowed(self):
+        """Test a failed prewarm does not raise."""
+        client = make_client()
+        session = MagicMock()
+        session.head.side_effect = requests.ConnectionError('offline')
+        with patch('src.client.schwab_client.get_session', return_value=session):
+            client.prewarm()
+
+
+if __name__ == '__main__':
+    unittest.main()
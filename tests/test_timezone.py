@@ -0,0 +1,39 @@
+"""
+Test Eastern Time handling around DST transitions.
+"""
+import sys
+import os
+import unittest
+from datetime import datetime, date, time as dt_time, timezone
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from automate_trading import ET, MARKET_OPEN, OR_END
+
+
+class TestEasternTime(unittest.TestCase):
+    """Test that session times resolve to the correct UTC instant across DST."""
+    
+    def test_market_open_before_dst_start(self):
+        """Test market open on the Friday before DST starts (EST, UTC-5)."""
+        open_dt = datetime.combine(date(2026, 3, 6), MARKET_OPEN, tzinfo=ET)
+        self.assertEqual(open_dt.astimezone(timezone.utc).time(), dt_time(14, 30))
+    
+    def test_market_open_after_dst_start(self):
+        """Test market open on the Monday after the 2nd Sunday of March (EDT, UTC-4)."""
+        open_dt = datetime.combine(date(2026, 3, 9), MARKET_OPEN, tzinfo=ET)
+        self.assertEqual(open_dt.astimezone(timezone.utc).time(), dt_time(13, 30))
+    
+    def test_dst_start_sunday(self):
+        """Test 10:00 on the DST transition Sunday itself is already EDT."""
+        or_end = datetime.combine(date(2026, 3, 8), OR_END, tzinfo=ET)
+        self.assertEqual(or_end.utcoffset().total_seconds(), -4 * 3600)
+    
+    def test_replace_keeps_correct_offset(self):
+        """Test that replacing the hour on an ET datetime re-resolves the offset."""
+        winter = datetime.combine(date(2026, 3, 6), MARKET_OPEN, tzinfo=ET)
+        summer = winter.replace(day=9, hour=10, minute=0)
+        self.assertEqual(summer.utcoffset().total_seconds(), -4 * 3600)
+
+
+if __name__ == '__main__':
+    unittest.main()